@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """Build the claudetini-sidecar binary using PyInstaller."""
 
+import functools
+import hashlib
+import os
 import platform
 import shutil
 import subprocess
@@ -8,6 +11,7 @@ import sys
 from pathlib import Path
 
 
+@functools.cache
 def get_target_triple() -> str:
     """Detect the current platform's Tauri target triple."""
     machine = platform.machine().lower()
@@ -25,6 +29,46 @@ def get_target_triple() -> str:
         raise RuntimeError(f"Unsupported platform: {system} {machine}")
 
 
+def _install_binary(source: Path, dest: Path) -> None:
+    """Place the built binary at dest, hardlinking when possible.
+
+    A hardlink moves no data. Across filesystems (or where links are not
+    supported) fall back to a plain content copy and set the executable bit
+    explicitly instead of copying the rest of the metadata.
+    """
+    dest.unlink(missing_ok=True)
+    try:
+        os.link(source, dest)
+    except OSError:
+        shutil.copyfile(source, dest)
+        os.chmod(dest, 0o755)
+
+
+def _dependency_stamp(sidecar_dir: Path) -> str:
+    """Hash the dependency manifests so a version bump forces a rebuild."""
+    digest = hashlib.blake2b(digest_size=16)
+    for name in ("requirements.txt", "pyproject.toml", "claudetini-sidecar.spec"):
+        manifest = sidecar_dir / name
+        if manifest.exists():
+            digest.update(name.encode())
+            digest.update(manifest.read_bytes())
+    return digest.hexdigest()
+
+
+def _is_up_to_date(dist_binary: Path, stamp_file: Path, stamp: str, source_dirs: list[Path]) -> bool:
+    """Return True if dist_binary is newer than every bundled source file."""
+    if not dist_binary.exists() or not stamp_file.exists():
+        return False
+    if stamp_file.read_text(encoding="utf-8").strip() != stamp:
+        return False
+    built_at = dist_binary.stat().st_mtime
+    for source_dir in source_dirs:
+        for source in source_dir.rglob("*.py"):
+            if source.stat().st_mtime > built_at:
+                return False
+    return True
+
+
 def main() -> None:
     sidecar_dir = Path(__file__).parent
     tauri_binaries = sidecar_dir.parent / "src-tauri" / "binaries"
@@ -35,9 +79,27 @@ def main() -> None:
     if platform.system() == "Windows":
         binary_name += ".exe"
 
+    dist_binary = sidecar_dir / "dist" / "claudetini-sidecar"
+    if platform.system() == "Windows":
+        dist_binary = dist_binary.with_suffix(".exe")
+    dest = tauri_binaries / binary_name
+
+    # The bundle includes the sidecar package and the shared src/ modules.
+    source_dirs = [sidecar_dir / "sidecar", sidecar_dir.parent.parent / "src"]
+    stamp_file = dist_binary.with_name(f"{dist_binary.name}.stamp")
+    stamp = _dependency_stamp(sidecar_dir)
+    if "--force" not in sys.argv and _is_up_to_date(dist_binary, stamp_file, stamp, source_dirs):
+        print(f"Sidecar for {triple} is up to date (use --force to rebuild)")
+        _install_binary(dist_binary, dest)
+        return
+
     print(f"Building sidecar for {triple}...")
 
-    # Run PyInstaller
+    # Run PyInstaller. Bundle layout (single file, strip/UPX, excludes) is
+    # owned by the .spec; PyInstaller rejects those options on the command
+    # line when a spec is given, so only build-time flags are passed here.
+    # Tauri's externalBin expects one executable, which is why the spec
+    # builds --onefile rather than a onedir COLLECT tree.
     result = subprocess.run(
         [
             sys.executable,
@@ -45,6 +107,7 @@ def main() -> None:
             "PyInstaller",
             "--clean",
             "--noconfirm",
+            "--log-level=WARN",
             str(sidecar_dir / "claudetini-sidecar.spec"),
         ],
         cwd=str(sidecar_dir),
@@ -53,13 +116,10 @@ def main() -> None:
         print("PyInstaller build failed!")
         sys.exit(1)
 
-    # Copy binary to Tauri binaries directory
-    dist_binary = sidecar_dir / "dist" / "claudetini-sidecar"
-    if platform.system() == "Windows":
-        dist_binary = dist_binary.with_suffix(".exe")
+    stamp_file.write_text(stamp, encoding="utf-8")
 
-    dest = tauri_binaries / binary_name
-    shutil.copy2(str(dist_binary), str(dest))
+    # Copy binary to Tauri binaries directory
+    _install_binary(dist_binary, dest)
     print(f"Sidecar binary copied to {dest}")
 
 
@@ -0,0 +1,104 @@
+"""A pre-started Claude CLI kept ready for the next short prompt.
+
+Start-up of the CLI (runtime boot, config and login loading) dominates the
+latency of small one-shot prompts such as commit message generation. After
+such a prompt, one spare CLI for the same project and model is started and
+left waiting on stdin, so the next request only has to send its prompt.
+
+A spare answers one prompt and is never reused, so no conversation state
+carries over between requests. Only one spare exists at a time; it is
+killed when replaced, when it sits idle past _MAX_IDLE_SECONDS, or at exit.
+"""
+
+import atexit
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+try:
+    from src.agents.dispatcher import spawn_claude_cli
+except ImportError:
+    spawn_claude_cli = None
+
+# Seconds an unused spare CLI is kept before it is killed
+_MAX_IDLE_SECONDS = 300
+
+_lock = threading.Lock()
+# (working_dir, model, started_at, process) of the current spare, if any
+_spare: tuple[Path, str | None, float, subprocess.Popen] | None = None
+
+
+def kill(proc: subprocess.Popen) -> None:
+    """Kill ``proc`` if it is still running and reap it."""
+    if proc.poll() is None:
+        proc.kill()
+    proc.wait()
+
+
+def take(working_dir: Path, model: str | None) -> subprocess.Popen | None:
+    """Claim the spare CLI if it was started for this project and model.
+
+    Returns None when there is no usable spare; a spare for a different
+    project or model is left for its own next request.
+    """
+    global _spare
+    with _lock:
+        spare = _spare
+        if spare is None or spare[0] != working_dir or spare[1] != model:
+            return None
+        _spare = None
+    _working_dir, _model, started_at, proc = spare
+    if proc.poll() is not None or time.monotonic() - started_at > _MAX_IDLE_SECONDS:
+        kill(proc)
+        return None
+    return proc
+
+
+def start_or_take(working_dir: Path, model: str | None) -> subprocess.Popen | None:
+    """The matching spare CLI, or a newly started one (None if the CLI is missing)."""
+    proc = take(working_dir, model)
+    if proc is None and spawn_claude_cli is not None:
+        try:
+            proc = spawn_claude_cli(working_dir, model=model)
+        except OSError:
+            return None
+    return proc
+
+
+def prewarm(working_dir: Path, model: str | None) -> None:
+    """Start a spare CLI for the next prompt, replacing any existing spare."""
+    global _spare
+    if spawn_claude_cli is None:
+        return
+    try:
+        proc = spawn_claude_cli(working_dir, model=model)
+    except OSError:
+        return
+    with _lock:
+        previous, _spare = _spare, (working_dir, model, time.monotonic(), proc)
+    if previous is not None:
+        kill(previous[3])
+    timer = threading.Timer(_MAX_IDLE_SECONDS, _expire, args=(proc,))
+    timer.daemon = True
+    timer.start()
+
+
+def _expire(proc: subprocess.Popen) -> None:
+    """Kill ``proc`` if it is still the unclaimed spare."""
+    global _spare
+    with _lock:
+        if _spare is None or _spare[3] is not proc:
+            return
+        _spare = None
+    kill(proc)
+
+
+@atexit.register
+def discard() -> None:
+    """Kill the spare CLI, if any."""
+    global _spare
+    with _lock:
+        spare, _spare = _spare, None
+    if spare is not None:
+        kill(spare[3])
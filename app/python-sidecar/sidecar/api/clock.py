@@ -0,0 +1,26 @@
+"""Cheap wall-clock timestamps for hot paths.
+
+Dispatch job records and stream frames stamp every event, so the second
+part of the ISO string is formatted once per second and reused.
+"""
+
+import time
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last timestamp;
+# replaced as one tuple so concurrent job threads never see a torn pair.
+_iso_second_cache: tuple[int, str] = (-1, "")
+
+
+def utcnow_iso() -> str:
+    """Current UTC time as a naive ISO-8601 string with microseconds.
+
+    Same shape as ``datetime.utcnow().isoformat()`` (always including the
+    fraction) without allocating a datetime per call.
+    """
+    global _iso_second_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _iso_second_cache
+    if cached_seconds != seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _iso_second_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}"
@@ -0,0 +1,33 @@
+"""JSON encoding helpers for hot response paths.
+
+Uses orjson when it is installed (it encodes straight to bytes, which is
+what SSE frames and raw responses need) and falls back to a compact stdlib
+encoder otherwise, so the sidecar still runs from a bare dev environment.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_stdlib_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=str).encode
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize a value to compact UTF-8 JSON bytes.
+
+    Unknown types (paths, datetimes, UUIDs) are converted with ``str``.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=str)
+    return _stdlib_encode(value).encode()
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON text or bytes. Raises ``json.JSONDecodeError`` on bad input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
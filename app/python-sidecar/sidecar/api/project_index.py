@@ -0,0 +1,53 @@
+"""Cached lookup of registered projects by path or name.
+
+Routes accept a ``project_id`` that may be a registered project's path or
+name. Loading the registry parses ``projects.json``, so the path/name index
+is kept for a few seconds and only reused while the registry file's mtime
+is unchanged. Callers look up through ``find_project_path``, which reloads
+once on a miss so a project registered moments ago is still found.
+"""
+
+from pathlib import Path
+
+from . import ttl_cache
+
+try:
+    from src.core.project import ProjectRegistry
+except ImportError:
+    ProjectRegistry = None
+
+_CACHE_KEY = "project_index"
+_TTL_SECONDS = 5
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def load_project_index(refresh: bool = False) -> dict[str, Path]:
+    """Map registered project paths and names to their paths."""
+    if ProjectRegistry is None:
+        return {}
+    registry = ProjectRegistry()
+    mtime = _mtime_ns(registry.config_path)
+    cached = None if refresh else ttl_cache.get(_CACHE_KEY)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    registry.load()
+    index: dict[str, Path] = {}
+    for project in registry.list_projects():
+        index.setdefault(str(project.path), project.path)
+        index.setdefault(project.name, project.path)
+    ttl_cache.put(_CACHE_KEY, (mtime, index), ttl=_TTL_SECONDS)
+    return index
+
+
+def find_project_path(project_id: str) -> Path | None:
+    """Path of the registered project whose path or name is project_id."""
+    project_path = load_project_index().get(project_id)
+    if project_path is None:
+        project_path = load_project_index(refresh=True).get(project_id)
+    return project_path
@@ -1,25 +1,69 @@
 """Bootstrap API endpoints with real-time progress via SSE."""
 
 import asyncio
+import functools
+import time
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import AsyncGenerator
+from typing import TYPE_CHECKING, AsyncGenerator
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
-from src.agents.bootstrap_engine import (
-    BootstrapEngine,
-    BootstrapResult,
-    BootstrapStepType,
-    StepResult,
-)
+from .. import fast_json
+from ..ttl_cache import get as cache_get, put as cache_put
+
+# The engine (and the dispatcher stack behind it) is imported inside the
+# handlers that need it, keeping it off the sidecar's startup path.
+if TYPE_CHECKING:
+    from src.agents.bootstrap_engine import BootstrapResult, BootstrapStepType
 
 router = APIRouter(prefix="/bootstrap", tags=["bootstrap"])
 
-# In-memory storage for bootstrap sessions
+# Dedicated pool for bootstrap runs. A run holds its thread for minutes while
+# the Claude CLI works, so it must not tie up the loop's default executor.
+_bootstrap_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bootstrap")
+
+# In-memory storage for bootstrap sessions. Finished sessions are evicted
+# after _SESSION_TTL_SECONDS, or oldest-first once the store exceeds
+# _MAX_SESSIONS, so clients that never call DELETE do not leak results.
+# Only mutated from the event loop thread (see _publish_progress).
 _active_sessions: dict[str, dict] = {}
+_MAX_SESSIONS = 64
+_SESSION_TTL_SECONDS = 3600
+
+# Undelivered SSE frames buffered per session; oldest are dropped beyond this.
+_MAX_BUFFERED_MESSAGES = 1024
+
+# Idle streams get an SSE comment this often so proxies and the webview do
+# not drop the connection during long Claude calls.
+_SSE_KEEPALIVE_SECONDS = 15.0
+_SSE_KEEPALIVE_FRAME = b": keepalive\n\n"
+
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # Disable nginx buffering
+}
+
+
+def _build_sse_frame(payload: bytes) -> bytes:
+    """Wrap an encoded JSON payload as an SSE ``data:`` frame."""
+    return b"data: " + payload + b"\n\n"
+
+
+def _build_complete_frame(session: dict) -> bytes:
+    """Build the final SSE frame for a session in a terminal state."""
+    final_data = {
+        "type": "complete",
+        "status": session["status"],
+        "result": session.get("result"),
+        "error": session.get("error"),
+    }
+    return _build_sse_frame(fast_json.dumps(final_data))
 
 
 class BootstrapStartRequest(BaseModel):
@@ -72,16 +116,35 @@ class BootstrapResultResponse(BaseModel):
     step_results: list[StepResultResponse] = []
 
 
+def _resolve_project_path(raw_path: str) -> Path:
+    """Resolve a requested project path and ensure it exists.
+
+    The wizard calls /estimate and then /start with the same path, so a
+    successful lookup is cached briefly to skip the repeated resolve/stat.
+    Missing paths are not cached so a retry sees a newly created directory.
+    """
+    cache_key = f"bootstrap:path:{raw_path}"
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    project_path = Path(raw_path).resolve()
+    if not project_path.exists():
+        raise HTTPException(status_code=404, detail=f"Project path does not exist: {project_path}")
+
+    cache_put(cache_key, project_path, ttl=5)
+    return project_path
+
+
 @router.post("/estimate")
 async def estimate_cost(request: BootstrapEstimateRequest) -> dict:
     """Estimate the cost of bootstrapping a project.
 
     Returns estimated tokens and USD cost.
     """
-    project_path = Path(request.project_path).resolve()
+    project_path = _resolve_project_path(request.project_path)
 
-    if not project_path.exists():
-        raise HTTPException(status_code=404, detail=f"Project path does not exist: {project_path}")
+    from src.agents.bootstrap_engine import BootstrapEngine
 
     try:
         engine = BootstrapEngine(project_path)
@@ -98,10 +161,9 @@ async def start_bootstrap(request: BootstrapStartRequest) -> dict:
 
     Use /bootstrap/stream/{session_id} to monitor progress.
     """
-    project_path = Path(request.project_path).resolve()
+    project_path = _resolve_project_path(request.project_path)
 
-    if not project_path.exists():
-        raise HTTPException(status_code=404, detail=f"Project path does not exist: {project_path}")
+    _trim_sessions()
 
     # Generate session ID
     session_id = str(uuid.uuid4())
@@ -113,9 +175,14 @@ async def start_bootstrap(request: BootstrapStartRequest) -> dict:
         "current_step": "Initializing",
         "step_index": 0,
         "total_steps": 5,
-        "messages": [],
+        "messages": deque(maxlen=_MAX_BUFFERED_MESSAGES),
         "result": None,
+        "result_json": None,
         "error": None,
+        "finished_at": None,
+        # Set whenever a message is appended or the session reaches a terminal
+        # state, so stream consumers wake immediately instead of polling.
+        "notify": asyncio.Event(),
     }
 
     # Start bootstrap in background
@@ -136,55 +203,64 @@ async def start_bootstrap(request: BootstrapStartRequest) -> dict:
 
 
 @router.get("/stream/{session_id}")
-async def stream_progress(session_id: str):
+async def stream_progress(session_id: str, request: Request):
     """Stream bootstrap progress via Server-Sent Events (SSE).
 
     Clients should connect to this endpoint to receive real-time updates.
+    The stream ends early if the client disconnects.
     """
-    if session_id not in _active_sessions:
+    session = _active_sessions.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
 
-    async def event_generator() -> AsyncGenerator[str, None]:
-        """Generate SSE events for bootstrap progress."""
-        last_message_count = 0
+    # Reconnects after the run has finished are common. Answer them with the
+    # buffered frames and the final frame in one body instead of spinning up
+    # a streaming generator.
+    if session["status"] in ("completed", "failed"):
+        messages: deque[bytes] = session["messages"]
+        body = b"".join(messages) + _build_complete_frame(session)
+        messages.clear()
+        return Response(content=body, media_type="text/event-stream", headers=_SSE_HEADERS)
 
+    async def event_generator() -> AsyncGenerator[bytes, None]:
+        """Generate SSE events for bootstrap progress."""
         while True:
             session = _active_sessions.get(session_id)
             if not session:
                 break
 
-            # Send any new messages
-            messages = session["messages"]
-            if len(messages) > last_message_count:
-                for msg in messages[last_message_count:]:
-                    yield f"data: {msg}\n\n"
-                last_message_count = len(messages)
+            # Clear before reading so a notification raised while we flush
+            # is not lost; the next wait() returns immediately in that case.
+            notify: asyncio.Event = session["notify"]
+            notify.clear()
+
+            # Drain pending messages (already framed as SSE bytes)
+            messages: deque[bytes] = session["messages"]
+            while messages:
+                yield messages.popleft()
 
             # Check if complete
             if session["status"] in ("completed", "failed"):
-                # Send final status
-                final_data = {
-                    "type": "complete",
-                    "status": session["status"],
-                    "result": session.get("result"),
-                    "error": session.get("error"),
-                }
-                import json
-
-                yield f"data: {json.dumps(final_data)}\n\n"
+                yield _build_complete_frame(session)
                 break
 
-            # Wait a bit before checking again
-            await asyncio.sleep(0.5)
+            # Sleep until the bootstrap task publishes something new
+            try:
+                await asyncio.wait_for(notify.wait(), timeout=_SSE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    return
+                yield _SSE_KEEPALIVE_FRAME
+                continue
+
+            # Don't keep flushing to a client that has already gone away
+            if await request.is_disconnected():
+                return
 
     return StreamingResponse(
         event_generator(),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Disable nginx buffering
-        },
+        headers=_SSE_HEADERS,
     )
 
 
@@ -208,8 +284,12 @@ async def get_status(session_id: str) -> BootstrapStatusResponse:
 
 
 @router.get("/result/{session_id}", response_model=BootstrapResultResponse)
-async def get_result(session_id: str) -> BootstrapResultResponse:
-    """Get the final result of a completed bootstrap session."""
+async def get_result(session_id: str) -> Response:
+    """Get the final result of a completed bootstrap session.
+
+    The payload is serialized once when the run finishes, so every poll
+    returns the cached bytes without rebuilding or re-validating models.
+    """
     if session_id not in _active_sessions:
         raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
 
@@ -218,11 +298,32 @@ async def get_result(session_id: str) -> BootstrapResultResponse:
     if session["status"] not in ("completed", "failed"):
         raise HTTPException(status_code=400, detail="Bootstrap not yet complete")
 
-    result: BootstrapResult = session.get("result")
-    if not result:
+    result_json: bytes | None = session.get("result_json")
+    if not result_json:
         raise HTTPException(status_code=500, detail="Result not available")
 
-    return BootstrapResultResponse(
+    return Response(content=result_json, media_type="application/json")
+
+
+@router.delete("/session/{session_id}")
+async def cleanup_session(session_id: str) -> dict:
+    """Clean up a bootstrap session from memory."""
+    session = _active_sessions.pop(session_id, None)
+    if session is not None:
+        # Wake any attached stream so it notices the session is gone
+        session["notify"].set()
+        return {"status": "deleted"}
+
+    raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
+
+
+def _build_result_response(result: "BootstrapResult") -> BootstrapResultResponse:
+    """Convert an engine result into its API response model.
+
+    Fields come straight from the engine's typed dataclasses, so the models
+    are built with model_construct() rather than re-validated.
+    """
+    return BootstrapResultResponse.model_construct(
         success=result.success,
         artifacts={k: str(v) for k, v in result.artifacts.items()},
         errors=result.errors,
@@ -231,7 +332,7 @@ async def get_result(session_id: str) -> BootstrapResultResponse:
         steps_completed=result.steps_completed,
         steps_total=result.steps_total,
         step_results=[
-            StepResultResponse(
+            StepResultResponse.model_construct(
                 step_type=sr.step_type,
                 name=sr.name,
                 status=sr.status,
@@ -243,14 +344,30 @@ async def get_result(session_id: str) -> BootstrapResultResponse:
     )
 
 
-@router.delete("/session/{session_id}")
-async def cleanup_session(session_id: str) -> dict:
-    """Clean up a bootstrap session from memory."""
-    if session_id in _active_sessions:
-        del _active_sessions[session_id]
-        return {"status": "deleted"}
+def _trim_sessions() -> None:
+    """Evict expired finished sessions, then the oldest ones over the cap."""
+    now = time.monotonic()
+    finished = sorted(
+        (
+            (session_id, session["finished_at"])
+            for session_id, session in _active_sessions.items()
+            if session["finished_at"] is not None
+        ),
+        key=lambda item: item[1],
+    )
+    for session_id, finished_at in finished:
+        expired = now - finished_at > _SESSION_TTL_SECONDS
+        if not expired and len(_active_sessions) < _MAX_SESSIONS:
+            break
+        session = _active_sessions.pop(session_id)
+        session["notify"].set()
 
-    raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
+
+def _publish_progress(session: dict, updates: dict, frame: bytes) -> None:
+    """Apply a progress update on the event loop thread and wake streams."""
+    session.update(updates)
+    session["messages"].append(frame)
+    session["notify"].set()
 
 
 async def _run_bootstrap_async(
@@ -261,25 +378,25 @@ async def _run_bootstrap_async(
     dry_run: bool,
 ) -> None:
     """Run bootstrap in background and update session state."""
-    import json
+    from src.agents.bootstrap_engine import BootstrapEngine
 
     session = _active_sessions[session_id]
     session["status"] = "running"
+    notify: asyncio.Event = session["notify"]
+
+    # progress_callback runs on a worker thread. Rather than mutating the
+    # session from there, hand each update to the loop's thread-safe callback
+    # queue so the session is only ever touched from the event loop thread.
+    loop = asyncio.get_running_loop()
 
     def progress_callback(
-        step_type: BootstrapStepType,
+        step_type: "BootstrapStepType",
         progress: float,
         message: str,
         step_index: int,
         total_steps: int,
     ) -> None:
-        """Update session state with progress."""
-        session["progress"] = progress
-        session["current_step"] = message
-        session["step_index"] = step_index
-        session["total_steps"] = total_steps
-
-        # Add progress message to stream
+        """Forward a progress update to the event loop."""
         progress_data = {
             "type": "progress",
             "progress": progress,
@@ -287,7 +404,17 @@ async def _run_bootstrap_async(
             "step": f"{step_index}/{total_steps}",
             "step_type": step_type.value,
         }
-        session["messages"].append(json.dumps(progress_data))
+        loop.call_soon_threadsafe(
+            _publish_progress,
+            session,
+            {
+                "progress": progress,
+                "current_step": message,
+                "step_index": step_index,
+                "total_steps": total_steps,
+            },
+            _build_sse_frame(fast_json.dumps(progress_data)),
+        )
 
     try:
         # Create engine with progress callback
@@ -297,16 +424,21 @@ async def _run_bootstrap_async(
         )
 
         # Run bootstrap (this is synchronous but we're in an async task)
-        result = await asyncio.to_thread(
-            engine.bootstrap,
-            skip_git=skip_git,
-            skip_architecture=skip_architecture,
-            dry_run=dry_run,
+        result = await loop.run_in_executor(
+            _bootstrap_pool,
+            functools.partial(
+                engine.bootstrap,
+                skip_git=skip_git,
+                skip_architecture=skip_architecture,
+                dry_run=dry_run,
+            ),
         )
 
-        # Update session with result
+        # Update session with result. Keep only the compact API payload (and
+        # its serialized form for /result) so the engine result can be freed.
         session["status"] = "completed" if result.success else "failed"
-        session["result"] = result
+        session["result"] = _build_result_response(result).model_dump()
+        session["result_json"] = fast_json.dumps(session["result"])
         session["progress"] = 100.0
 
         if not result.success:
@@ -321,4 +453,8 @@ async def _run_bootstrap_async(
             "type": "error",
             "error": str(exc),
         }
-        session["messages"].append(json.dumps(error_data))
+        session["messages"].append(_build_sse_frame(fast_json.dumps(error_data)))
+
+    finally:
+        session["finished_at"] = time.monotonic()
+        notify.set()
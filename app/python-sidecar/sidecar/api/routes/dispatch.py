@@ -2,37 +2,138 @@
 Dispatch API routes - Launch Claude Code sessions
 """
 
+import asyncio
+import atexit
+import functools
 import json
 import logging
+import os
+import queue
 import re
 import threading
+import time
 import uuid
-from datetime import datetime
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Literal
+from types import MappingProxyType
+from typing import AsyncGenerator, Awaitable, BinaryIO, Callable, Iterator, Literal, Mapping
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 from starlette.concurrency import run_in_threadpool
 
+from .. import fast_json
+from ..clock import utcnow_iso as _utcnow_iso
+from ..project_index import find_project_path
+
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-_ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;?]*[ -/]*[@-~]")
-_ANSI_OSC_RE = re.compile(r"\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)")
+# OSC sequences (ESC ] ... BEL/ST) or CSI sequences (ESC [ ...), matched in
+# one pass over the text.
+_ANSI_RE = re.compile(r"\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)|\x1b\[[0-9;?]*[ -/]*[@-~]")
+
+# Directories live log tails may be read from, resolved once at import
+# (e.g. /tmp -> /private/tmp on macOS) rather than on every poll.
+_ALLOWED_LOG_PREFIXES = tuple(
+    prefix.resolve()
+    for prefix in (Path.home() / ".claude", Path.home() / ".claudetini", Path("/tmp"))
+)
+
+# Error markers looked for in the last lines of a dispatch log when the job
+# result is unavailable; one case-insensitive pass instead of lower() + 4 scans.
+_SUMMARY_ERROR_RE = re.compile(r"error:|fatal:|traceback \(most recent|abort:", re.IGNORECASE)
+
+# Signed counts in a "+N -M" line-stat string from GitUtils
+_DIFFSTAT_RE = re.compile(r"([+-])(\d+)")
+
+# Live log tails only need the last few lines; never read more than this
+# from the end of a dispatch log per poll.
+_LOG_TAIL_READ_BYTES = 64 * 1024
+
+# Read size used when counting lines in a log for tail-only output reads
+_OUTPUT_READ_CHUNK_BYTES = 256 * 1024
+
+# Window of a finished stream job's captured output used for its tail.
+_RESULT_TAIL_CHARS = 4096
+
+# Output kept on a finished job's stored result when its log file holds the
+# full text; read_dispatch_output serves the rest from the file.
+_STORED_OUTPUT_CHARS = 32 * 1024
+
+# Last tail computed per log file, keyed by (path, max_lines, max_chars) and
+# stored as (mtime_ns, size, tail). Single dict operations are atomic, and a
+# clear() racing a lookup only costs one extra read.
+_log_tail_cache: dict[tuple[str, int, int], tuple[int, int, str | None]] = {}
+_MAX_LOG_TAIL_CACHE = 256
+
+# Single-key-then-message JSONL line with no escape sequences in any value
+_SIMPLE_JSONL_MESSAGE_RE = re.compile(r'^\{"[^"\\]+":"[^"\\]*","message":"([^"\\]*)"\}$')
 
 # Regex to strip bold markdown numbering (e.g. "**1.2** Task text" -> "Task text")
 _BOLD_NUMBERING_RE = re.compile(r"^\*\*[\d.]+\*\*\s*")
 
+# "Failed gate(s): lint, typecheck" line in a fallback prompt
+_FAILED_GATES_RE = re.compile(r"failed gate\(s\)\s*:\s*([^\n\r]+)", re.IGNORECASE)
+
+# Post-fallback gate statuses that count as verified
+_GATE_OK_STATUSES = frozenset({"pass", "skipped"})
+
+# Separators dropped from gate names before alias lookup, in one translate pass
+_GATE_NAME_SEPARATORS = str.maketrans("", "", "-_ ")
+
+# Normalized gate names (lowercase, no separators) -> canonical gate IDs
+_GATE_NAME_ALIASES = {
+    "lint": "lint",
+    "typecheck": "typecheck",
+    "typing": "typecheck",
+    "mypy": "typecheck",
+    "documentation": "documentation",
+    "docs": "documentation",
+    "doc": "documentation",
+}
+
+# Fallback failure codes and the lowercase phrases that identify them, in
+# priority order. Phrases already covered by a shorter one in the same rule
+# ("cancelled by user", "unauthorized", "invalid api key") are left out so a
+# miss costs fewer scans of the output. The phrases are ASCII bytes so the
+# output can be lowered and searched as bytes (see _classify_fallback_failure).
+_FALLBACK_FAILURE_RULES: tuple[tuple[str, tuple[bytes, ...]], ...] = (
+    ("cli_not_found", (b"not found at",)),
+    ("cancelled", (b"cancelled",)),
+    ("timeout", (b"timed out after",)),
+    ("stalled", (b"stalled with no output",)),
+    ("network_disconnect", (
+        b"error sending request for url",
+        b"stream disconnected",
+        b"network request failed",
+    )),
+    ("needs_user_input", (
+        b"stdin is not a terminal",
+        b"confirm whether you want me to proceed",
+        b"do you want me to proceed",
+        b"please confirm",
+        b"waiting for input",
+    )),
+    ("auth_required", (b"login", b"auth", b"api key")),
+    ("verification_failed", (b"verification failed",)),
+)
+
+# A markdown code-fence line (``` or ```lang) including its newline
+_FENCE_LINE_RE = re.compile(r"^```[^\n]*\n?", re.MULTILINE)
+
 # Import core modules
 try:
+    from src.agents.async_dispatcher import async_dispatch_stream
     from src.agents.codex_dispatcher import dispatch_task as dispatch_codex_task
-    from src.agents.dispatcher import DispatchLogger, dispatch_task as dispatch_claude_task
+    from src.agents.dispatcher import DispatchLogger, DispatchResult, dispatch_task as dispatch_claude_task
     from src.agents.dispatcher import get_dispatch_output_path
     from src.agents.gates import QualityGateRunner
     from src.agents.gemini_dispatcher import dispatch_task as dispatch_gemini_task
     from src.core.cost_tracker import CostTracker, TokenUsage
-    from src.core.project import ProjectRegistry
     from src.core.provider_telemetry import usage_snapshot
     from src.core.provider_usage import ProviderUsageStore
     from src.core.runtime import project_id_for_path, project_runtime_dir
@@ -44,10 +145,29 @@ except ImportError as e:
     CORE_AVAILABLE = False
 
 
+# Project IDs hash the resolved path and runtime dirs are created (and legacy
+# data migrated) on first use, so both are remembered per project path. The
+# dispatchers mkdir the output directory again before writing to it, so a
+# directory removed after caching is still recreated.
+@functools.lru_cache(maxsize=256)
+def _project_id(project_path: Path) -> str:
+    return project_id_for_path(project_path)
+
+
+@functools.lru_cache(maxsize=256)
+def _dispatch_output_dir(project_path: Path) -> Path:
+    output_dir = project_runtime_dir(_project_id(project_path)) / "dispatch-output"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir
+
+
 def _strip_ansi(value: str) -> str:
     """Strip ANSI control sequences from terminal output."""
-    cleaned = _ANSI_OSC_RE.sub("", value)
-    return _ANSI_ESCAPE_RE.sub("", cleaned)
+    # Most output has no escape sequences at all; a C-level substring scan
+    # is far cheaper than running both regexes over the whole buffer.
+    if "\x1b" not in value:
+        return value
+    return _ANSI_RE.sub("", value)
 
 
 def _parse_jsonl_line(line: str) -> str:
@@ -59,8 +179,13 @@ def _parse_jsonl_line(line: str) -> str:
     stripped = line.strip()
     if not stripped.startswith("{"):
         return line
+    # Common {"level":"...","message":"..."} shape with no escapes: take the
+    # message straight from the match instead of building a dict.
+    fast = _SIMPLE_JSONL_MESSAGE_RE.match(stripped)
+    if fast:
+        return fast.group(1)
     try:
-        obj = json.loads(stripped)
+        obj = fast_json.loads(stripped)
         if isinstance(obj, dict) and "message" in obj:
             return obj["message"]
         return line
@@ -68,43 +193,140 @@ def _parse_jsonl_line(line: str) -> str:
         return line
 
 
+def _resolve_allowed_log_path(log_file: str) -> Path | None:
+    """Resolve a log path, or return None if it is outside the allowed directories."""
+    path = Path(log_file).resolve()
+    if not any(path.is_relative_to(prefix) for prefix in _ALLOWED_LOG_PREFIXES):
+        logger.warning("Blocked read of log file outside allowed directories: %s", path)
+        return None
+    return path
+
+
+class _IncrementalTail:
+    """Live tail of a growing log file, fed only the bytes appended since the last refresh.
+
+    Processed (ANSI-stripped, JSONL-decoded) lines are kept in a bounded
+    deque, so each refresh costs O(new output) rather than re-reading and
+    re-parsing the whole read window. Output matches _read_log_file_tail,
+    except that lines already seen are never dropped by its byte window.
+    """
+
+    def __init__(self, path: Path, max_lines: int = 24, max_chars: int = 2400) -> None:
+        self.path = path
+        self.max_lines = max_lines
+        self.max_chars = max_chars
+        self.lines: deque[str] = deque(maxlen=max_lines)
+        self.offset = 0
+        self.partial = b""
+        self.skip_to_newline = False
+
+    def _restart_at(self, offset: int) -> None:
+        self.lines.clear()
+        self.offset = offset
+        self.partial = b""
+        # Starting mid-file probably lands mid-line; drop that partial line.
+        self.skip_to_newline = offset > 0
+
+    def _push(self, raw: bytes, into: deque[str] | list[str]) -> None:
+        for line in _strip_ansi(raw.decode("utf-8", errors="replace")).splitlines():
+            if line.strip():
+                into.append(_parse_jsonl_line(line))
+
+    def refresh(self) -> str | None:
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            return None
+        if size < self.offset:
+            self._restart_at(0)  # Truncated or replaced
+        if size - self.offset > _LOG_TAIL_READ_BYTES:
+            self._restart_at(size - _LOG_TAIL_READ_BYTES)
+        if size > self.offset:
+            with self.path.open("rb") as handle:
+                handle.seek(self.offset)
+                chunk = handle.read(size - self.offset)
+            self.offset += len(chunk)
+            if self.skip_to_newline:
+                newline = chunk.find(b"\n")
+                if newline != -1:
+                    chunk = chunk[newline + 1:]
+                self.skip_to_newline = False
+            *complete, self.partial = (self.partial + chunk).split(b"\n")
+            for raw in complete:
+                self._push(raw, self.lines)
+
+        lines = list(self.lines)
+        if self.partial:
+            self._push(self.partial, lines)
+        if not lines:
+            return None
+        text = "\n".join(lines[-self.max_lines:])
+        if len(text) > self.max_chars:
+            text = text[-self.max_chars:]
+        return text
+
+
 def _read_log_file_tail(log_file: str | None, max_lines: int = 24, max_chars: int = 2400) -> str | None:
     """Read the tail of a log file for live output display.
 
     Only reads files within known safe directories (runtime dispatch-output
-    and /tmp) to prevent path traversal.
+    and /tmp) to prevent path traversal. Reads at most the last
+    _LOG_TAIL_READ_BYTES of the file, and reuses the previous result while
+    the file's mtime and size are unchanged.
     """
     if not log_file:
         return None
     try:
-        path = Path(log_file).resolve()
-
-        # Validate the resolved path is within allowed directories
-        allowed_prefixes = (
-            Path.home() / ".claude",
-            Path.home() / ".claudetini",
-            Path("/tmp"),
-        )
-        if not any(str(path).startswith(str(prefix.resolve())) for prefix in allowed_prefixes):
-            logger.warning("Blocked read of log file outside allowed directories: %s", path)
+        path = _resolve_allowed_log_path(log_file)
+        if path is None:
             return None
 
-        if not path.exists():
-            return None
-        content = path.read_text(encoding="utf-8", errors="replace")
-        if not content.strip():
-            return None
-        sanitized = _strip_ansi(content)
-        lines = [
-            _parse_jsonl_line(line)
-            for line in sanitized.splitlines()
-            if line.strip()
-        ]
-        if not lines:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             return None
-        text = "\n".join(lines[-max_lines:])
-        if len(text) > max_chars:
-            text = text[-max_chars:]
+
+        cache_key = (str(path), max_lines, max_chars)
+        cached = _log_tail_cache.get(cache_key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        with path.open("rb") as handle:
+            if stat.st_size > _LOG_TAIL_READ_BYTES:
+                handle.seek(stat.st_size - _LOG_TAIL_READ_BYTES)
+                raw = handle.read()
+                # The seek probably landed mid-line; drop the partial line.
+                newline = raw.find(b"\n")
+                if newline != -1:
+                    raw = raw[newline + 1:]
+            else:
+                raw = handle.read()
+        content = raw.decode("utf-8", errors="replace")
+
+        # Walk lines from the end and stop once max_lines (or max_chars) of
+        # output is collected, so ANSI stripping and JSONL parsing only run
+        # on the lines that are actually returned.
+        kept: list[str] = []
+        kept_chars = 0
+        for raw_line in reversed(content.splitlines()):
+            line = _strip_ansi(raw_line)
+            if not line.strip():
+                continue
+            line = _parse_jsonl_line(line)
+            kept.append(line)
+            kept_chars += len(line) + 1
+            if len(kept) >= max_lines or kept_chars > max_chars:
+                break
+
+        text = None
+        if kept:
+            text = "\n".join(reversed(kept))
+            if len(text) > max_chars:
+                text = text[-max_chars:]
+
+        if len(_log_tail_cache) >= _MAX_LOG_TAIL_CACHE:
+            _log_tail_cache.clear()
+        _log_tail_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, text)
         return text
     except Exception:
         return None
@@ -212,13 +434,127 @@ class DispatchUsageSummaryResponse(BaseModel):
     latest_event_at: str | None = None
 
 
-_dispatch_jobs: dict[str, dict] = {}
-_dispatch_jobs_lock = threading.Lock()
+# Power of two so a job's shard is hash(job_id) & (N - 1)
+_JOB_STORE_SHARDS = 8
+
+
+class _ShardedJobStore:
+    """Job records split across independently locked shards.
+
+    Worker threads write status while the event loop polls it, so each
+    shard has its own lock and an update only blocks readers of jobs in the
+    same shard. Each shard also tracks its finished job IDs in completion
+    order, so eviction pops the oldest finished jobs in O(1) without
+    scanning past running ones; each holds up to its share of ``max_jobs``.
+    get() returns a copy for callers that need a consistent snapshot of
+    several fields; view() returns a read-only proxy of the live record for
+    callers that only check a field or two.
+
+    Jobs are also indexed by their log file's stem (the session ID the
+    output endpoint is called with), kept in step on add, update and
+    eviction.
+    """
+
+    def __init__(self, max_jobs: int, shards: int = _JOB_STORE_SHARDS) -> None:
+        self._mask = shards - 1
+        self._shards: tuple[OrderedDict[str, dict], ...] = tuple(OrderedDict() for _ in range(shards))
+        self._finished: tuple[OrderedDict[str, None], ...] = tuple(OrderedDict() for _ in range(shards))
+        self._locks = tuple(threading.Lock() for _ in range(shards))
+        self._max_per_shard = max(1, max_jobs // shards)
+        self._log_index: dict[str, str] = {}  # log file stem -> job_id
+        self._log_index_lock = threading.Lock()
+
+    def _shard(self, job_id: str) -> int:
+        return hash(job_id) & self._mask
+
+    def _reindex_log_file(self, job_id: str, old: str | None, new: str | None) -> None:
+        with self._log_index_lock:
+            if old and self._log_index.get(Path(old).stem) == job_id:
+                del self._log_index[Path(old).stem]
+            if new:
+                self._log_index[Path(new).stem] = job_id
+
+    def add(self, job: dict) -> dict:
+        index = self._shard(job["job_id"])
+        shard = self._shards[index]
+        with self._locks[index]:
+            shard[job["job_id"]] = job
+            if job.get("done"):
+                self._finished[index][job["job_id"]] = None
+            self._reindex_log_file(job["job_id"], None, job.get("log_file"))
+            for evicted in _evict_finished_jobs_locked(shard, self._finished[index], self._max_per_shard):
+                self._reindex_log_file(evicted["job_id"], evicted.get("log_file"), None)
+            return dict(job)
+
+    def find_log_file(self, session_id: str) -> str | None:
+        """Log file of the job whose log file stem is session_id, if any."""
+        with self._log_index_lock:
+            job_id = self._log_index.get(session_id)
+        job = self.view(job_id) if job_id else None
+        return job.get("log_file") if job else None
+
+    def get(self, job_id: str) -> dict | None:
+        index = self._shard(job_id)
+        with self._locks[index]:
+            job = self._shards[index].get(job_id)
+            return dict(job) if job else None
+
+    def view(self, job_id: str) -> Mapping | None:
+        index = self._shard(job_id)
+        with self._locks[index]:
+            job = self._shards[index].get(job_id)
+            return MappingProxyType(job) if job else None
+
+    def update(self, job_id: str, **updates) -> dict | None:
+        index = self._shard(job_id)
+        with self._locks[index]:
+            job = self._shards[index].get(job_id)
+            if not job:
+                return None
+            if "log_file" in updates and updates["log_file"] != job.get("log_file"):
+                self._reindex_log_file(job_id, job.get("log_file"), updates["log_file"])
+            job.update(updates)
+            if updates.get("done"):
+                self._finished[index][job_id] = None
+            return dict(job)
+
+    def views(self) -> list[Mapping]:
+        """Read-only views of every job, taking one shard lock at a time."""
+        jobs: list[Mapping] = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                jobs.extend(MappingProxyType(job) for job in shard.values())
+        return jobs
+
+
 _MAX_DISPATCH_JOBS = 200
+_dispatch_jobs = _ShardedJobStore(_MAX_DISPATCH_JOBS)
 
-_fallback_jobs: dict[str, dict] = {}
-_fallback_jobs_lock = threading.Lock()
 _MAX_FALLBACK_JOBS = 200
+_fallback_jobs = _ShardedJobStore(_MAX_FALLBACK_JOBS)
+
+# In-flight job tasks started by _start_background_job, by job ID
+_background_tasks: dict[str, asyncio.Task] = {}
+
+# One poller refreshes live log tails for every in-flight job so status
+# polls read a cached ``live_tail`` instead of each touching the log file.
+_TAIL_REFRESH_INTERVAL_SECONDS = 1.0
+_tail_refresh_task: asyncio.Task | None = None
+# Incremental tail per running job; only touched from _refresh_live_tails,
+# which the single poller runs one call at a time.
+_live_tails: dict[str, _IncrementalTail] = {}
+
+# Per-connection events for status SSE streams, keyed by job ID. The poller
+# sets them when a job's tail changes or the job finishes.
+_status_waiters: dict[str, set[asyncio.Event]] = {}
+
+_SSE_KEEPALIVE_SECONDS = 15.0
+_SSE_KEEPALIVE_FRAME = b": keepalive\n\n"
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # Disable nginx buffering
+}
 
 
 def _get_project_path(project_id: str) -> Path | None:
@@ -227,13 +563,144 @@ def _get_project_path(project_id: str) -> Path | None:
     if path.exists():
         return path
     if CORE_AVAILABLE:
-        registry = ProjectRegistry.load_or_create()
-        for project in registry.list_projects():
-            if str(project.path) == project_id or project.name == project_id:
-                return project.path
+        return find_project_path(project_id)
     return None
 
 
+def _start_background_job(func: Callable[..., Awaitable[None] | None], job_id: str, **kwargs) -> None:
+    """Run a job body as a task on the event loop.
+
+    Coroutine bodies run directly on the loop. Blocking bodies go to
+    Starlette's shared thread pool (instead of a dedicated thread per job),
+    which keeps concurrent dispatches under the anyio thread limiter the
+    server raises at startup. The task is held by job ID until completion so
+    it cannot be garbage-collected mid-run and can be cancelled.
+    """
+    if asyncio.iscoroutinefunction(func):
+        body = func(job_id=job_id, **kwargs)
+    else:
+        body = run_in_threadpool(func, job_id=job_id, **kwargs)
+    task = asyncio.get_running_loop().create_task(body)
+    _background_tasks[job_id] = task
+    task.add_done_callback(lambda _task: _background_tasks.pop(job_id, None))
+    _ensure_tail_refresher()
+
+
+def _ensure_tail_refresher() -> None:
+    """Start the live-tail poller if it is not already running."""
+    global _tail_refresh_task
+    if _tail_refresh_task is None or _tail_refresh_task.done():
+        _tail_refresh_task = asyncio.get_running_loop().create_task(_tail_refresh_loop())
+
+
+async def _tail_refresh_loop() -> None:
+    """Tail each in-flight job's log once per interval until none are left.
+
+    Status streams for a job are woken when its tail changes and once more
+    after it finishes.
+    """
+    previous: set[str] = set()
+    while True:
+        running = [
+            (store, job["job_id"], job.get("log_file"))
+            for store in (_dispatch_jobs, _fallback_jobs)
+            for job in store.views()
+            if not job.get("done")
+        ]
+        current = {job_id for _store, job_id, _log_file in running}
+        _notify_status_waiters(previous - current)
+        previous = current
+        if not running:
+            return
+        try:
+            changed = await run_in_threadpool(_refresh_live_tails, running)
+        except Exception as exc:
+            logger.warning("Live tail refresh failed: %s", exc)
+        else:
+            _notify_status_waiters(changed)
+        await asyncio.sleep(_TAIL_REFRESH_INTERVAL_SECONDS)
+
+
+def _refresh_live_tails(running: list[tuple[_ShardedJobStore, str, str | None]]) -> list[str]:
+    """Advance each job's incremental tail; return the IDs whose tail changed."""
+    running_ids = {job_id for _store, job_id, _log_file in running}
+    for job_id in [job_id for job_id in _live_tails if job_id not in running_ids]:
+        del _live_tails[job_id]
+
+    changed: list[str] = []
+    for store, job_id, log_file in running:
+        if not log_file:
+            continue
+        try:
+            tracker = _live_tails.get(job_id)
+            if tracker is None:
+                path = _resolve_allowed_log_path(log_file)
+                if path is None:
+                    continue
+                tracker = _live_tails[job_id] = _IncrementalTail(path)
+            tail = tracker.refresh()
+        except OSError as exc:
+            logger.debug("Live tail read failed for %s: %s", job_id, exc)
+            continue
+        job = store.get(job_id)
+        if job is not None and job.get("live_tail") != tail:
+            store.update(job_id, live_tail=tail, tail_version=job.get("tail_version", 0) + 1)
+            changed.append(job_id)
+    return changed
+
+
+def _notify_status_waiters(job_ids) -> None:
+    for job_id in job_ids:
+        for event in _status_waiters.get(job_id, ()):
+            event.set()
+
+
+def _stream_job_status(
+    job_id: str,
+    request: Request,
+    get_status: Callable[[str], Awaitable[DispatchStatusResponse]],
+) -> StreamingResponse:
+    """Push a job's status payload over SSE each time it changes.
+
+    Frames carry the same JSON as the polling endpoint and are only sent
+    when the payload differs from the last one; the stream closes after the
+    job's final status.
+    """
+
+    async def event_generator() -> AsyncGenerator[bytes, None]:
+        notify = asyncio.Event()
+        _status_waiters.setdefault(job_id, set()).add(notify)
+        _ensure_tail_refresher()
+        last_payload = b""
+        try:
+            while True:
+                notify.clear()
+                try:
+                    status = await get_status(job_id)
+                except HTTPException:
+                    return  # Evicted while the client was connected
+                payload = fast_json.dumps(status.model_dump())
+                if payload != last_payload:
+                    last_payload = payload
+                    yield b"data: " + payload + b"\n\n"
+                if status.done:
+                    return
+                try:
+                    await asyncio.wait_for(notify.wait(), timeout=_SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield _SSE_KEEPALIVE_FRAME
+        finally:
+            waiters = _status_waiters.get(job_id)
+            if waiters is not None:
+                waiters.discard(notify)
+                if not waiters:
+                    del _status_waiters[job_id]
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream", headers=_SSE_HEADERS)
+
+
 def _resolve_fallback_request(
     request: FallbackDispatchRequest,
 ) -> tuple[Literal["codex", "gemini"], Path, str]:
@@ -263,17 +730,12 @@ async def dispatch_start(request: DispatchRequest) -> DispatchStartResponse:
         raise HTTPException(status_code=404, detail="Project not found")
 
     job = _create_dispatch_job(prompt=request.prompt, project_path=project_path)
-    worker = threading.Thread(
-        target=_run_dispatch_job,
-        kwargs={
-            "job_id": job["job_id"],
-            "prompt": request.prompt,
-            "project_path": project_path,
-        },
-        daemon=True,
-        name=f"dispatch-{job['job_id']}",
+    _start_background_job(
+        _run_dispatch_job,
+        job_id=job["job_id"],
+        prompt=request.prompt,
+        project_path=project_path,
     )
-    worker.start()
 
     return DispatchStartResponse(
         job_id=job["job_id"],
@@ -293,7 +755,7 @@ class CancelResponse(BaseModel):
 @router.post("/cancel/{job_id}")
 async def dispatch_cancel(job_id: str) -> CancelResponse:
     """Cancel a running dispatch job."""
-    job = _get_dispatch_job(job_id)
+    job = _dispatch_jobs.view(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Dispatch job not found")
 
@@ -301,17 +763,20 @@ async def dispatch_cancel(job_id: str) -> CancelResponse:
         return CancelResponse(success=False, message="Job already completed")
 
     # Mark job as cancelled
-    _update_dispatch_job(
+    _dispatch_jobs.update(
         job_id,
         status="failed",
         phase="cancelled",
         message="Dispatch cancelled by user.",
-        finished_at=datetime.utcnow().isoformat(),
+        finished_at=_utcnow_iso(),
         done=True,
         cancelled=True,
         result=DispatchResponse(success=False, error="Cancelled by user").model_dump(),
         error_detail="Job was cancelled by user request.",
     )
+    task = _background_tasks.get(job_id)
+    if task is not None:
+        task.cancel()
 
     return CancelResponse(success=True, message="Job cancelled")
 
@@ -326,7 +791,7 @@ async def dispatch_status(job_id: str) -> DispatchStatusResponse:
     Also handles stream job IDs (prefix "stream-") by looking up the
     streaming job store — this supports the SSE-to-polling fallback path.
     """
-    job = _get_dispatch_job(job_id)
+    job = _dispatch_jobs.get(job_id)
 
     # Bridge: if not found in dispatch jobs and ID is a stream job, look up stream jobs
     if not job and job_id.startswith("stream-"):
@@ -335,23 +800,36 @@ async def dispatch_status(job_id: str) -> DispatchStatusResponse:
     if not job:
         raise HTTPException(status_code=404, detail="Dispatch job not found")
 
+    return _build_status_response(job)
+
+
+def _build_status_response(
+    job: dict,
+    running_message: Callable[[dict, str | None], str] | None = None,
+) -> DispatchStatusResponse:
+    """Build the polling/SSE status payload for a dispatch or fallback job.
+
+    While the job runs, output comes from the poller's latest read of the
+    log file and ``running_message`` may override the stored message; after
+    completion the stored output_tail and message are used.
+    """
     result_payload = job.get("result")
-    result = DispatchResponse(**result_payload) if isinstance(result_payload, dict) else None
+    result = DispatchResponse.model_construct(**result_payload) if isinstance(result_payload, dict) else None
 
-    # Read live output from log file during execution
-    # After completion, use the stored output_tail from the job
     output_tail = job.get("output_tail")
-    if not job.get("done") and job.get("log_file"):
-        # Job is still running - read current output from log file
-        live_tail = _read_log_file_tail(job.get("log_file"))
+    message = job["message"]
+    if not job.get("done"):
+        live_tail = job.get("live_tail")
         if live_tail:
             output_tail = live_tail
+        if running_message is not None:
+            message = running_message(job, live_tail)
 
-    return DispatchStatusResponse(
+    return DispatchStatusResponse.model_construct(
         job_id=job["job_id"],
         status=job["status"],
         phase=job["phase"],
-        message=job["message"],
+        message=message,
         created_at=job["created_at"],
         started_at=job.get("started_at"),
         finished_at=job.get("finished_at"),
@@ -363,6 +841,43 @@ async def dispatch_status(job_id: str) -> DispatchStatusResponse:
     )
 
 
+@router.get("/status/{job_id}/tail")
+async def dispatch_status_tail(job_id: str, request: Request) -> Response:
+    """Plain-text output tail for a dispatch job, revalidated with an ETag."""
+    job = _dispatch_jobs.view(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Dispatch job not found")
+    return _build_tail_response(job, request)
+
+
+def _build_tail_response(job: Mapping, request: Request) -> Response:
+    """Return the job's current tail, or 304 if the client already has it.
+
+    The ETag changes whenever the poller stores a new live tail and once
+    more when the job finishes, so no file access is needed to revalidate.
+    ``job`` may be a live view: the version and done flag are read before
+    the tail, so a concurrent update can only make the tail newer than its
+    ETag (and be re-sent once), never older.
+    """
+    done = bool(job.get("done"))
+    etag = f'"{job["job_id"]}-{job.get("tail_version", 0)}-{int(done)}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    tail = job.get("output_tail")
+    if not done and job.get("live_tail"):
+        tail = job["live_tail"]
+    return PlainTextResponse(tail or "", headers=headers)
+
+
+@router.get("/status/{job_id}/events")
+async def dispatch_status_events(job_id: str, request: Request) -> StreamingResponse:
+    """SSE stream of a dispatch job's status, pushed when its output changes."""
+    if _dispatch_jobs.view(job_id) is None:
+        raise HTTPException(status_code=404, detail="Dispatch job not found")
+    return _stream_job_status(job_id, request, dispatch_status)
+
+
 async def _bridge_stream_job_status(job_id: str) -> DispatchStatusResponse:
     """Bridge a stream job into a DispatchStatusResponse for the polling fallback path.
 
@@ -370,10 +885,9 @@ async def _bridge_stream_job_status(job_id: str) -> DispatchStatusResponse:
     falls back to polling with the stream job ID. This function translates the
     stream job state into the expected polling response format.
     """
-    from .dispatch_stream import _stream_jobs, _stream_jobs_lock
+    from .dispatch_stream import _stream_jobs
 
-    async with _stream_jobs_lock:
-        stream_job = _stream_jobs.get(job_id)
+    stream_job = _stream_jobs.get(job_id)
 
     if not stream_job:
         raise HTTPException(status_code=404, detail="Dispatch job not found")
@@ -438,19 +952,26 @@ async def _bridge_stream_job_status(job_id: str) -> DispatchStatusResponse:
 
         # If done, also try to get final output_tail from the result
         if not output_tail and job_result.output:
-            sanitized = _strip_ansi(job_result.output)
+            # Only the last few lines are shown, so don't strip a multi-MB
+            # capture; drop the partial line the slice may have cut into.
+            raw_tail = job_result.output
+            if len(raw_tail) > _RESULT_TAIL_CHARS:
+                raw_tail = raw_tail[-_RESULT_TAIL_CHARS:]
+                raw_tail = raw_tail[raw_tail.find("\n") + 1:]
+            sanitized = _strip_ansi(raw_tail)
             lines = [line.rstrip() for line in sanitized.splitlines() if line.strip()]
             if lines:
                 output_tail = "\n".join(lines[-24:])
 
+    now = _utcnow_iso()
     return DispatchStatusResponse(
         job_id=job_id,
         status=status,
         phase=phase,
         message=message,
-        created_at=datetime.utcnow().isoformat(),
+        created_at=now,
         started_at=None,
-        finished_at=datetime.utcnow().isoformat() if done else None,
+        finished_at=now if done else None,
         done=done,
         result=result,
         error_detail=error_detail,
@@ -504,19 +1025,14 @@ async def fallback_dispatch_start(request: FallbackDispatchRequest) -> DispatchS
         provider=provider,
         cli_path=cli_path,
     )
-    worker = threading.Thread(
-        target=_run_fallback_job,
-        kwargs={
-            "job_id": job["job_id"],
-            "prompt": request.prompt,
-            "provider": provider,
-            "project_path": project_path,
-            "cli_path": cli_path,
-        },
-        daemon=True,
-        name=f"fallback-{job['job_id']}",
+    _start_background_job(
+        _run_fallback_job,
+        job_id=job["job_id"],
+        prompt=request.prompt,
+        provider=provider,
+        project_path=project_path,
+        cli_path=cli_path,
     )
-    worker.start()
     return DispatchStartResponse(
         job_id=job["job_id"],
         status=job["status"],
@@ -528,50 +1044,52 @@ async def fallback_dispatch_start(request: FallbackDispatchRequest) -> DispatchS
 @router.get("/fallback/status/{job_id}")
 async def fallback_dispatch_status(job_id: str) -> DispatchStatusResponse:
     """Get current status/result for a fallback dispatch job."""
-    job = _get_fallback_job(job_id)
+    job = _fallback_jobs.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Fallback dispatch job not found")
 
-    result_payload = job.get("result")
-    result = DispatchResponse(**result_payload) if isinstance(result_payload, dict) else None
+    return _build_status_response(job, _fallback_running_message)
 
-    output_tail = job.get("output_tail")
-    message = job["message"]
-    if not job.get("done") and job.get("log_file"):
-        live_tail = _read_log_file_tail(job.get("log_file"))
-        if live_tail:
-            output_tail = live_tail
-            message = f"{job['provider'].capitalize()} is running..."
-        else:
-            started_at = job.get("started_at")
-            if isinstance(started_at, str):
-                try:
-                    elapsed = (datetime.utcnow() - datetime.fromisoformat(started_at)).total_seconds()
-                    if elapsed > 30:
-                        message = "Running... waiting for CLI output."
-                except ValueError:
-                    pass
 
-    return DispatchStatusResponse(
-        job_id=job["job_id"],
-        status=job["status"],
-        phase=job["phase"],
-        message=message,
-        created_at=job["created_at"],
-        started_at=job.get("started_at"),
-        finished_at=job.get("finished_at"),
-        done=bool(job.get("done")),
-        result=result,
-        error_detail=job.get("error_detail"),
-        output_tail=output_tail,
-        log_file=job.get("log_file"),
-    )
+def _fallback_running_message(job: dict, live_tail: str | None) -> str:
+    """Status message for a running fallback job, based on CLI output so far."""
+    if not job.get("log_file"):
+        return job["message"]
+    if live_tail:
+        return f"{job['provider'].capitalize()} is running..."
+    started_at = job.get("started_at")
+    if isinstance(started_at, str):
+        try:
+            started = datetime.fromisoformat(started_at).replace(tzinfo=timezone.utc)
+            elapsed = time.time() - started.timestamp()
+            if elapsed > 30:
+                return "Running... waiting for CLI output."
+        except ValueError:
+            pass
+    return job["message"]
+
+
+@router.get("/fallback/status/{job_id}/tail")
+async def fallback_dispatch_status_tail(job_id: str, request: Request) -> Response:
+    """Plain-text output tail for a fallback job, revalidated with an ETag."""
+    job = _fallback_jobs.view(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Fallback dispatch job not found")
+    return _build_tail_response(job, request)
+
+
+@router.get("/fallback/status/{job_id}/events")
+async def fallback_dispatch_status_events(job_id: str, request: Request) -> StreamingResponse:
+    """SSE stream of a fallback job's status, pushed when its output changes."""
+    if _fallback_jobs.view(job_id) is None:
+        raise HTTPException(status_code=404, detail="Fallback dispatch job not found")
+    return _stream_job_status(job_id, request, fallback_dispatch_status)
 
 
 @router.post("/fallback/cancel/{job_id}")
 async def fallback_dispatch_cancel(job_id: str) -> CancelResponse:
     """Cancel a running fallback dispatch job."""
-    job = _get_fallback_job(job_id)
+    job = _fallback_jobs.view(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Fallback dispatch job not found")
     if job.get("done"):
@@ -581,7 +1099,7 @@ async def fallback_dispatch_cancel(job_id: str) -> CancelResponse:
     if isinstance(cancel_event, threading.Event):
         cancel_event.set()
 
-    _update_fallback_job(
+    _fallback_jobs.update(
         job_id,
         phase="cancelling",
         message="Cancellation requested...",
@@ -670,7 +1188,7 @@ async def dispatch_advice(request: DispatchAdviceRequest) -> DispatchAdviceRespo
     if not project_path.is_dir():
         raise HTTPException(status_code=400, detail="project_path must be a directory")
 
-    project_id = project_id_for_path(project_path)
+    project_id = _project_id(project_path)
     budget_manager = TokenBudgetManager(project_id=project_id)
 
     estimated_tokens = snapshot.total_tokens
@@ -761,11 +1279,13 @@ async def dispatch_usage_summary(project_id: str, days: int = Query(7, ge=1, le=
     if not project_path:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    project_runtime_id = project_id_for_path(project_path)
-    usage_store = ProviderUsageStore(project_runtime_id)
-    totals = usage_store.totals(days=max(1, min(days, 365)))
+    project_runtime_id = _project_id(project_path)
+    usage_store = _usage_store(project_runtime_id)
+    # days is already bounded to 1..365 by the Query validator, and the
+    # provider totals come typed from ProviderUsageTotals.to_dict().
+    totals = usage_store.totals(days=days)
     providers = {
-        provider: ProviderUsageTotalsResponse(**values)
+        provider: ProviderUsageTotalsResponse.model_construct(**values)
         for provider, values in totals.get("providers", {}).items()
     }
     all_totals = totals.get("all", {})
@@ -773,7 +1293,7 @@ async def dispatch_usage_summary(project_id: str, days: int = Query(7, ge=1, le=
 
     return DispatchUsageSummaryResponse(
         project_id=str(project_path),
-        days=max(1, min(days, 365)),
+        days=days,
         providers=providers,
         total_tokens=int(all_totals.get("tokens", 0)),
         total_effort_units=float(all_totals.get("effort_units", 0.0)),
@@ -841,12 +1361,156 @@ class DispatchSummaryResponse(BaseModel):
     has_errors: bool
 
 
+def _read_tail(path: Path, max_bytes: int = _LOG_TAIL_READ_BYTES) -> str | None:
+    """Read at most the last max_bytes of a file as text, or None if it is missing.
+
+    When the read starts mid-file, the (probably partial) first line is dropped.
+    """
+    try:
+        with path.open("rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size > max_bytes:
+                handle.seek(size - max_bytes)
+                raw = handle.read()
+                newline = raw.find(b"\n")
+                if newline != -1:
+                    raw = raw[newline + 1:]
+            else:
+                raw = handle.read()
+    except FileNotFoundError:
+        return None
+    return raw.decode("utf-8", errors="ignore")
+
+
+def _collect_file_changes(git) -> tuple[list[FileChange], int, int]:
+    """Uncommitted files with their line stats, plus added/removed totals."""
+    files_changed: list[FileChange] = []
+    total_added = 0
+    total_removed = 0
+
+    for file_info in git.uncommitted_files_with_lines():
+        added = 0
+        removed = 0
+        if file_info.get("lines"):
+            # lines format is "+N -M"
+            for sign, count in _DIFFSTAT_RE.findall(file_info["lines"]):
+                if sign == "+":
+                    added = int(count)
+                else:
+                    removed = int(count)
+
+        files_changed.append(FileChange(
+            file=file_info["path"],
+            lines_added=added,
+            lines_removed=removed,
+            status=file_info.get("status", "M")
+        ))
+
+        total_added += added
+        total_removed += removed
+
+    return files_changed, total_added, total_removed
+
+
+def _summary_log_candidates(project_path: Path, session_id: str, log_file: str | None) -> Iterator[Path]:
+    """Possible dispatch log locations for a summary, most reliable first."""
+    # Option 1: Direct log file path provided by frontend
+    if log_file:
+        yield Path(log_file)
+    # Option 2: Look up from active dispatch jobs by job_id
+    job = _dispatch_jobs.view(session_id)
+    if job and job.get("log_file"):
+        yield Path(job["log_file"])
+    # Option 3: Construct from session_id (original behavior); only built if
+    # needed since it creates the output directory
+    yield get_dispatch_output_path(project_path, session_id)[1]
+
+
+def _read_summary_output(project_path: Path, session_id: str, log_file: str | None) -> str | None:
+    """Tail of the first existing summary log candidate, or None.
+
+    Opening a candidate doubles as the existence check, so each one costs a
+    single failed open() rather than a stat() followed by an open().
+    """
+    for candidate in _summary_log_candidates(project_path, session_id, log_file):
+        output = _read_tail(candidate)
+        if output is not None:
+            return output
+    return None
+
+
+def _tail_output_lines(handle: BinaryIO, tail: int) -> tuple[list[str], int]:
+    """Last ``tail`` lines and the total line count of a binary log handle.
+
+    Lines are counted and split as bytes and only the kept ones are decoded.
+    bytes.splitlines breaks on exactly the universal newlines (LF, CR, CRLF)
+    that text-mode iteration uses, so for UTF-8 logs the result matches
+    reading the file as text. Each chunk is only split up to its last line
+    break whose meaning is settled (a trailing CR may be the start of a
+    CRLF); the rest is carried into the next chunk.
+    """
+    kept: deque[bytes] = deque(maxlen=tail)
+    line_count = 0
+    pending = b""
+    while chunk := handle.read(_OUTPUT_READ_CHUNK_BYTES):
+        data = pending + chunk
+        cut = max(data.rfind(b"\n"), data.rfind(b"\r", 0, len(data) - 1)) + 1
+        lines = data[:cut].splitlines()
+        pending = data[cut:]
+        line_count += len(lines)
+        kept.extend(lines)
+    if pending:
+        lines = pending.splitlines()
+        line_count += len(lines)
+        kept.extend(lines)
+    return [line.decode("utf-8", errors="ignore") for line in kept], line_count
+
+
+def _read_output_lines(
+    path: Path, since_line: int | None = None, tail: int | None = None
+) -> tuple[list[str], int] | None:
+    """Read a dispatch log's lines, or None if it does not exist.
+
+    Returns the selected lines and the file's total line count. With
+    since_line and/or tail set, the file is streamed and only the requested
+    window is kept in memory.
+    """
+    if tail is not None and since_line is None:
+        try:
+            handle = path.open("rb")
+        except FileNotFoundError:
+            return None
+        with handle:
+            return _tail_output_lines(handle, tail)
+    try:
+        handle = path.open(encoding="utf-8", errors="ignore")
+    except FileNotFoundError:
+        return None
+    with handle:
+        if since_line is None and tail is None:
+            lines = handle.read().splitlines()
+            return lines, len(lines)
+        kept: deque[str] = deque(maxlen=tail)
+        line_count = 0
+        for line in handle:
+            if line_count >= (since_line or 0):
+                kept.append(line.rstrip("\n"))
+            line_count += 1
+        return list(kept), line_count
+
+
 @router.get("/output/{session_id}")
-async def read_dispatch_output(session_id: str) -> DispatchOutputResponse:
+async def read_dispatch_output(
+    session_id: str,
+    since_line: int | None = Query(None, ge=0),
+    tail: int | None = Query(None, ge=1, le=10000),
+) -> DispatchOutputResponse:
     """Read dispatch output file and return lines.
 
     Allows frontend to tail the output file that dispatcher.py writes to.
-    Returns all lines each time (frontend tracks what it's already seen).
+    Returns all lines by default; ``since_line`` skips lines the caller has
+    already seen and ``tail`` keeps only the last N. ``line_count`` is
+    always the file's total.
     """
     if not CORE_AVAILABLE:
         return DispatchOutputResponse(lines=[], exists=False, line_count=0)
@@ -864,36 +1528,27 @@ async def read_dispatch_output(session_id: str) -> DispatchOutputResponse:
             # Full path provided
             output_file = Path(session_id_clean)
         else:
-            # Just an ID - need to find the file
-            # Look in all dispatch jobs first
-            for job_id, job in list(_dispatch_jobs.items()):
-                log_file = job.get("log_file")
-                if log_file and session_id_clean in log_file:
-                    output_file = Path(log_file)
-                    break
-            else:
-                # Not in dispatch jobs, try fallback jobs
-                for job_id, job in list(_fallback_jobs.items()):
-                    log_file = job.get("log_file")
-                    if log_file and session_id_clean in log_file:
-                        output_file = Path(log_file)
-                        break
-                else:
-                    # Last resort: try to construct path
-                    # This handles cases where the job is very old and pruned
-                    return DispatchOutputResponse(lines=[], exists=False, line_count=0)
-
-        if not output_file.exists():
+            # Just an ID - look it up in the dispatch jobs' log-file index,
+            # then the fallback jobs'
+            log_file = _dispatch_jobs.find_log_file(session_id_clean) or _fallback_jobs.find_log_file(
+                session_id_clean
+            )
+            if not log_file:
+                # The job is unknown or was pruned long ago
+                return DispatchOutputResponse(lines=[], exists=False, line_count=0)
+            output_file = Path(log_file)
+
+        # Existence check and read share one thread hop so a large log
+        # (or a slow filesystem) doesn't stall the event loop.
+        read = await run_in_threadpool(_read_output_lines, output_file, since_line, tail)
+        if read is None:
             return DispatchOutputResponse(lines=[], exists=False, line_count=0)
-
-        # Read all lines
-        content = output_file.read_text(encoding="utf-8", errors="ignore")
-        lines = content.splitlines()
+        lines, line_count = read
 
         return DispatchOutputResponse(
             lines=lines,
             exists=True,
-            line_count=len(lines)
+            line_count=line_count
         )
     except Exception as e:
         logger.error(f"Failed to read dispatch output for {session_id}: {e}")
@@ -940,6 +1595,39 @@ async def enrich_prompt(request: EnrichPromptRequest) -> EnrichPromptResponse:
         )
 
 
+@functools.lru_cache(maxsize=256)
+def _load_truncated(path: str, mtime_ns: int, size: int, limit: int) -> str:
+    """Read a file and keep its first limit chars, marking truncation with "...".
+
+    mtime_ns and size are only part of the cache key, so an edited file is
+    re-read instead of served stale.
+    """
+    raw = Path(path).read_text(encoding="utf-8")
+    return raw[:limit] + ("..." if len(raw) > limit else "")
+
+
+def _read_context_excerpt(path: Path, limit: int) -> str:
+    """Truncated file contents for prompt context, or "" if unreadable."""
+    try:
+        stat = path.stat()
+        return _load_truncated(str(path), stat.st_mtime_ns, stat.st_size, limit)
+    except Exception:
+        return ""
+
+
+def _read_task_prompt_context(project_path: Path) -> tuple[str, str]:
+    """Read the CLAUDE.md and ROADMAP.md excerpts used by the task-prompt meta prompt.
+
+    Both files are read in one call so the endpoint pays a single thread hop,
+    and unchanged files are served from _load_truncated's cache.
+    """
+    # CLAUDE.md for project context, truncated to keep the prompt manageable
+    claude_md_content = _read_context_excerpt(project_path / "CLAUDE.md", 3000)
+    # ROADMAP.md for milestone context, just the first 2000 chars
+    roadmap_context = _read_context_excerpt(project_path / ".claude" / "planning" / "ROADMAP.md", 2000)
+    return claude_md_content, roadmap_context
+
+
 @router.post("/generate-task-prompt")
 async def generate_task_prompt(request: GenerateTaskPromptRequest) -> GenerateTaskPromptResponse:
     """Generate an implementation prompt for a roadmap task using Claude Code.
@@ -961,27 +1649,7 @@ async def generate_task_prompt(request: GenerateTaskPromptRequest) -> GenerateTa
 
     clean_task = _BOLD_NUMBERING_RE.sub('', request.task_text).strip()
 
-    # Read CLAUDE.md for project context
-    claude_md_content = ""
-    claude_md = project_path / "CLAUDE.md"
-    if claude_md.exists():
-        try:
-            raw = claude_md.read_text(encoding="utf-8")
-            # Truncate to keep prompt manageable
-            claude_md_content = raw[:3000] + ("..." if len(raw) > 3000 else "")
-        except Exception:
-            pass
-
-    # Read ROADMAP.md for milestone context
-    roadmap_context = ""
-    roadmap_path = project_path / ".claude" / "planning" / "ROADMAP.md"
-    if roadmap_path.exists():
-        try:
-            raw = roadmap_path.read_text(encoding="utf-8")
-            # Just the first 2000 chars for context
-            roadmap_context = raw[:2000] + ("..." if len(raw) > 2000 else "")
-        except Exception:
-            pass
+    claude_md_content, roadmap_context = await run_in_threadpool(_read_task_prompt_context, project_path)
 
     meta_prompt = f"""You are generating an implementation prompt for a developer task. Your job is to write a clear, actionable prompt that another Claude Code session will execute.
 
@@ -1019,9 +1687,7 @@ Keep it under 800 words. Start with a one-line summary of the task."""
             generated = result.output.strip()
             # Remove any markdown code fences if Claude wrapped its response
             if generated.startswith("```"):
-                lines = generated.split("\n")
-                lines = [l for l in lines if not l.startswith("```")]
-                generated = "\n".join(lines).strip()
+                generated = _FENCE_LINE_RE.sub("", generated).strip()
 
             return GenerateTaskPromptResponse(
                 prompt=generated,
@@ -1064,36 +1730,10 @@ async def get_dispatch_summary(request: DispatchSummaryRequest) -> DispatchSumma
         if not project_path.exists():
             raise HTTPException(status_code=404, detail="Project path not found")
 
-        git = GitUtils(project_path)
-
-        # Get uncommitted files with line change stats
-        uncommitted = git.uncommitted_files_with_lines()
-
-        files_changed = []
-        total_added = 0
-        total_removed = 0
-
-        for file_info in uncommitted:
-            added = 0
-            removed = 0
-            if file_info.get("lines"):
-                # lines format is "+N -M"
-                parts = file_info["lines"].split()
-                for part in parts:
-                    if part.startswith("+"):
-                        added = int(part[1:])
-                    elif part.startswith("-"):
-                        removed = int(part[1:])
-
-            files_changed.append(FileChange(
-                file=file_info["path"],
-                lines_added=added,
-                lines_removed=removed,
-                status=file_info.get("status", "M")
-            ))
-
-            total_added += added
-            total_removed += removed
+        # git status/diff are subprocess calls, so collect off the event loop
+        files_changed, total_added, total_removed = await run_in_threadpool(
+            _collect_file_changes, GitUtils(project_path)
+        )
 
         # Read dispatch output to check for errors
         summary_message = None
@@ -1101,55 +1741,39 @@ async def get_dispatch_summary(request: DispatchSummaryRequest) -> DispatchSumma
         job_result_checked = False
 
         # Primary: check the actual dispatch job result (most reliable signal)
-        for store, lock in [(_dispatch_jobs, _dispatch_jobs_lock), (_fallback_jobs, _fallback_jobs_lock)]:
-            with lock:
-                job = store.get(request.session_id)
-                if job:
-                    result_data = job.get("result")
-                    if isinstance(result_data, dict):
-                        has_errors = not result_data.get("success", True)
-                        job_result_checked = True
-                    break
-
-        # Try to find the output file using multiple strategies
-        output_file = None
-
-        # Option 1: Direct log file path provided by frontend
-        if request.log_file:
-            candidate = Path(request.log_file)
-            if candidate.exists():
-                output_file = candidate
-
-        # Option 2: Look up from active dispatch jobs by job_id
-        if output_file is None:
-            with _dispatch_jobs_lock:
-                job = _dispatch_jobs.get(request.session_id)
-                if job and job.get("log_file"):
-                    candidate = Path(job["log_file"])
-                    if candidate.exists():
-                        output_file = candidate
-
-        # Option 3: Try constructing from session_id (original behavior)
-        if output_file is None:
-            _, constructed = get_dispatch_output_path(project_path, request.session_id)
-            if constructed.exists():
-                output_file = constructed
-
-        if output_file is not None and output_file.exists():
-            output = output_file.read_text(encoding="utf-8", errors="ignore")
+        for store in (_dispatch_jobs, _fallback_jobs):
+            job = store.view(request.session_id)
+            if job:
+                result_data = job.get("result")
+                if isinstance(result_data, dict):
+                    has_errors = not result_data.get("success", True)
+                    job_result_checked = True
+                break
+
+        # Only the last few lines are inspected, so read a bounded tail
+        output = await run_in_threadpool(
+            _read_summary_output, project_path, request.session_id, request.log_file
+        )
+        if output is not None:
+            # One backward pass collects the last 5 non-empty lines for both
+            # the error scan and the final message.
+            last_lines: list[str] = []
+            for raw_line in reversed(output.splitlines()):
+                line = raw_line.strip()
+                if line:
+                    last_lines.append(line)
+                    if len(last_lines) == 5:
+                        break
+            last_lines.reverse()
 
             # Fallback heuristic: only check last 5 lines for actual error patterns
             # (avoids false positives from code about error handling, test output, etc.)
             if not job_result_checked:
-                lines_all = [l.strip() for l in output.splitlines() if l.strip()]
-                tail = "\n".join(lines_all[-5:]).lower() if lines_all else ""
-                error_patterns = ["error:", "fatal:", "traceback (most recent", "abort:"]
-                has_errors = any(pat in tail for pat in error_patterns)
+                has_errors = bool(_SUMMARY_ERROR_RE.search("\n".join(last_lines)))
 
             # Try to extract Claude's final message (last non-empty line)
-            lines = [l.strip() for l in output.splitlines() if l.strip()]
-            if lines:
-                summary_message = lines[-1][:200]  # Last line, truncated
+            if last_lines:
+                summary_message = last_lines[-1][:200]  # Last line, truncated
 
         return DispatchSummaryResponse(
             success=len(files_changed) > 0,
@@ -1171,24 +1795,22 @@ async def get_dispatch_summary(request: DispatchSummaryRequest) -> DispatchSumma
         )
 
 
-def _create_dispatch_job(prompt: str, project_path: Path) -> dict:
-    job_id = f"disp-{uuid.uuid4().hex[:12]}"
-
-    # Generate output file path upfront so we can monitor it during execution
-    log_file: str | None = None
-    if CORE_AVAILABLE:
-        try:
-            _session_id, output_path = get_dispatch_output_path(project_path)
-            log_file = str(output_path)
-        except Exception as exc:
-            logger.warning("Failed to generate dispatch output path: %s", exc)
-
-    job = {
+def _new_job_record(
+    job_id: str,
+    *,
+    message: str,
+    prompt: str,
+    project_path: Path,
+    log_file: str | None,
+    **extra,
+) -> dict:
+    """Fields shared by queued dispatch and fallback job records."""
+    return {
         "job_id": job_id,
         "status": "queued",
         "phase": "queued",
-        "message": "Dispatch queued. Preparing Claude Code run...",
-        "created_at": datetime.utcnow().isoformat(),
+        "message": message,
+        "created_at": _utcnow_iso(),
         "started_at": None,
         "finished_at": None,
         "done": False,
@@ -1197,110 +1819,73 @@ def _create_dispatch_job(prompt: str, project_path: Path) -> dict:
         "result": None,
         "error_detail": None,
         "output_tail": None,
-        "log_file": log_file,  # Store early so status endpoint can read during execution
+        "log_file": log_file,
+        **extra,
     }
-    with _dispatch_jobs_lock:
-        _dispatch_jobs[job_id] = job
-        _trim_dispatch_jobs_locked()
-    return dict(job)
 
 
-def _get_dispatch_job(job_id: str) -> dict | None:
-    with _dispatch_jobs_lock:
-        job = _dispatch_jobs.get(job_id)
-        return dict(job) if job else None
+def _create_dispatch_job(prompt: str, project_path: Path) -> dict:
+    job_id = f"disp-{uuid.uuid4().hex[:12]}"
 
+    # Generate output file path upfront so we can monitor it during execution
+    log_file: str | None = None
+    if CORE_AVAILABLE:
+        try:
+            _session_id, output_path = get_dispatch_output_path(project_path)
+            log_file = str(output_path)
+        except Exception as exc:
+            logger.warning("Failed to generate dispatch output path: %s", exc)
 
-def _update_dispatch_job(job_id: str, **updates) -> dict | None:
-    with _dispatch_jobs_lock:
-        job = _dispatch_jobs.get(job_id)
-        if not job:
-            return None
-        job.update(updates)
-        return dict(job)
-
-
-def _trim_dispatch_jobs_locked() -> None:
-    if len(_dispatch_jobs) <= _MAX_DISPATCH_JOBS:
-        return
-    completed = sorted(
-        (
-            (job_id, data)
-            for job_id, data in _dispatch_jobs.items()
-            if data.get("done")
-        ),
-        key=lambda item: item[1].get("finished_at") or item[1].get("created_at") or "",
+    # log_file is stored early so the status endpoint can read it during execution
+    job = _new_job_record(
+        job_id,
+        message="Dispatch queued. Preparing Claude Code run...",
+        prompt=prompt,
+        project_path=project_path,
+        log_file=log_file,
     )
-    while len(_dispatch_jobs) > _MAX_DISPATCH_JOBS and completed:
-        job_id, _ = completed.pop(0)
-        _dispatch_jobs.pop(job_id, None)
+    return _dispatch_jobs.add(job)
 
 
 def _create_fallback_job(prompt: str, project_path: Path, provider: str, cli_path: str) -> dict:
     """Create and persist a fallback job record."""
     job_id = f"fb-{uuid.uuid4().hex[:12]}"
     session_id = f"dispatch-{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
-    runtime_dir = project_runtime_dir(project_id_for_path(project_path))
-    dispatch_output_dir = runtime_dir / "dispatch-output"
-    dispatch_output_dir.mkdir(parents=True, exist_ok=True)
-    log_file = dispatch_output_dir / f"{session_id}-{provider}.log"
-
-    job = {
-        "job_id": job_id,
-        "status": "queued",
-        "phase": "queued",
-        "message": f"Fallback queued for {provider}.",
-        "created_at": datetime.utcnow().isoformat(),
-        "started_at": None,
-        "finished_at": None,
-        "done": False,
-        "provider": provider,
-        "cli_path": cli_path,
-        "project_path": str(project_path),
-        "prompt_preview": _prompt_preview(prompt),
-        "result": None,
-        "error_detail": None,
-        "output_tail": None,
-        "log_file": str(log_file),
-        "session_id": session_id,
-        "cancel_event": threading.Event(),
-        "verification": None,
-    }
-    with _fallback_jobs_lock:
-        _fallback_jobs[job_id] = job
-        _trim_fallback_jobs_locked()
-    return dict(job)
+    log_file = _dispatch_output_dir(project_path) / f"{session_id}-{provider}.log"
 
+    job = _new_job_record(
+        job_id,
+        message=f"Fallback queued for {provider}.",
+        prompt=prompt,
+        project_path=project_path,
+        log_file=str(log_file),
+        provider=provider,
+        cli_path=cli_path,
+        session_id=session_id,
+        cancel_event=threading.Event(),
+        verification=None,
+    )
+    return _fallback_jobs.add(job)
 
-def _get_fallback_job(job_id: str) -> dict | None:
-    with _fallback_jobs_lock:
-        job = _fallback_jobs.get(job_id)
-        return dict(job) if job else None
 
+def _evict_finished_jobs_locked(
+    store: OrderedDict[str, dict],
+    finished: OrderedDict[str, None],
+    max_jobs: int,
+) -> list[dict]:
+    """Drop the oldest finished jobs until the store is back within max_jobs.
 
-def _update_fallback_job(job_id: str, **updates) -> dict | None:
-    with _fallback_jobs_lock:
-        job = _fallback_jobs.get(job_id)
-        if not job:
-            return None
-        job.update(updates)
-        return dict(job)
-
-
-def _trim_fallback_jobs_locked() -> None:
-    if len(_fallback_jobs) <= _MAX_FALLBACK_JOBS:
-        return
-    completed = sorted(
-        (
-            (job_id, data)
-            for job_id, data in _fallback_jobs.items()
-            if data.get("done")
-        ),
-        key=lambda item: item[1].get("finished_at") or item[1].get("created_at") or "",
-    )
-    while len(_fallback_jobs) > _MAX_FALLBACK_JOBS and completed:
-        job_id, _ = completed.pop(0)
-        _fallback_jobs.pop(job_id, None)
+    ``finished`` holds the store's finished job IDs in completion order;
+    running jobs are never in it, so they are never evicted. Caller must
+    hold the store's lock. Returns the evicted job records.
+    """
+    evicted: list[dict] = []
+    while len(store) > max_jobs and finished:
+        job_id, _ = finished.popitem(last=False)
+        job = store.pop(job_id, None)
+        if job is not None:
+            evicted.append(job)
+    return evicted
 
 
 def _run_fallback_job(
@@ -1311,20 +1896,20 @@ def _run_fallback_job(
     cli_path: str,
 ) -> None:
     """Run a fallback job in a background thread with live-log support."""
-    job = _get_fallback_job(job_id)
+    job = _fallback_jobs.get(job_id)
     cancel_event = job.get("cancel_event") if job else None
     log_file = Path(job["log_file"]) if job and job.get("log_file") else None
 
-    _update_fallback_job(
+    _fallback_jobs.update(
         job_id,
         status="running",
         phase="launching",
         message=f"Launching {provider} CLI...",
-        started_at=datetime.utcnow().isoformat(),
+        started_at=_utcnow_iso(),
     )
 
     try:
-        _update_fallback_job(
+        _fallback_jobs.update(
             job_id,
             phase="running",
             message=f"{provider.capitalize()} is processing your task...",
@@ -1355,7 +1940,7 @@ def _run_fallback_job(
         error_code: str | None = None
 
         if success:
-            _update_fallback_job(
+            _fallback_jobs.update(
                 job_id,
                 phase="verifying",
                 message="Verifying lint/typecheck/documentation gates...",
@@ -1393,14 +1978,14 @@ def _run_fallback_job(
             response.error or f"{provider.capitalize()} fallback failed."
         )
 
-        _update_fallback_job(
+        _fallback_jobs.update(
             job_id,
             status="succeeded" if success else "failed",
             phase="complete" if success else "failed",
             message=message,
-            finished_at=datetime.utcnow().isoformat(),
+            finished_at=_utcnow_iso(),
             done=True,
-            result=response.model_dump(),
+            result=_job_result_payload(response, result.output_file),
             error_detail=_build_fallback_error_detail(response, result.output, result.output_file),
             output_tail=_tail_text(result.output, max_lines=30, max_chars=3000),
             log_file=str(result.output_file) if result.output_file else (str(log_file) if log_file else None),
@@ -1408,12 +1993,12 @@ def _run_fallback_job(
         )
     except Exception as exc:
         logger.exception("Fallback job %s failed unexpectedly", job_id)
-        _update_fallback_job(
+        _fallback_jobs.update(
             job_id,
             status="failed",
             phase="failed",
             message="Fallback dispatch failed before completion.",
-            finished_at=datetime.utcnow().isoformat(),
+            finished_at=_utcnow_iso(),
             done=True,
             result=DispatchResponse(
                 success=False,
@@ -1427,27 +2012,61 @@ def _run_fallback_job(
         )
 
 
-def _run_dispatch_job(job_id: str, prompt: str, project_path: Path) -> None:
+async def _run_claude_dispatch(prompt: str, project_path: Path, output_file: Path | None) -> "DispatchResult":
+    """Run the Claude CLI as an asyncio subprocess and collect a DispatchResult.
+
+    Same command, environment and result shape as the blocking
+    dispatch_claude_task, but driven from the event loop so a running
+    dispatch holds no worker thread and cancelling its task terminates the
+    CLI process.
+    """
+    output_lines: list[str] = []
+    error_message: str | None = None
+    completion = "failed"
+    async for event_type, data in async_dispatch_stream(
+        prompt=prompt,
+        working_dir=project_path,
+        output_file=output_file,
+    ):
+        if event_type == "output":
+            output_lines.append(data)
+        elif event_type == "error":
+            error_message = data
+        elif event_type == "complete":
+            completion = data
+    output = "\n".join(output_lines)
+    return DispatchResult(
+        success=completion == "success",
+        session_id=output_file.stem if output_file else None,
+        error_message=None if completion == "success" else error_message,
+        output_file=output_file,
+        provider="claude",
+        output=output or None,
+        token_limit_reached=completion == "token_limit",
+    )
+
+
+async def _run_dispatch_job(job_id: str, prompt: str, project_path: Path) -> None:
     # Get the pre-generated log file path
-    job = _get_dispatch_job(job_id)
+    job = _dispatch_jobs.view(job_id)
     log_file_path = Path(job["log_file"]) if job and job.get("log_file") else None
 
-    _update_dispatch_job(
+    _dispatch_jobs.update(
         job_id,
         status="running",
         phase="launching",
         message="Launching Claude Code CLI...",
-        started_at=datetime.utcnow().isoformat(),
+        started_at=_utcnow_iso(),
     )
 
     try:
-        _update_dispatch_job(
+        _dispatch_jobs.update(
             job_id,
             phase="running",
             message="Claude Code is processing your task.",
         )
         # Pass the pre-generated output file so we can monitor it during execution
-        result = dispatch_claude_task(prompt, project_path, output_file=log_file_path)
+        result = await _run_claude_dispatch(prompt, project_path, log_file_path)
 
         # Log dispatch event for the Logs tab (both success and failure)
         _log_dispatch_event(result, prompt, project_path)
@@ -1471,26 +2090,29 @@ def _run_dispatch_job(job_id: str, prompt: str, project_path: Path) -> None:
             )
         )
 
-        _update_dispatch_job(
+        _dispatch_jobs.update(
             job_id,
             status="succeeded" if succeeded else "failed",
             phase="complete" if succeeded else "failed",
             message=message,
-            finished_at=datetime.utcnow().isoformat(),
+            finished_at=_utcnow_iso(),
             done=True,
-            result=response.model_dump(),
+            result=_job_result_payload(response, result.output_file),
             error_detail=_build_dispatch_error_detail(result),
             output_tail=_tail_text(result.output, max_lines=24, max_chars=2400),
             log_file=str(result.output_file) if result.output_file else None,
         )
+    except asyncio.CancelledError:
+        # dispatch_cancel already marked the job; the stream terminated the CLI
+        raise
     except Exception as exc:
         logger.exception("Dispatch job %s failed unexpectedly", job_id)
-        _update_dispatch_job(
+        _dispatch_jobs.update(
             job_id,
             status="failed",
             phase="failed",
             message="Dispatch failed before Claude Code completed.",
-            finished_at=datetime.utcnow().isoformat(),
+            finished_at=_utcnow_iso(),
             done=True,
             result=DispatchResponse(success=False, error=str(exc)).model_dump(),
             error_detail=str(exc),
@@ -1499,6 +2121,21 @@ def _run_dispatch_job(job_id: str, prompt: str, project_path: Path) -> None:
         )
 
 
+def _job_result_payload(response: DispatchResponse, output_file: Path | None) -> dict:
+    """Result dict stored on a finished job record.
+
+    Finished jobs stay in the store until evicted and their result is sent
+    on every status poll, so when the full output is already in the log
+    file only its last _STORED_OUTPUT_CHARS are kept (from a line start).
+    """
+    payload = response.model_dump()
+    output = payload.get("output")
+    if output_file and output and len(output) > _STORED_OUTPUT_CHARS:
+        output = output[-_STORED_OUTPUT_CHARS:]
+        payload["output"] = output[output.find("\n") + 1:]
+    return payload
+
+
 def _dispatch_response_from_result(
     result,
     *,
@@ -1521,16 +2158,92 @@ def _dispatch_response_from_result(
     )
 
 
+# The stores below only hold their file paths, so one instance per project
+# can be shared across job threads. Building them per event re-ran the
+# runtime-dir mkdir and legacy-migration checks every time.
+@functools.lru_cache(maxsize=1)
+def _dispatch_logger() -> "DispatchLogger":
+    return DispatchLogger()
+
+
+@functools.lru_cache(maxsize=64)
+def _usage_store(project_runtime_id: str) -> "ProviderUsageStore":
+    return ProviderUsageStore(project_runtime_id)
+
+
+@functools.lru_cache(maxsize=64)
+def _cost_tracker(project_runtime_id: str) -> "CostTracker":
+    return CostTracker(project_runtime_id)
+
+
+# Dispatch-log and usage writes rewrite whole JSON files, so job threads hand
+# them to a single writer thread instead of doing the disk work inline. One
+# writer also serializes DispatchLogger, which does not lock its file.
+_persist_queue: "queue.SimpleQueue[Callable[[], None] | None]" = queue.SimpleQueue()
+_persist_thread: threading.Thread | None = None
+_persist_thread_lock = threading.Lock()
+_PERSIST_SHUTDOWN_TIMEOUT_SECONDS = 5.0
+
+
+def _persist_writer_loop() -> None:
+    while True:
+        write = _persist_queue.get()
+        if write is None:
+            return
+        write()
+
+
+def _enqueue_persist(write: Callable[[], None]) -> None:
+    """Queue a disk write for the writer thread, starting it on first use."""
+    global _persist_thread
+    with _persist_thread_lock:
+        if _persist_thread is None or not _persist_thread.is_alive():
+            _persist_thread = threading.Thread(
+                target=_persist_writer_loop,
+                name="dispatch-persist",
+                daemon=True,
+            )
+            _persist_thread.start()
+    _persist_queue.put(write)
+
+
+def _flush_persist_queue() -> None:
+    """Stop the writer thread after it drains, then run anything left over."""
+    global _persist_thread
+    with _persist_thread_lock:
+        thread, _persist_thread = _persist_thread, None
+    if thread is not None and thread.is_alive():
+        _persist_queue.put(None)
+        thread.join(timeout=_PERSIST_SHUTDOWN_TIMEOUT_SECONDS)
+    while True:
+        try:
+            write = _persist_queue.get_nowait()
+        except queue.Empty:
+            return
+        if write is not None:
+            write()
+
+
+atexit.register(_flush_persist_queue)
+
+
 def _log_dispatch_event(
     result,
     prompt: str,
     project_path: Path,
 ) -> None:
-    """Persist a dispatch event to the shared dispatch log for the Logs tab."""
+    """Queue a dispatch event for the shared dispatch log (Logs tab)."""
+    _enqueue_persist(functools.partial(_write_dispatch_event, result, prompt, project_path))
+
+
+def _write_dispatch_event(
+    result,
+    prompt: str,
+    project_path: Path,
+) -> None:
     try:
-        dispatch_logger = DispatchLogger()
-        pid = project_id_for_path(project_path)
-        dispatch_logger.log_dispatch(
+        pid = _project_id(project_path)
+        _dispatch_logger().log_dispatch(
             result=result,
             prompt=prompt,
             project_name=project_path.name,
@@ -1550,12 +2263,34 @@ def _record_usage_event(
     source: str,
     token_limit_reached: bool = False,
 ) -> None:
-    """Persist provider usage telemetry for dispatch/fallback executions."""
+    """Queue provider usage telemetry for dispatch/fallback executions."""
+    _enqueue_persist(
+        functools.partial(
+            _write_usage_event,
+            project_path,
+            prompt,
+            provider,
+            output,
+            session_id,
+            source,
+            token_limit_reached,
+        )
+    )
+
+
+def _write_usage_event(
+    project_path: Path,
+    prompt: str,
+    provider: str,
+    output: str | None,
+    session_id: str | None,
+    source: str,
+    token_limit_reached: bool,
+) -> None:
     try:
-        project_runtime_id = project_id_for_path(project_path)
-        usage_store = ProviderUsageStore(project_runtime_id)
+        project_runtime_id = _project_id(project_path)
         snapshot = usage_snapshot(provider=provider, prompt=prompt, output=output)
-        usage_store.record(
+        _usage_store(project_runtime_id).record(
             snapshot=snapshot,
             source=source,
             session_id=session_id,
@@ -1568,8 +2303,7 @@ def _record_usage_event(
         # Keep Claude API cost history compatible with existing budget logic.
         if provider == "claude":
             model = snapshot.model or "claude-3-5-sonnet-latest"
-            cost_tracker = CostTracker(project_runtime_id)
-            cost_tracker.record_usage(
+            _cost_tracker(project_runtime_id).record_usage(
                 TokenUsage(
                     input_tokens=snapshot.input_tokens,
                     output_tokens=snapshot.output_tokens,
@@ -1595,11 +2329,34 @@ def _clamp_threshold(value: float) -> float:
 def _tail_text(value: str | None, max_lines: int = 20, max_chars: int = 2000) -> str | None:
     if not value:
         return None
-    sanitized = _strip_ansi(value)
-    lines = [line.rstrip() for line in sanitized.splitlines() if line.strip()]
+    # Only split and ANSI-strip a window from the end of the output, widening
+    # it when blank or escape-heavy lines leave it short of the limits. The
+    # window's first line may be cut off, so it is only kept at the start.
+    window = 4 * max_chars
+    while True:
+        start = max(0, len(value) - window)
+        raw_lines = value[start:].splitlines()
+        if start:
+            raw_lines = raw_lines[1:]
+        lines: list[str] = []
+        kept_chars = 0
+        for raw_line in reversed(raw_lines):
+            line = _strip_ansi(raw_line).rstrip()
+            if not line.strip():
+                continue
+            lines.append(line)
+            kept_chars += len(line) + 1
+            if len(lines) >= max_lines or kept_chars > max_chars:
+                break
+        else:
+            if start:
+                window *= 4
+                continue
+        break
     if not lines:
         return None
-    text = "\n".join(lines[-max_lines:])
+    lines.reverse()
+    text = "\n".join(lines)
     if len(text) > max_chars:
         text = text[-max_chars:]
     return text
@@ -1650,34 +2407,21 @@ def _build_fallback_error_detail(
 
 def _normalize_gate_name(value: str) -> str:
     """Normalize user-facing gate names to canonical gate IDs."""
-    normalized = value.strip().lower().replace("-", "").replace("_", "").replace(" ", "")
-    mapping = {
-        "lint": "lint",
-        "typecheck": "typecheck",
-        "typing": "typecheck",
-        "mypy": "typecheck",
-        "documentation": "documentation",
-        "docs": "documentation",
-        "doc": "documentation",
-    }
-    return mapping.get(normalized, normalized)
+    normalized = value.strip().lower().translate(_GATE_NAME_SEPARATORS)
+    return _GATE_NAME_ALIASES.get(normalized, normalized)
 
 
 def _extract_requested_gate_names(prompt: str) -> list[str]:
     """Extract failing gate names from a fallback prompt."""
     if not prompt:
         return []
-    match = re.search(r"failed gate\(s\)\s*:\s*([^\n\r]+)", prompt, flags=re.IGNORECASE)
+    match = _FAILED_GATES_RE.search(prompt)
     if not match:
         return []
-    raw = match.group(1)
-    candidates = [token.strip() for token in raw.split(",") if token.strip()]
-    normalized: list[str] = []
-    for token in candidates:
-        gate = _normalize_gate_name(token)
-        if gate and gate not in normalized:
-            normalized.append(gate)
-    return normalized
+    # dict.fromkeys keeps first-seen order while dropping repeats and
+    # aliases of the same gate ("mypy, typecheck") in one pass.
+    gates = dict.fromkeys(_normalize_gate_name(token) for token in match.group(1).split(","))
+    return [gate for gate in gates if gate]
 
 
 def _verify_fallback_gates(project_path: Path, prompt: str) -> tuple[bool, dict[str, str], str | None]:
@@ -1687,7 +2431,6 @@ def _verify_fallback_gates(project_path: Path, prompt: str) -> tuple[bool, dict[
 
     requested = _extract_requested_gate_names(prompt)
     targets = requested or ["lint", "typecheck", "documentation"]
-    statuses: dict[str, str] = {}
 
     try:
         runner = QualityGateRunner(project_path)
@@ -1695,19 +2438,21 @@ def _verify_fallback_gates(project_path: Path, prompt: str) -> tuple[bool, dict[
     except Exception as exc:
         return False, dict.fromkeys(targets, "error"), f"Failed to initialize gate runner: {exc}"
 
-    for gate_name in targets:
+    def run_one(gate_name: str) -> str:
         if gate_name not in runner.gates:
-            statuses[gate_name] = "missing"
-            continue
+            return "missing"
         try:
             report = runner.run_gate(gate_name, session_id=None)
-            status = report.results[0].status if report.results else "error"
-            statuses[gate_name] = status
+            return report.results[0].status if report.results else "error"
         except Exception as exc:
-            statuses[gate_name] = "error"
             logger.warning("Fallback verification failed for gate %s: %s", gate_name, exc)
+            return "error"
 
-    failed = {name: status for name, status in statuses.items() if status not in {"pass", "skipped"}}
+    # The gates are independent subprocess runs, so they go in parallel.
+    with ThreadPoolExecutor(max_workers=len(targets), thread_name_prefix="fallback-gate") as pool:
+        statuses = dict(zip(targets, pool.map(run_one, targets)))
+
+    failed = {name: status for name, status in statuses.items() if status not in _GATE_OK_STATUSES}
     if failed:
         summary = ", ".join(f"{name}={status}" for name, status in failed.items())
         return False, statuses, f"Post-run gate verification failed: {summary}."
@@ -1717,38 +2462,10 @@ def _verify_fallback_gates(project_path: Path, prompt: str) -> tuple[bool, dict[
 
 def _classify_fallback_failure(provider: str, error: str | None, output: str | None) -> str:
     """Classify fallback failure for actionable UI messages."""
-    text = f"{error or ''}\n{output or ''}".lower()
-
-    if "not found at" in text:
-        return "cli_not_found"
-    if "cancelled by user" in text or "cancelled" in text:
-        return "cancelled"
-    if "timed out after" in text:
-        return "timeout"
-    if "stalled with no output" in text:
-        return "stalled"
-    if (
-        "error sending request for url" in text
-        or "stream disconnected" in text
-        or "network request failed" in text
-    ):
-        return "network_disconnect"
-    if (
-        "stdin is not a terminal" in text
-        or "confirm whether you want me to proceed" in text
-        or "do you want me to proceed" in text
-        or "please confirm" in text
-        or "waiting for input" in text
-    ):
-        return "needs_user_input"
-    if (
-        "login" in text
-        or "auth" in text
-        or "unauthorized" in text
-        or "invalid api key" in text
-        or "api key" in text
-    ):
-        return "auth_required"
-    if "verification failed" in text:
-        return "verification_failed"
+    # bytes.lower() and bytes searches stay on one byte per character even
+    # when the output holds non-ASCII text, where str would widen.
+    text = f"{error or ''}\n{output or ''}".encode("utf-8", "replace").lower()
+    for code, needles in _FALLBACK_FAILURE_RULES:
+        if any(needle in text for needle in needles):
+            return code
     return f"{provider}_execution_failed"
@@ -6,16 +6,22 @@ with sub-100ms latency from CLI output to UI display.
 """
 
 import asyncio
-import json
+import heapq
 import logging
+import time
 import uuid
-from datetime import datetime
+from collections import deque
 from pathlib import Path
 from typing import AsyncGenerator, Literal
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+from .. import fast_json
+from ..clock import utcnow_iso
+from ..project_index import find_project_path
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -28,7 +34,6 @@ try:
     )
     from src.core.provider_telemetry import usage_snapshot
     from src.core.provider_usage import ProviderUsageStore
-    from src.core.project import ProjectRegistry
     from src.core.runtime import project_id_for_path
     from src.core.cost_tracker import CostTracker, TokenUsage
 
@@ -38,10 +43,31 @@ except ImportError as e:
     CORE_AVAILABLE = False
 
 
-# In-memory job storage for active streaming jobs
+# Output frames are coalesced for up to this long (or this many bytes)
+# before being written; control events are never held back.
+_SSE_BATCH_WINDOW_SECONDS = 0.015
+_SSE_BATCH_MAX_BYTES = 16 * 1024
+_SSE_FLUSH_NOW_TYPES = frozenset({"status", "error", "complete"})
+
+# Frames buffered per stream while the client is slower than the CLI. Past
+# this, the oldest output frames are dropped (control frames are kept) and
+# the client is told how many lines it missed.
+_SSE_MAX_BUFFERED_FRAMES = 1024
+
+# In-memory job storage for active streaming jobs. Only touched from the
+# event loop without awaiting in between, so it needs no lock.
 _stream_jobs: dict[str, AsyncDispatchJob] = {}
-_stream_jobs_lock = asyncio.Lock()
 _MAX_STREAM_JOBS = 50
+_FINISHED_JOB_TTL_SECONDS = 300
+
+# (expires_at, job_id) for finished jobs, earliest expiry first.
+_expiry_heap: list[tuple[float, str]] = []
+
+# Jobs whose event queue has been read to the end. A later connection to one
+# of these is served from the job's output file instead of job.events(),
+# which would wait forever for events that were already consumed.
+_drained_jobs: set[str] = set()
+_REPLAY_CHUNK_BYTES = 64 * 1024
 
 
 class StreamStartRequest(BaseModel):
@@ -73,54 +99,173 @@ def _get_project_path(project_id: str) -> Path | None:
     if path.exists():
         return path
     if CORE_AVAILABLE:
-        registry = ProjectRegistry.load_or_create()
-        for project in registry.list_projects():
-            if str(project.path) == project_id or project.name == project_id:
-                return project.path
+        return find_project_path(project_id)
     return None
 
 
-async def _cleanup_old_jobs() -> None:
-    """Remove completed jobs that are older than 5 minutes."""
-    async with _stream_jobs_lock:
-        now = datetime.now()
-        to_remove = []
-        for job_id, job in _stream_jobs.items():
-            if not job.is_running:
-                # Job is done, check age
-                if hasattr(job, "_finished_at") and job._finished_at:
-                    age = (now - job._finished_at).total_seconds()
-                    if age > 300:  # 5 minutes
-                        to_remove.append(job_id)
-        for job_id in to_remove:
+def _schedule_expiry(job_id: str) -> None:
+    """Queue a finished job for removal once its retention window passes."""
+    heapq.heappush(_expiry_heap, (time.monotonic() + _FINISHED_JOB_TTL_SECONDS, job_id))
+
+
+def _cleanup_old_jobs() -> None:
+    """Remove jobs that finished more than 5 minutes ago."""
+    now = time.monotonic()
+    while _expiry_heap and _expiry_heap[0][0] <= now:
+        _expires_at, job_id = heapq.heappop(_expiry_heap)
+        job = _stream_jobs.get(job_id)
+        if job is not None and not job.is_running:
             del _stream_jobs[job_id]
+            _drained_jobs.discard(job_id)
+
 
+def _sse_job_suffix(job_id: str) -> bytes:
+    """Encoded ``,"job_id":"..."}`` frame ending, built once per stream."""
+    return b',"job_id":' + fast_json.dumps(job_id) + b"}\n\n"
 
-async def _format_sse_event(
+
+def _format_sse_event(
     event_type: str,
     data: str,
     sequence: int,
-    job_id: str,
-) -> str:
-    """Format an SSE event string."""
+    job_suffix: bytes,
+) -> bytes:
+    """Format an SSE event frame.
+
+    Only the per-event fields are encoded here; the stream's job_id ending
+    from _sse_job_suffix is appended in place of the closing brace.
+    """
     event_data = {
         "type": event_type,
         "data": data,
         "sequence": sequence,
-        "timestamp": datetime.utcnow().isoformat(),
-        "job_id": job_id,
+        "timestamp": utcnow_iso(),
     }
-    return f"data: {json.dumps(event_data)}\n\n"
+    return b"data: " + fast_json.dumps(event_data)[:-1] + job_suffix
 
 
-async def _stream_events(job: AsyncDispatchJob) -> AsyncGenerator[str, None]:
-    """Generate SSE events from a dispatch job."""
+async def _stream_events(job: AsyncDispatchJob, job_suffix: bytes) -> AsyncGenerator[bytes, None]:
+    """Generate SSE events from a dispatch job, coalescing bursts of output.
+
+    A chatty CLI emits one event per line, so frames are gathered for up to
+    _SSE_BATCH_WINDOW_SECONDS (or _SSE_BATCH_MAX_BYTES) and written as one
+    chunk of complete frames; the client still sees one event per frame.
+    Status, error and complete events end a batch immediately. A pump task
+    moves job events into a local buffer of at most _SSE_MAX_BUFFERED_FRAMES,
+    so a slow client costs bounded memory instead of stalling the job.
+    """
+    buffer: deque[tuple[str, bytes] | None] = deque()
+    ready = asyncio.Event()
+    dropped = 0
+    last_sequence = 0
+
+    def push(item: tuple[str, bytes] | None) -> None:
+        nonlocal dropped
+        if item is not None and len(buffer) >= _SSE_MAX_BUFFERED_FRAMES:
+            for index, queued in enumerate(buffer):
+                if queued is not None and queued[0] == "output":
+                    del buffer[index]
+                    dropped += 1
+                    break
+        buffer.append(item)
+        ready.set()
+
+    async def pump() -> None:
+        nonlocal last_sequence
+        try:
+            async for event_type, data, sequence in job.events():
+                last_sequence = sequence
+                push((event_type, _format_sse_event(event_type, data, sequence, job_suffix)))
+            _drained_jobs.add(job.job_id)
+        finally:
+            push(None)
+
+    async def wait_for_frame(timeout: float | None = None) -> None:
+        # Waiting on the event (not on a queue get) means a timeout can
+        # never swallow a frame.
+        while not buffer:
+            ready.clear()
+            await asyncio.wait_for(ready.wait(), timeout)
+
+    loop = asyncio.get_running_loop()
+    pump_task = loop.create_task(pump())
     try:
-        async for event_type, data, sequence in job.events():
-            yield await _format_sse_event(event_type, data, sequence, job.job_id)
+        finished = False
+        while not finished:
+            await wait_for_frame()
+            item = buffer.popleft()
+            if item is None:
+                break
+            batch = []
+            if dropped:
+                notice = f"Client fell behind; skipped {dropped} output line(s)."
+                batch.append(_format_sse_event("status", notice, last_sequence, job_suffix))
+                dropped = 0
+            event_type, frame = item
+            batch.append(frame)
+            size = len(frame)
+            deadline = loop.time() + _SSE_BATCH_WINDOW_SECONDS
+            while event_type not in _SSE_FLUSH_NOW_TYPES and size < _SSE_BATCH_MAX_BYTES:
+                try:
+                    await wait_for_frame(deadline - loop.time())
+                except TimeoutError:
+                    break
+                item = buffer.popleft()
+                if item is None:
+                    finished = True
+                    break
+                event_type, frame = item
+                batch.append(frame)
+                size += len(frame)
+            yield b"".join(batch)
     except asyncio.CancelledError:
-        yield await _format_sse_event("complete", "cancelled", 999999, job.job_id)
+        yield _format_sse_event("complete", "cancelled", 999999, job_suffix)
         raise
+    finally:
+        pump_task.cancel()
+
+
+def _completion_status(result) -> str:
+    """The ``complete`` event data matching a finished job's result."""
+    if result is None:
+        return "failed"
+    if result.cancelled:
+        return "cancelled"
+    if result.token_limit_reached:
+        return "token_limit"
+    return "success" if result.success else "failed"
+
+
+async def _replay_output(job: AsyncDispatchJob, job_suffix: bytes) -> AsyncGenerator[bytes, None]:
+    """Re-send a drained job's output from its output file, then its completion.
+
+    The file is read in _REPLAY_CHUNK_BYTES blocks and every block's lines go
+    out as one write, so a long transcript costs a few large writes rather
+    than a frame-by-frame walk through the job's event queue.
+    """
+    sequence = 0
+    output_file = job.output_file
+    if output_file is not None and output_file.exists():
+        with open(output_file, "rb") as handle:
+            pending = b""
+            while True:
+                chunk = await run_in_threadpool(handle.read, _REPLAY_CHUNK_BYTES)
+                if not chunk:
+                    break
+                *lines, pending = (pending + chunk).split(b"\n")
+                frames = []
+                for line in lines:
+                    sequence += 1
+                    text = line.decode("utf-8", errors="replace")
+                    frames.append(_format_sse_event("output", text, sequence, job_suffix))
+                if frames:
+                    yield b"".join(frames)
+            if pending:
+                sequence += 1
+                text = pending.decode("utf-8", errors="replace")
+                yield _format_sse_event("output", text, sequence, job_suffix)
+    sequence += 1
+    yield _format_sse_event("complete", _completion_status(job.get_result()), sequence, job_suffix)
 
 
 @router.post("/start")
@@ -158,20 +303,18 @@ async def stream_start(request: StreamStartRequest) -> StreamStartResponse:
         timeout_seconds=900,
     )
 
-    async with _stream_jobs_lock:
-        # Cleanup old jobs first
-        await _cleanup_old_jobs()
-
-        if len(_stream_jobs) >= _MAX_STREAM_JOBS:
-            raise HTTPException(
-                status_code=503,
-                detail="Too many active streaming jobs",
-            )
+    _cleanup_old_jobs()
+    if len(_stream_jobs) >= _MAX_STREAM_JOBS:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many active streaming jobs",
+        )
 
-        _stream_jobs[job_id] = job
+    _stream_jobs[job_id] = job
 
     # Start the job
     job.start(output_file=output_file)
+    job.add_done_callback(lambda: _schedule_expiry(job_id))
 
     return StreamStartResponse(
         job_id=job_id,
@@ -204,18 +347,24 @@ async def stream_events(job_id: str) -> StreamingResponse:
     - error: An error occurred
     - complete: Job finished (data is "success", "failed", "cancelled", or "token_limit")
     """
-    async with _stream_jobs_lock:
-        job = _stream_jobs.get(job_id)
-
+    job = _stream_jobs.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Streaming job not found")
 
-    async def event_generator() -> AsyncGenerator[str, None]:
+    job_suffix = _sse_job_suffix(job_id)
+
+    async def event_generator() -> AsyncGenerator[bytes, None]:
         # Send initial start event
-        yield await _format_sse_event("start", "Connected to dispatch stream", 0, job_id)
+        yield _format_sse_event("start", "Connected to dispatch stream", 0, job_suffix)
+
+        if job_id in _drained_jobs and not job.is_running:
+            # Reconnect after the live stream already ended.
+            async for event in _replay_output(job, job_suffix):
+                yield event
+            return
 
         # Stream events from the job
-        async for event in _stream_events(job):
+        async for event in _stream_events(job, job_suffix):
             yield event
 
     return StreamingResponse(
@@ -232,10 +381,8 @@ async def stream_events(job_id: str) -> StreamingResponse:
 @router.post("/{job_id}/cancel")
 async def stream_cancel(job_id: str) -> StreamCancelResponse:
     """Cancel a running streaming dispatch job."""
-    await _cleanup_old_jobs()
-    async with _stream_jobs_lock:
-        job = _stream_jobs.get(job_id)
-
+    _cleanup_old_jobs()
+    job = _stream_jobs.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Streaming job not found")
 
@@ -265,10 +412,8 @@ async def stream_status(job_id: str) -> dict:
 
     Useful for checking job state without connecting to the stream.
     """
-    await _cleanup_old_jobs()
-    async with _stream_jobs_lock:
-        job = _stream_jobs.get(job_id)
-
+    _cleanup_old_jobs()
+    job = _stream_jobs.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Streaming job not found")
 
@@ -2,7 +2,8 @@
 Quality Gates API routes
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import Optional
 from pathlib import Path
@@ -15,17 +16,22 @@ logger = logging.getLogger(__name__)
 # Import core modules
 try:
     from src.agents.gates import QualityGateRunner, GateReport, GateResult
-    from src.core.project import ProjectRegistry
     from src.core.gate_results import GateResultStore
-    from src.core.runtime import project_id_for_path
+    from src.core.runtime import project_id_for_path, project_runtime_dir_for_path
     CORE_AVAILABLE = True
 except ImportError as e:
     logger.warning(f"Core modules not available: {e}")
     CORE_AVAILABLE = False
 
+from .. import fast_json
+from ..project_index import find_project_path
 from ..ttl_cache import get as cache_get, put as cache_put
 
 
+# Gate statuses that do not hold a report back from "pass"
+_PASSING_STATUSES = frozenset({"pass", "skipped"})
+
+
 class FindingResponse(BaseModel):
     severity: str
     description: str
@@ -65,22 +71,125 @@ def _get_project_path(project_id: str) -> Path | None:
     if path.exists():
         return path
     if CORE_AVAILABLE:
-        registry = ProjectRegistry.load_or_create()
-        for project in registry.list_projects():
-            if str(project.path) == project_id or project.name == project_id:
-                return project.path
+        return find_project_path(project_id)
     return None
 
 
+def _run_all_gates(project_path: Path) -> "GateReport":
+    """Run every configured gate against the full working tree."""
+    runner = QualityGateRunner(project_path)
+    runner.load_config()
+    return runner.run_all_gates(staged_only=False, trigger="api")
+
+
+def _gate_results_fingerprint(project_path: Path) -> tuple:
+    """(mtime_ns, size) of the latest report and gate config files.
+
+    ``get_gate_results`` is a pure function of these two files, so its
+    serialized payload stays valid for as long as the fingerprint does.
+    """
+    runtime_dir = project_runtime_dir_for_path(project_path)
+    stamps = []
+    for path in (runtime_dir / "gate-results" / "latest.json", runtime_dir / "gates.json"):
+        try:
+            stat = path.stat()
+        except OSError:
+            stamps.append(None)
+        else:
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamps)
+
+
+def _json_response(result: GateReportResponse) -> Response:
+    """Encode a report response once so the bytes can be cached and reused."""
+    return Response(content=fast_json.dumps(result.model_dump()), media_type="application/json")
+
+
 def _compute_overall_status(gates: list) -> str:
-    """Compute overall status from gate results."""
-    has_fail = any(g.status == "fail" for g in gates)
-    has_warn = any(g.status == "warn" for g in gates)
-    if has_fail:
-        return "fail"
-    if has_warn:
-        return "warn"
-    return "pass"
+    """Overall status in one pass, matching GateReport.has_failures/all_passed.
+
+    "fail" if any gate failed, "pass" if every non-skipped gate passed,
+    otherwise "warn".
+    """
+    overall = "pass"
+    for gate in gates:
+        status = gate.status
+        if status == "fail":
+            return "fail"
+        if status not in _PASSING_STATUSES:
+            overall = "warn"
+    return overall
+
+
+def _gate_response(gate: "GateResult") -> GateResponse:
+    """Convert a gate result into its API response model.
+
+    Results come straight from QualityGateRunner, so the models are built
+    with model_construct() rather than re-validated.
+    """
+    return GateResponse.model_construct(
+        name=gate.name,
+        status=gate.status,
+        message=gate.message,
+        detail=gate.details,
+        findings=[
+            FindingResponse.model_construct(
+                severity=f.severity,
+                description=f.description,
+                file=f.file,
+                line=f.line,
+            )
+            for f in gate.findings
+        ],
+        durationSeconds=gate.duration_seconds,
+        hardStop=gate.hard_stop,
+        costEstimate=gate.cost_estimate,
+    )
+
+
+def _pending_gate_response(cfg) -> GateResponse:
+    """Placeholder response for a configured gate without a result."""
+    return GateResponse.model_construct(
+        name=cfg.name,
+        status="pending",
+        message="Not yet run" if cfg.enabled else "Disabled",
+        detail=cfg.agent_prompt if cfg.gate_type == "hook" else None,
+        findings=[],
+        durationSeconds=0.0,
+        hardStop=cfg.hard_stop,
+        costEstimate=0.0,
+    )
+
+
+def _report_response(report: "GateReport", gates: list[GateResponse]) -> GateReportResponse:
+    """Wrap response gates with the report's run metadata."""
+    return GateReportResponse.model_construct(
+        gates=gates,
+        runId=report.run_id,
+        timestamp=report.timestamp.isoformat(),
+        trigger=report.trigger,
+        overallStatus=_compute_overall_status(report.results),
+        changedFiles=report.changed_files,
+    )
+
+
+def _build_gate_response(report: "GateReport | None", configured: dict) -> GateReportResponse:
+    """Reported gates followed by pending entries for unreported configured gates."""
+    gates = [_gate_response(gate) for gate in report.results] if report else []
+    reported_names = {gate.name for gate in gates}
+    gates.extend(
+        _pending_gate_response(cfg) for cfg in configured.values() if cfg.name not in reported_names
+    )
+    if report:
+        return _report_response(report, gates)
+    return GateReportResponse.model_construct(
+        gates=gates,
+        runId="",
+        timestamp="",
+        trigger="none",
+        overallStatus="pending",
+        changedFiles=[],
+    )
 
 
 def _status_to_score(status: str) -> float:
@@ -114,20 +223,22 @@ def get_gate_history(
     try:
         pid = project_id_for_path(project_path)
         store = GateResultStore(pid)
-        reports = store.load_history(limit=20)
+        runs = store.load_status_history(limit=20)
     except Exception as e:
         logger.error(f"Failed to load gate history: {e}")
         return {}
 
     # Group by gate name, chronological order (oldest first)
     history: dict[str, list[GateHistoryPointResponse]] = defaultdict(list)
-    for report in reversed(reports):
-        for gate in report.gates:
-            history[gate.name].append(
-                GateHistoryPointResponse(
-                    timestamp=report.timestamp.isoformat(),
-                    status=gate.status,
-                    score=_status_to_score(gate.status),
+    for run in reversed(runs):
+        timestamp = run.get("timestamp", "")
+        for gate in run.get("gates", []):
+            status = gate.get("status", "error")
+            history[gate.get("name", "unknown")].append(
+                GateHistoryPointResponse.model_construct(
+                    timestamp=timestamp,
+                    status=status,
+                    score=_status_to_score(status),
                 )
             )
 
@@ -152,10 +263,13 @@ def get_gate_results(project_id: str) -> GateReportResponse:
     if not project_path:
         raise HTTPException(status_code=404, detail="Project not found")
 
+    # Keyed on the files the response is built from rather than a short TTL,
+    # so dashboard polls reuse the encoded payload until a run lands.
     cache_key = f"gates:results:{project_path}"
+    fingerprint = _gate_results_fingerprint(project_path)
     cached = cache_get(cache_key)
-    if cached is not None:
-        return cached
+    if cached is not None and cached[0] == fingerprint:
+        return Response(content=cached[1], media_type="application/json")
 
     try:
         runner = QualityGateRunner(project_path)
@@ -179,82 +293,9 @@ def get_gate_results(project_id: str) -> GateReportResponse:
     except Exception:
         pass  # Best-effort — fall through with whatever config we have.
 
-    if not report:
-        # No previous run — return all gate definitions as "pending".
-        pending_gates = [
-            GateResponse(
-                name=cfg.name,
-                status="pending",
-                message="Not yet run" if cfg.enabled else "Disabled",
-                detail=cfg.agent_prompt if cfg.gate_type == "hook" else None,
-                findings=[],
-                durationSeconds=0.0,
-                hardStop=cfg.hard_stop,
-                costEstimate=0.0,
-            )
-            for cfg in runner.gates.values()
-        ]
-        result = GateReportResponse(
-            gates=pending_gates,
-            runId="",
-            timestamp="",
-            trigger="none",
-            overallStatus="pending",
-            changedFiles=[],
-        )
-        cache_put(cache_key, result, ttl=10)
-        return result
-
-    # Build response gates from report results.
-    reported_names: set[str] = set()
-    response_gates: list[GateResponse] = []
-    for gate in report.results:
-        reported_names.add(gate.name)
-        response_gates.append(GateResponse(
-            name=gate.name,
-            status=gate.status,
-            message=gate.message,
-            detail=gate.details,
-            findings=[
-                FindingResponse(
-                    severity=f.severity,
-                    description=f.description,
-                    file=f.file,
-                    line=f.line,
-                )
-                for f in gate.findings
-            ],
-            durationSeconds=gate.duration_seconds,
-            hardStop=gate.hard_stop,
-            costEstimate=gate.cost_estimate,
-        ))
-
-    # Supplement with "pending" entries for any configured gates missing
-    # from the report (stale report from before all gates ran).
-    for cfg in runner.gates.values():
-        if cfg.name in reported_names:
-            continue
-        response_gates.append(GateResponse(
-            name=cfg.name,
-            status="pending",
-            message="Not yet run" if cfg.enabled else "Disabled",
-            detail=cfg.agent_prompt if cfg.gate_type == "hook" else None,
-            findings=[],
-            durationSeconds=0.0,
-            hardStop=cfg.hard_stop,
-            costEstimate=0.0,
-        ))
-
-    result = GateReportResponse(
-        gates=response_gates,
-        runId=report.run_id,
-        timestamp=report.timestamp.isoformat(),
-        trigger=report.trigger,
-        overallStatus="fail" if report.has_failures else ("pass" if report.all_passed else "warn"),
-        changedFiles=report.changed_files,
-    )
-    cache_put(cache_key, result, ttl=10)
-    return result
+    response = _json_response(_build_gate_response(report, runner.gates))
+    cache_put(cache_key, (fingerprint, response.body), ttl=300)
+    return response
 
 
 @router.post("/{project_id:path}/run")
@@ -272,38 +313,11 @@ async def run_gates(project_id: str) -> GateReportResponse:
         raise HTTPException(status_code=404, detail="Project not found")
 
     try:
-        runner = QualityGateRunner(project_path)
-        runner.load_config()
-        report = runner.run_all_gates(staged_only=False, trigger="api")
+        # Gate runs take minutes of subprocess work; keep the event loop free
+        # for dispatch streams in the meantime.
+        report = await run_in_threadpool(_run_all_gates, project_path)
     except Exception as e:
         logger.error(f"Failed to run gates: {e}")
         raise HTTPException(status_code=500, detail=f"Gate run failed: {e}")
 
-    return GateReportResponse(
-        gates=[
-            GateResponse(
-                name=gate.name,
-                status=gate.status,
-                message=gate.message,
-                detail=gate.details,
-                findings=[
-                    FindingResponse(
-                        severity=f.severity,
-                        description=f.description,
-                        file=f.file,
-                        line=f.line,
-                    )
-                    for f in gate.findings
-                ],
-                durationSeconds=gate.duration_seconds,
-                hardStop=gate.hard_stop,
-                costEstimate=gate.cost_estimate,
-            )
-            for gate in report.results
-        ],
-        runId=report.run_id,
-        timestamp=report.timestamp.isoformat(),
-        trigger=report.trigger,
-        overallStatus="fail" if report.has_failures else ("pass" if report.all_passed else "warn"),
-        changedFiles=report.changed_files,
-    )
+    return _report_response(report, [_gate_response(gate) for gate in report.results])
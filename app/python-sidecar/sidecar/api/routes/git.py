@@ -2,19 +2,51 @@
 Git API routes
 """
 
-from concurrent.futures import ThreadPoolExecutor
-from fastapi import APIRouter, HTTPException, Query
+import asyncio
+import functools
+from collections import Counter, OrderedDict
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from starlette.concurrency import run_in_threadpool
 from typing import Optional
 from pathlib import Path
 import logging
+import os
+import re
+import threading
+import time
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# Shared thread pool for parallelizing git subprocess calls
-_git_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="git")
+# Seconds allowed for all git calls behind one status request
+_GIT_STATUS_TIMEOUT_SECONDS = 15
+
+# Status output size (chars) from which parsing leaves the event loop;
+# about 2,000 entries, where parse_status_v2 starts to take milliseconds.
+_STATUS_PARSE_OFFLOAD_CHARS = 256 * 1024
+
+# Seconds a project ID's resolved path is reused. Misses expire sooner so a
+# project registered just after a failed lookup shows up quickly.
+_PROJECT_PATH_TTL_SECONDS = 30
+_UNKNOWN_PROJECT_TTL_SECONDS = 5
+
+# Encoded /status and /commits payloads as (expires_at, body), keyed by
+# project path (and limit for commits). Both routes run on the event loop
+# only, so plain dicts need no lock and a poll costs one lookup.
+_STATUS_TTL_SECONDS = 3
+_COMMITS_TTL_SECONDS = 5
+_RESPONSE_CACHE_PRUNE_SIZE = 64
+# Commits encoded per chunk written to a streamed /commits response
+_COMMITS_STREAM_BATCH = 50
+_status_cache: dict[Path, tuple[float, bytes]] = {}
+_commits_cache: dict[tuple[Path, int], tuple[float, bytes]] = {}
+
+# GitUtils per project path, most recently used last
+_GIT_CACHE_MAX = 32
+_git_cache: OrderedDict[Path, "GitUtils"] = OrderedDict()
+_git_cache_lock = threading.Lock()
 
 # Maximum characters of git diff to send to the AI commit message generator.
 _MAX_DIFF_CHARS = 24000
@@ -31,8 +63,12 @@ _MODEL_LABELS: dict[str, str] = {
 }
 
 
+@functools.lru_cache(maxsize=32)
 def _model_display_name(model_id: str) -> str:
-    """Return a human-friendly model name for Co-Authored-By lines."""
+    """Return a human-friendly model name for Co-Authored-By lines.
+
+    Cached, so the title-cased fallback for unknown IDs is built once.
+    """
     if model_id in _MODEL_LABELS:
         return _MODEL_LABELS[model_id]
     # Fallback: title-case the model ID
@@ -40,14 +76,27 @@ def _model_display_name(model_id: str) -> str:
 
 # Import core modules
 try:
-    from src.core.git_utils import GitUtils, GitRepo
-    from src.core.project import ProjectRegistry
+    from src.core.git_utils import (
+        GitUtils,
+        GitRepo,
+        STASH_LIST_ARGS,
+        STATUS_BUNDLE_ARGS,
+        RECENT_COMMITS_FORMAT_ARGS,
+        UNPUSHED_LOG_ARGS,
+        assemble_status_bundle,
+        parse_commit_line,
+        parse_log_records,
+        parse_numstat,
+        parse_status_v2,
+    )
     from src.agents.dispatcher import dispatch_task
     CORE_AVAILABLE = True
 except ImportError as e:
     logger.warning(f"Core modules not available: {e}")
     CORE_AVAILABLE = False
 
+from .. import cli_prewarm, fast_json
+from ..project_index import find_project_path
 from ..ttl_cache import get as cache_get, put as cache_put
 
 
@@ -193,20 +242,156 @@ class AIGenerateMessageResponse(BaseModel):
 
 
 def _get_project_path(project_id: str) -> Path | None:
-    """Get project path from ID."""
+    """Get project path from ID.
+
+    Resolutions are cached per ID, misses included, so the polled status
+    and commits routes skip the stat and registry lookup on most ticks.
+    """
+    cache_key = f"git:projpath:{project_id}"
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return cached[0]
     path = Path(project_id)
-    if path.exists():
-        return path
-    if CORE_AVAILABLE:
-        registry = ProjectRegistry.load_or_create()
-        for project in registry.list_projects():
-            if str(project.path) == project_id or project.name == project_id:
-                return project.path
+    if not path.exists():
+        path = find_project_path(project_id) if CORE_AVAILABLE else None
+    # Wrapped in a tuple so a cached miss is distinguishable from no entry.
+    cache_put(cache_key, (path,), ttl=_PROJECT_PATH_TTL_SECONDS if path else _UNKNOWN_PROJECT_TTL_SECONDS)
+    return path
+
+
+def _get_git(project_path: Path) -> "GitUtils":
+    """Shared GitUtils for a repository, built on first use.
+
+    Instances only hold the resolved path, so one per project is reused
+    across requests (up to _GIT_CACHE_MAX, least recently used first out).
+    Paths that are not repositories yet are not cached.
+    """
+    with _git_cache_lock:
+        git = _git_cache.get(project_path)
+        if git is not None:
+            _git_cache.move_to_end(project_path)
+            return git
+    git = GitUtils(project_path)
+    if GitRepo.is_git_repo(project_path):
+        with _git_cache_lock:
+            _git_cache[project_path] = git
+            if len(_git_cache) > _GIT_CACHE_MAX:
+                _git_cache.popitem(last=False)
+    return git
+
+
+def _open_repo(project_id: str) -> tuple[Path, "GitUtils"] | None:
+    """Route dependency resolving ``project_id`` to its path and git helper.
+
+    Raises 404/400 for unknown projects and non-repositories. Returns None
+    when core modules are unavailable so routes can send their fallback
+    response. Being a sync dependency, FastAPI runs it in the threadpool,
+    so its stat and registry reads never block the event loop.
+    """
+    if not CORE_AVAILABLE:
+        return None
+    project_path = _get_project_path(project_id)
+    if not project_path:
+        raise HTTPException(status_code=404, detail="Project not found")
+    try:
+        return project_path, _get_git(project_path)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Not a git repository: {e}")
+
+
+async def _run_git(args: tuple[str, ...], cwd: Path) -> tuple[str, int]:
+    """Run git as a child of the event loop and return (stdout, returncode).
+
+    Mirrors GitRepo._run_git without holding a worker thread while git runs.
+    The child is killed if the awaiting request is cancelled or times out.
+    stderr is never read, so it goes to /dev/null rather than a second pipe
+    the loop would have to watch and drain.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "git", *args,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except FileNotFoundError:
+        return "", 1
+    try:
+        stdout, _ = await proc.communicate()
+    except asyncio.CancelledError:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+    return stdout.decode("utf-8", errors="replace").rstrip("\n"), proc.returncode
+
+
+async def _git_output(args: tuple[str, ...], cwd: Path, needed: bool = True) -> str:
+    """stdout of a git call, or "" when it is not needed or fails."""
+    if not needed:
+        return ""
+    output, code = await _run_git(args, cwd)
+    return output if code == 0 else ""
+
+
+async def _status_bundle(project_path: Path, git: "GitUtils") -> dict:
+    """Async GitUtils.status_bundle(): one status call, then the needed follow-ups at once."""
+    if not GitRepo.is_git_repo(project_path):
+        # git would report an enclosing repository; GitUtils has no repo
+        # here, so this is its empty bundle and starts no git process.
+        return git.status_bundle()
+
+    output, code = await _run_git(STATUS_BUNDLE_ARGS, project_path)
+    if code != 0:
+        return await run_in_threadpool(git.status_bundle)
+
+    if len(output) >= _STATUS_PARSE_OFFLOAD_CHARS:
+        status = await run_in_threadpool(parse_status_v2, output)
+    else:
+        status = parse_status_v2(output)
+    staged_numstat, numstat, unpushed, stashes = await asyncio.gather(
+        _git_output(("diff", "--cached", "--numstat"), project_path, bool(status["staged"])),
+        _git_output(("diff", "--numstat"), project_path, bool(status["modified"])),
+        _git_output(UNPUSHED_LOG_ARGS, project_path, bool(status["ahead"])),
+        _git_output(STASH_LIST_ARGS, project_path, status["stash_count"] != 0),
+    )
+    return assemble_status_bundle(
+        status,
+        staged_line_stats=parse_numstat(staged_numstat),
+        line_stats=parse_numstat(numstat),
+        unpushed=parse_log_records(unpushed, ("hash", "message", "time")),
+        stashes=parse_log_records(stashes, ("id", "message", "time")),
+    )
+
+
+def _cached_body(cache: dict, key) -> bytes | None:
+    """Body cached under ``key`` if it has not expired."""
+    entry = cache.get(key)
+    if entry is not None and time.monotonic() < entry[0]:
+        return entry[1]
     return None
 
 
+def _store_body(cache: dict, key, body: bytes, ttl: float) -> None:
+    """Cache ``body`` for ``ttl`` seconds, dropping expired entries once the cache grows."""
+    now = time.monotonic()
+    if len(cache) >= _RESPONSE_CACHE_PRUNE_SIZE:
+        for stale in [k for k, (expires_at, _body) in cache.items() if expires_at <= now]:
+            del cache[stale]
+    cache[key] = (now + ttl, body)
+
+
+def _json_bytes_response(body: bytes) -> Response:
+    """Send pre-encoded JSON, skipping FastAPI's validate-and-encode pass.
+
+    The polled status and commits routes encode their models once with
+    fast_json and cache the bytes, so repeat polls only copy them out.
+    """
+    return Response(content=body, media_type="application/json")
+
+
 @router.get("/{project_id:path}/status")
-def get_git_status(project_id: str) -> GitStatusResponse:
+async def get_git_status(repo: tuple = Depends(_open_repo)) -> GitStatusResponse:
     """Get git status (unpushed, staged, uncommitted, stashes)"""
     if not CORE_AVAILABLE:
         return GitStatusResponse(
@@ -219,130 +404,141 @@ def get_git_status(project_id: str) -> GitStatusResponse:
             submodule_issues=[],
         )
 
-    project_path = _get_project_path(project_id)
-    if not project_path:
-        raise HTTPException(status_code=404, detail="Project not found")
+    project_path, git = repo
 
-    cache_key = f"git:status:{project_path}"
-    cached = cache_get(cache_key)
+    cached = _cached_body(_status_cache, project_path)
     if cached is not None:
-        return cached
+        return _json_bytes_response(cached)
 
-    try:
-        git = GitUtils(project_path)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Not a git repository: {e}")
-
-    # Run independent git operations in parallel instead of sequentially
-    branch_future = _git_pool.submit(git.current_branch)
-    status_future = _git_pool.submit(git.get_status_detailed)
-    unpushed_future = _git_pool.submit(git.unpushed_commits)
-    stash_future = _git_pool.submit(git.list_stashes)
-
-    branch = branch_future.result(timeout=15)
-    status_data = status_future.result(timeout=15)
-    unpushed_commits = unpushed_future.result(timeout=15)
-    stashes = stash_future.result(timeout=15)
+    # One porcelain v2 status call covers branch, files, ahead and stash
+    # counts; git runs as event-loop children rather than on worker threads.
+    bundle = await asyncio.wait_for(
+        _status_bundle(project_path, git), timeout=_GIT_STATUS_TIMEOUT_SECONDS
+    )
 
-    result = GitStatusResponse(
-        branch=branch,
+    # Built from parsed git output, so the models skip validation.
+    result = GitStatusResponse.model_construct(
+        branch=bundle["branch"],
         unpushed=[
-            UnpushedCommitResponse(
+            UnpushedCommitResponse.model_construct(
                 hash=c.get("hash", "")[:7],
                 msg=c.get("message", ""),
                 time=c.get("time", ""),
             )
-            for c in unpushed_commits
+            for c in bundle["unpushed"]
         ],
         staged=[
-            UncommittedFileResponse(
+            UncommittedFileResponse.model_construct(
                 file=f["path"],
                 status=f.get("status", "A"),
                 lines=f.get("lines"),
             )
-            for f in status_data.get("staged", [])
+            for f in bundle["staged"]
         ],
         uncommitted=[
-            UncommittedFileResponse(
+            UncommittedFileResponse.model_construct(
                 file=f["path"],
                 status=f.get("status", "M"),
                 lines=f.get("lines"),
             )
-            for f in status_data.get("modified", [])
+            for f in bundle["modified"]
         ],
         untracked=[
-            UntrackedFileResponse(file=f)
-            for f in status_data.get("untracked", [])
+            UntrackedFileResponse.model_construct(file=f)
+            for f in bundle["untracked"]
         ],
         stashed=[
-            StashResponse(
+            StashResponse.model_construct(
                 id=s.get("id", ""),
                 msg=s.get("message", ""),
                 time=s.get("time", ""),
             )
-            for s in stashes
+            for s in bundle["stashes"]
         ],
         submodule_issues=[
-            SubmoduleIssueResponse(file=f)
-            for f in status_data.get("submodule_issues", [])
+            SubmoduleIssueResponse.model_construct(file=f)
+            for f in bundle["submodule_issues"]
         ],
     )
-    cache_put(cache_key, result, ttl=3)
-    return result
+    body = fast_json.dumps(result.model_dump())
+    _store_body(_status_cache, project_path, body, _STATUS_TTL_SECONDS)
+    return _json_bytes_response(body)
 
 
 @router.get("/{project_id:path}/commits")
-def get_commits(project_id: str, limit: int = Query(30, ge=1, le=500)) -> list[CommitResponse]:
+async def get_commits(repo: tuple = Depends(_open_repo), limit: int = Query(30, ge=1, le=500)) -> list[CommitResponse]:
     """Get recent commits"""
     if not CORE_AVAILABLE:
         return []
 
-    project_path = _get_project_path(project_id)
-    if not project_path:
-        raise HTTPException(status_code=404, detail="Project not found")
+    project_path, git = repo
+    if not GitRepo.is_git_repo(project_path):
+        # git log would walk an enclosing repository's history.
+        return []
 
-    cache_key = f"git:commits:{project_path}:{limit}"
-    cached = cache_get(cache_key)
+    cached = _cached_body(_commits_cache, (project_path, limit))
     if cached is not None:
-        return cached
+        return _json_bytes_response(cached)
 
-    try:
-        git = GitUtils(project_path)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Not a git repository: {e}")
+    return StreamingResponse(_stream_commits(project_path, limit), media_type="application/json")
 
-    commits = git.recent_commits(limit=limit)
 
-    result = [
-        CommitResponse(
-            hash=c.get("hash", "")[:7],
-            msg=c.get("message", ""),
-            branch=c.get("branch", "unknown"),
-            date=c.get("date", ""),
-            time=c.get("time", ""),
-            merge=c.get("is_merge", None),
+async def _stream_commits(project_path: Path, limit: int):
+    """Yield the /commits JSON array in batches as ``git log`` produces lines.
+
+    The first commits reach the client before git has walked the whole
+    range; the assembled body is cached once the stream completes.
+    """
+    branch, _ = await _run_git(("rev-parse", "--abbrev-ref", "HEAD"), project_path)
+    branch = branch or "unknown"
+    encoded: list[bytes] = []
+    flushed = 0
+    yield b"["
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "git", "log", f"-{limit}", *RECENT_COMMITS_FORMAT_ARGS,
+            cwd=project_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
         )
-        for c in commits
-    ]
-    cache_put(cache_key, result, ttl=5)
-    return result
+    except FileNotFoundError:
+        proc = None
+    if proc is not None:
+        try:
+            async for raw in proc.stdout:
+                commit = parse_commit_line(raw.decode("utf-8", errors="replace").rstrip("\n"), branch)
+                if commit is None:
+                    continue
+                encoded.append(fast_json.dumps(CommitResponse.model_construct(
+                    hash=commit["hash"][:7],
+                    msg=commit["message"],
+                    branch=commit["branch"],
+                    date=commit["date"],
+                    time=commit["time"],
+                    merge=commit["is_merge"],
+                ).model_dump()))
+                if len(encoded) - flushed >= _COMMITS_STREAM_BATCH:
+                    yield (b"," if flushed else b"") + b",".join(encoded[flushed:])
+                    flushed = len(encoded)
+            await proc.wait()
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+    if len(encoded) > flushed:
+        yield (b"," if flushed else b"") + b",".join(encoded[flushed:])
+    yield b"]"
+    _store_body(_commits_cache, (project_path, limit), b"[" + b",".join(encoded) + b"]", _COMMITS_TTL_SECONDS)
 
 
 @router.get("/{project_id:path}/stashes")
-async def get_stashes(project_id: str) -> list[StashResponse]:
+def get_stashes(repo: tuple = Depends(_open_repo)) -> list[StashResponse]:
     """Get git stashes"""
     if not CORE_AVAILABLE:
         # Core modules not available - return empty data
         return []
 
-    project_path = _get_project_path(project_id)
-    if not project_path:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    try:
-        git = GitUtils(project_path)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Not a git repository: {e}")
+    project_path, git = repo
 
     stashes = git.list_stashes()
 
@@ -357,96 +553,60 @@ async def get_stashes(project_id: str) -> list[StashResponse]:
 
 
 @router.post("/{project_id:path}/push")
-async def push_to_remote(project_id: str) -> ActionResponse:
+def push_to_remote(repo: tuple = Depends(_open_repo)) -> ActionResponse:
     """Push current branch to origin"""
     if not CORE_AVAILABLE:
         return ActionResponse(success=False, message="Core modules not available")
 
-    project_path = _get_project_path(project_id)
-    if not project_path:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    try:
-        git = GitUtils(project_path)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Not a git repository: {e}")
+    project_path, git = repo
 
     success, message = git.push_to_remote()
     return ActionResponse(success=success, message=message)
 
 
 @router.post("/{project_id:path}/commit")
-async def commit_all(project_id: str, request: CommitRequest) -> ActionResponse:
+def commit_all(request: CommitRequest, repo: tuple = Depends(_open_repo)) -> ActionResponse:
     """Stage all changes and commit"""
     if not CORE_AVAILABLE:
         return ActionResponse(success=False, message="Core modules not available")
 
-    project_path = _get_project_path(project_id)
-    if not project_path:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    try:
-        git = GitUtils(project_path)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Not a git repository: {e}")
+    project_path, git = repo
 
     success, message, commit_hash = git.commit_all(request.message)
     return ActionResponse(success=success, message=message, hash=commit_hash)
 
 
 @router.post("/{project_id:path}/stash/pop")
-async def stash_pop(project_id: str) -> ActionResponse:
+def stash_pop(repo: tuple = Depends(_open_repo)) -> ActionResponse:
     """Pop the most recent stash"""
     if not CORE_AVAILABLE:
         return ActionResponse(success=False, message="Core modules not available")
 
-    project_path = _get_project_path(project_id)
-    if not project_path:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    try:
-        git = GitUtils(project_path)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Not a git repository: {e}")
+    project_path, git = repo
 
     success, message = git.stash_pop()
     return ActionResponse(success=success, message=message)
 
 
 @router.post("/{project_id:path}/stash/drop")
-async def stash_drop(project_id: str, request: StashDropRequest) -> ActionResponse:
+def stash_drop(request: StashDropRequest, repo: tuple = Depends(_open_repo)) -> ActionResponse:
     """Drop a stash (defaults to most recent)"""
     if not CORE_AVAILABLE:
         return ActionResponse(success=False, message="Core modules not available")
 
-    project_path = _get_project_path(project_id)
-    if not project_path:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    try:
-        git = GitUtils(project_path)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Not a git repository: {e}")
+    project_path, git = repo
 
     success, message = git.stash_drop(request.stash_id)
     return ActionResponse(success=success, message=message)
 
 
-def _categorize_files(files: list[dict]) -> tuple[list[str], list[str], list[str]]:
-    """Split file dicts into (added, modified, deleted) path lists."""
-    added: list[str] = []
-    modified: list[str] = []
-    deleted: list[str] = []
-    for f in files:
-        status = f.get("status", "M")
-        path = f.get("path", f.get("file", "unknown"))
-        if status in ("?", "A"):
-            added.append(path)
-        elif status == "D":
-            deleted.append(path)
-        else:
-            modified.append(path)
-    return added, modified, deleted
+# Commit types implied by path keywords (case-insensitive), in priority
+# order: any test path wins over docs, any docs path over fix.
+_PATH_COMMIT_TYPES = (
+    ("test", re.compile(r"test|spec", re.IGNORECASE)),
+    ("docs", re.compile(r"readme|docs?/|\.md", re.IGNORECASE)),
+    ("fix", re.compile(r"fix|bug|patch", re.IGNORECASE)),
+)
 
 
 def _infer_commit_type(
@@ -456,13 +616,10 @@ def _infer_commit_type(
     deleted: list[str],
 ) -> str:
     """Infer conventional commit type from file paths and change kinds."""
-    paths_lower = " ".join(all_files).lower()
-    if any(p in paths_lower for p in ["test", "spec", "__test__"]):
-        return "test"
-    if any(p in paths_lower for p in ["readme", "docs/", "doc/", ".md"]):
-        return "docs"
-    if any(p in paths_lower for p in ["fix", "bug", "patch"]):
-        return "fix"
+    paths = "\n".join(all_files)
+    for commit_type, pattern in _PATH_COMMIT_TYPES:
+        if pattern.search(paths):
+            return commit_type
     if added and not modified and not deleted:
         return "feat"
     if modified and not added:
@@ -470,52 +627,63 @@ def _infer_commit_type(
     return "chore"
 
 
-def _infer_scope(all_files: list[str]) -> str | None:
-    """Derive a conventional-commit scope from common directory of changed files."""
-    from collections import Counter
-
-    dirs = [Path(f).parent.as_posix() for f in all_files if "/" in f or "\\" in f]
-    if not dirs:
-        return None
-    top_dirs = [d.split("/")[0] for d in dirs if d and d != "."]
-    if not top_dirs:
-        return None
-    scope = Counter(top_dirs).most_common(1)[0][0]
-    if scope in ("src", "lib", "app"):
-        deeper = [d.split("/")[1] for d in dirs if len(d.split("/")) > 1]
-        if deeper:
-            scope = Counter(deeper).most_common(1)[0][0]
-    return scope
-
-
-def _build_description(all_files: list[str]) -> str:
-    """Build a short description string from the changed file list."""
-    file_count = len(all_files)
-    if file_count == 1:
-        return Path(all_files[0]).name
-    if file_count <= 3:
-        return ", ".join(Path(f).name for f in all_files[:3])
-    exts = set(Path(f).suffix for f in all_files)
-    if len(exts) == 1:
-        return f"{file_count} {list(exts)[0]} files"
-    first_three = ", ".join(Path(f).name for f in all_files[:3])
-    return f"{first_three} and {file_count - 3} more"
+# Top-level directories too generic to use as a commit scope on their own
+_GENERIC_SCOPES = ("src", "lib", "app")
 
 
 def _generate_commit_message(files: list[dict]) -> tuple[str, str]:
     """Generate a conventional commit message from changed files.
 
+    One pass over ``files`` splits them by change kind and tallies the
+    directories and extensions used for the scope and description, working
+    on the path strings directly.
+
     Returns (commit_message, summary).
     """
     if not files:
         return "chore: empty commit", "No files changed"
 
-    added, modified, deleted = _categorize_files(files)
+    # (paths, top-level dir counts, second-level dir counts) per change kind;
+    # the counters are merged in added/modified/deleted order afterwards so
+    # most_common() breaks ties the same way as a scan of all_files would.
+    added, modified, deleted = (([], Counter(), Counter()) for _ in range(3))
+    exts: set[str] = set()
+    for f in files:
+        status = f.get("status", "M")
+        path = f.get("path", f.get("file", "unknown"))
+        if status in ("?", "A"):
+            paths, top_dirs, second_dirs = added
+        elif status == "D":
+            paths, top_dirs, second_dirs = deleted
+        else:
+            paths, top_dirs, second_dirs = modified
+        paths.append(path)
+        # "top/second/name": the parent directory's first and second segments
+        segments = path.split("/", 2)
+        if len(segments) > 1:
+            top_dirs[segments[0]] += 1
+            if len(segments) > 2:
+                second_dirs[segments[1]] += 1
+        exts.add(os.path.splitext(path.rpartition("/")[2])[1])
+
+    top_dirs = added[1] + modified[1] + deleted[1]
+    second_dirs = added[2] + modified[2] + deleted[2]
+    added, modified, deleted = added[0], modified[0], deleted[0]
     all_files = added + modified + deleted
-
     commit_type = _infer_commit_type(all_files, added, modified, deleted)
-    scope = _infer_scope(all_files)
-    desc = _build_description(all_files)
+
+    scope = top_dirs.most_common(1)[0][0] if top_dirs else None
+    if scope in _GENERIC_SCOPES and second_dirs:
+        scope = second_dirs.most_common(1)[0][0]
+
+    file_count = len(all_files)
+    first_names = [f.rpartition("/")[2] for f in all_files[:3]]
+    if file_count <= 3:
+        desc = ", ".join(first_names)
+    elif len(exts) == 1:
+        desc = f"{file_count} {next(iter(exts))} files"
+    else:
+        desc = f"{', '.join(first_names)} and {file_count - 3} more"
 
     verb = "update"
     if added and not modified and not deleted:
@@ -539,40 +707,64 @@ def _generate_commit_message(files: list[dict]) -> tuple[str, str]:
 
 _COMMIT_TYPES = ("feat", "fix", "refactor", "docs", "test", "chore", "style", "perf")
 
+# Static parts of the AI commit message prompt; only the file list and the
+# diff between them change per request.
+_COMMIT_PROMPT_HEAD = """Look at the git diff below and write ONE conventional commit message.
+
+Rules:
+- First line: type(scope): summary in imperative mood ("add" not "added")
+- Types: feat, fix, refactor, docs, test, chore, style, perf
+- After the first line, add a blank line then a body with 2-4 sentences explaining what changed and why
+- Mention key files, moved logic, new types, or wiring changes — be specific, not generic
+- Do NOT use bullet points or markdown — just plain sentences
+- Output ONLY the commit message, nothing else — no quotes, no explanation, no preamble
+
+Changed files:
+"""
+_COMMIT_PROMPT_DIFF_OPEN = "\n\nGit diff:\n```\n"
+_COMMIT_PROMPT_TAIL = "\n```"
+
+# Changed files listed in the AI commit message prompt
+_COMMIT_PROMPT_MAX_FILES = 20
+
+
+def _build_commit_prompt(file_list: list[str], diff_output: str) -> str:
+    """AI commit message prompt for the given changed files and diff."""
+    return "".join((
+        _COMMIT_PROMPT_HEAD,
+        "\n".join(["- " + f for f in file_list[:_COMMIT_PROMPT_MAX_FILES]]),
+        _COMMIT_PROMPT_DIFF_OPEN,
+        diff_output,
+        _COMMIT_PROMPT_TAIL,
+    ))
+
+
+# A conventional commit subject on its own line, optionally indented and
+# wrapped in matching quotes; group 2 is the subject without the quotes.
+_COMMIT_SUBJECT_RE = re.compile(
+    r"^[ \t]*([\"']?)((?:" + "|".join(_COMMIT_TYPES) + r")(?:\([^)\n]*\))?!?:[^\n]*?)\1[ \t]*\r?$",
+    re.MULTILINE,
+)
+
+# Markdown fence line that ends the commit body
+_FENCE_RE = re.compile(r"^[ \t]*```", re.MULTILINE)
+
 
 def _extract_commit_message(raw_output: str) -> str | None:
     """Extract the full commit message (subject + body) from Claude output.
 
-    Finds the conventional commit subject line, then captures all subsequent
-    non-decoration lines as the body.
+    Finds the first conventional commit subject line, then captures the
+    following lines up to the next markdown fence as the body.
     """
-    lines = raw_output.strip().splitlines()
-    subject_idx: int | None = None
-    subject_line: str | None = None
-
-    for i, raw in enumerate(lines):
-        line = raw.strip()
-        if not line or line.startswith("```") or line.startswith("#") or line.startswith(">"):
-            continue
-        # Strip surrounding quotes
-        if len(line) > 2 and line[0] in ('"', "'") and line[-1] == line[0]:
-            line = line[1:-1]
-        if ":" in line and any(line.startswith(t) for t in _COMMIT_TYPES):
-            subject_idx = i
-            subject_line = line
-            break
-
-    if subject_line is None:
+    match = _COMMIT_SUBJECT_RE.search(raw_output)
+    if match is None:
         return None
+    subject_line = match.group(2)
 
-    # Collect body lines after the subject
-    body_lines: list[str] = []
-    for raw in lines[subject_idx + 1 :]:
-        line = raw.strip()
-        # Stop at markdown fences or other decoration that signals end of message
-        if line.startswith("```"):
-            break
-        body_lines.append(line)
+    fence = _FENCE_RE.search(raw_output, match.end())
+    body_text = raw_output[match.end():fence.start() if fence else len(raw_output)]
+    # The first element is the remainder of the subject line.
+    body_lines = [line.strip() for line in body_text.splitlines()[1:]]
 
     # Trim trailing blank lines
     while body_lines and not body_lines[-1]:
@@ -584,7 +776,7 @@ def _extract_commit_message(raw_output: str) -> str | None:
 
 
 @router.get("/{project_id:path}/generate-message")
-async def generate_commit_message(project_id: str) -> GenerateMessageResponse:
+def generate_commit_message(repo: tuple = Depends(_open_repo)) -> GenerateMessageResponse:
     """Generate a commit message based on current changes (fast, no LLM)"""
     if not CORE_AVAILABLE:
         return GenerateMessageResponse(
@@ -593,14 +785,7 @@ async def generate_commit_message(project_id: str) -> GenerateMessageResponse:
             summary="Core modules not available"
         )
 
-    project_path = _get_project_path(project_id)
-    if not project_path:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    try:
-        git = GitUtils(project_path)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Not a git repository: {e}")
+    project_path, git = repo
 
     uncommitted = git.uncommitted_files_with_lines()
     files = [{"path": f.get("path", ""), "status": f.get("status", "M")} for f in uncommitted]
@@ -616,7 +801,7 @@ async def generate_commit_message(project_id: str) -> GenerateMessageResponse:
 
 @router.get("/{project_id:path}/generate-message-ai")
 async def generate_commit_message_ai(
-    project_id: str,
+    repo: tuple = Depends(_open_repo),
     model: str = Query(default=_COMMIT_MSG_MODEL, description="Claude model to use"),
 ) -> AIGenerateMessageResponse:
     """Generate a commit message using Claude Code to analyze the actual diff.
@@ -634,21 +819,15 @@ async def generate_commit_message_ai(
             error="Core modules not loaded"
         )
 
-    project_path = _get_project_path(project_id)
-    if not project_path:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    try:
-        git = GitUtils(project_path)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Not a git repository: {e}")
+    project_path, git = repo
 
-    # Get the diff of all changes (staged + unstaged)
+    # Get the diff of all changes (staged + unstaged), reading no more of
+    # it than the prompt can hold
     try:
-        diff_output = git.get_diff()
+        diff_output, diff_truncated = await run_in_threadpool(git.get_diff_bounded, _MAX_DIFF_CHARS)
         if not diff_output or not diff_output.strip():
             # No diff available, fall back to heuristic
-            uncommitted = git.uncommitted_files_with_lines()
+            uncommitted = await run_in_threadpool(git.uncommitted_files_with_lines)
             files = [{"path": f.get("path", ""), "status": f.get("status", "M")} for f in uncommitted]
             message, summary = _generate_commit_message(files)
             return AIGenerateMessageResponse(
@@ -668,37 +847,23 @@ async def generate_commit_message_ai(
             error=str(e)
         )
 
-    # Truncate diff if too large
-    if len(diff_output) > _MAX_DIFF_CHARS:
-        diff_output = diff_output[:_MAX_DIFF_CHARS] + "\n... [diff truncated]"
+    if diff_truncated:
+        diff_output += "\n... [diff truncated]"
 
     # Get list of changed files for context
-    uncommitted = git.uncommitted_files_with_lines()
+    uncommitted = await run_in_threadpool(git.uncommitted_files_with_lines)
     file_list = [f.get("path", "") for f in uncommitted]
 
     # Create prompt for Claude Code
-    prompt = f"""Look at the git diff below and write ONE conventional commit message.
-
-Rules:
-- First line: type(scope): summary in imperative mood ("add" not "added")
-- Types: feat, fix, refactor, docs, test, chore, style, perf
-- After the first line, add a blank line then a body with 2-4 sentences explaining what changed and why
-- Mention key files, moved logic, new types, or wiring changes — be specific, not generic
-- Do NOT use bullet points or markdown — just plain sentences
-- Output ONLY the commit message, nothing else — no quotes, no explanation, no preamble
-
-Changed files:
-{chr(10).join(f"- {f}" for f in file_list[:20])}
-
-Git diff:
-```
-{diff_output}
-```"""
+    prompt = _build_commit_prompt(file_list, diff_output)
 
     # Resolve human-friendly label for Co-Authored-By
     model_label = _model_display_name(model)
 
-    # Call Claude Code to generate the message (run in threadpool since dispatch_task blocks)
+    # Call Claude Code to generate the message (run in threadpool since dispatch_task blocks).
+    # A CLI left warm by the previous request skips start-up; another is
+    # started for the next one once this answer is in.
+    cli_proc = await run_in_threadpool(cli_prewarm.start_or_take, project_path, model)
     try:
         result = await run_in_threadpool(
             dispatch_task,
@@ -706,7 +871,10 @@ Git diff:
             working_dir=project_path,
             timeout_seconds=90,
             model=model,
+            proc=cli_proc,
         )
+        if cli_proc is not None:
+            await run_in_threadpool(cli_prewarm.prewarm, project_path, model)
 
         if result.success and result.output:
             generated_message = _extract_commit_message(result.output)
@@ -746,6 +914,8 @@ Git diff:
             )
 
     except Exception as e:
+        if cli_proc is not None:
+            await run_in_threadpool(cli_prewarm.kill, cli_proc)
         logger.exception(f"Failed to generate AI commit message: {e}")
         files = [{"path": f.get("path", ""), "status": f.get("status", "M")} for f in uncommitted]
         message, summary = _generate_commit_message(files)
@@ -759,7 +929,7 @@ Git diff:
 
 
 @router.post("/{project_id:path}/quick-commit")
-async def quick_commit(project_id: str) -> QuickCommitResponse:
+def quick_commit(repo: tuple = Depends(_open_repo)) -> QuickCommitResponse:
     """Stage all changes, generate message, and commit in one fast operation"""
     if not CORE_AVAILABLE:
         return QuickCommitResponse(
@@ -767,14 +937,7 @@ async def quick_commit(project_id: str) -> QuickCommitResponse:
             message="Core modules not available"
         )
 
-    project_path = _get_project_path(project_id)
-    if not project_path:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    try:
-        git = GitUtils(project_path)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Not a git repository: {e}")
+    project_path, git = repo
 
     # Get files before commit
     uncommitted = git.uncommitted_files_with_lines()
@@ -801,133 +964,84 @@ async def quick_commit(project_id: str) -> QuickCommitResponse:
 
 
 @router.post("/{project_id:path}/stage")
-async def stage_files(project_id: str, request: StageRequest) -> StageResponse:
+def stage_files(request: StageRequest, repo: tuple = Depends(_open_repo)) -> StageResponse:
     """Stage specific files"""
     if not CORE_AVAILABLE:
         return StageResponse(success=False, message="Core modules not available")
 
-    project_path = _get_project_path(project_id)
-    if not project_path:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    try:
-        git = GitUtils(project_path)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Not a git repository: {e}")
+    project_path, git = repo
 
     success, message, staged = git.stage_files(request.files)
     return StageResponse(success=success, message=message, staged=staged)
 
 
 @router.post("/{project_id:path}/stage-all")
-async def stage_all(project_id: str) -> ActionResponse:
+def stage_all(repo: tuple = Depends(_open_repo)) -> ActionResponse:
     """Stage all changes"""
     if not CORE_AVAILABLE:
         return ActionResponse(success=False, message="Core modules not available")
 
-    project_path = _get_project_path(project_id)
-    if not project_path:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    try:
-        git = GitUtils(project_path)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Not a git repository: {e}")
+    project_path, git = repo
 
     success, message = git.stage_all()
     return ActionResponse(success=success, message=message)
 
 
 @router.post("/{project_id:path}/unstage")
-async def unstage_files(project_id: str, request: StageRequest) -> UnstageResponse:
+def unstage_files(request: StageRequest, repo: tuple = Depends(_open_repo)) -> UnstageResponse:
     """Unstage specific files"""
     if not CORE_AVAILABLE:
         return UnstageResponse(success=False, message="Core modules not available")
 
-    project_path = _get_project_path(project_id)
-    if not project_path:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    try:
-        git = GitUtils(project_path)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Not a git repository: {e}")
+    project_path, git = repo
 
     success, message, unstaged = git.unstage_files(request.files)
     return UnstageResponse(success=success, message=message, unstaged=unstaged)
 
 
 @router.post("/{project_id:path}/unstage-all")
-async def unstage_all(project_id: str) -> ActionResponse:
+def unstage_all(repo: tuple = Depends(_open_repo)) -> ActionResponse:
     """Unstage all staged changes"""
     if not CORE_AVAILABLE:
         return ActionResponse(success=False, message="Core modules not available")
 
-    project_path = _get_project_path(project_id)
-    if not project_path:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    try:
-        git = GitUtils(project_path)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Not a git repository: {e}")
+    project_path, git = repo
 
     success, message = git.unstage_all()
     return ActionResponse(success=success, message=message)
 
 
 @router.post("/{project_id:path}/commit-staged")
-async def commit_staged(project_id: str, request: CommitStagedRequest) -> ActionResponse:
+def commit_staged(request: CommitStagedRequest, repo: tuple = Depends(_open_repo)) -> ActionResponse:
     """Commit only staged changes (does not auto-stage)"""
     if not CORE_AVAILABLE:
         return ActionResponse(success=False, message="Core modules not available")
 
-    project_path = _get_project_path(project_id)
-    if not project_path:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    try:
-        git = GitUtils(project_path)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Not a git repository: {e}")
+    project_path, git = repo
 
     success, message, commit_hash = git.commit_staged(request.message)
     return ActionResponse(success=success, message=message, hash=commit_hash)
 
 
 @router.post("/{project_id:path}/discard")
-async def discard_file(project_id: str, request: DiscardRequest) -> ActionResponse:
+def discard_file(request: DiscardRequest, repo: tuple = Depends(_open_repo)) -> ActionResponse:
     """Discard changes to a file (restore to last commit)"""
     if not CORE_AVAILABLE:
         return ActionResponse(success=False, message="Core modules not available")
 
-    project_path = _get_project_path(project_id)
-    if not project_path:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    try:
-        git = GitUtils(project_path)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Not a git repository: {e}")
+    project_path, git = repo
 
     success, message = git.discard_file(request.file)
     return ActionResponse(success=success, message=message)
 
 
 @router.delete("/{project_id:path}/untracked")
-async def delete_untracked(project_id: str, request: DiscardRequest) -> ActionResponse:
+def delete_untracked(request: DiscardRequest, repo: tuple = Depends(_open_repo)) -> ActionResponse:
     """Delete an untracked file"""
     if not CORE_AVAILABLE:
         return ActionResponse(success=False, message="Core modules not available")
 
-    project_path = _get_project_path(project_id)
-    if not project_path:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    try:
-        git = GitUtils(project_path)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Not a git repository: {e}")
+    project_path, git = repo
 
     success, message = git.delete_untracked(request.file)
     return ActionResponse(success=success, message=message)
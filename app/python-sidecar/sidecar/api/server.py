@@ -10,10 +10,23 @@ import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+import anyio.to_thread
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+# uvloop and httptools come with uvicorn[standard] (uvloop has no Windows
+# build). Importing them here rather than leaving uvicorn's "auto" lookup to
+# find them also lets PyInstaller see and bundle them.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+try:
+    import httptools
+except ImportError:
+    httptools = None
+
 # Skip path manipulation when running as a PyInstaller bundle.
 # PyInstaller freezes all modules into the binary; sys.path tweaks are unnecessary.
 if not getattr(sys, "frozen", False):
@@ -58,9 +71,16 @@ from .routes import (
 )
 
 
+# Fallback (Codex/Gemini) jobs run on Starlette's thread pool for minutes at
+# a time, so the default anyio limit of 40 threads is raised to keep short
+# sync endpoints from queueing behind them.
+_THREADPOOL_TOKENS = 128
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage server lifecycle — gracefully shut down worker threads on exit."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = _THREADPOOL_TOKENS
     yield
     # Graceful shutdown: signal threads and wait
     from .routes.parallel import _active_threads, _shutdown_event
@@ -163,7 +183,16 @@ def main():
     # PyInstaller bundles require freeze_support() for workers>1, and single-worker
     # is simpler and sufficient for a local desktop sidecar.
     worker_count = 1 if getattr(sys, "frozen", False) else 2
-    uvicorn.run(app, host=args.host, port=args.port, log_level="info", workers=worker_count, log_config=log_config)
+    uvicorn.run(
+        app,
+        host=args.host,
+        port=args.port,
+        log_level="info",
+        workers=worker_count,
+        log_config=log_config,
+        loop="uvloop" if uvloop is not None else "asyncio",
+        http="httptools" if httptools is not None else "h11",
+    )
 
 
 if __name__ == "__main__":
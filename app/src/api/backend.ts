@@ -502,18 +502,41 @@ export const api = {
   getDispatchStatus: (jobId: string) =>
     fetchApi<DispatchJobStatus>(`/api/dispatch/status/${encodeURIComponent(jobId)}`),
 
+  /**
+   * Fetch a dispatch job's plain-text output tail. Returns null when the
+   * server answers 304 because the tail is unchanged since `etag`.
+   */
+  getDispatchTail: async (
+    jobId: string,
+    etag: string | null
+  ): Promise<{ tail: string; etag: string | null } | null> => {
+    const response = await fetch(
+      `${API_BASE_URL}/api/dispatch/status/${encodeURIComponent(jobId)}/tail`,
+      { headers: etag ? { "If-None-Match": etag } : undefined }
+    );
+    if (response.status === 304) return null;
+    if (!response.ok) {
+      throw new Error(`Tail request failed (${response.status})`);
+    }
+    return { tail: await response.text(), etag: response.headers.get("ETag") };
+  },
+
   cancelDispatch: (jobId: string) =>
     fetchApi<{ success: boolean; message: string }>(
       `/api/dispatch/cancel/${encodeURIComponent(jobId)}`,
       { method: "POST" }
     ),
 
-  readDispatchOutput: (sessionId: string) =>
+  readDispatchOutput: (sessionId: string, options?: { tail?: number }) =>
     fetchApi<{
       lines: string[];
       exists: boolean;
       line_count: number;
-    }>(`/api/dispatch/output/${encodeURIComponent(sessionId)}`),
+    }>(
+      `/api/dispatch/output/${encodeURIComponent(sessionId)}${
+        options?.tail ? `?tail=${options.tail}` : ""
+      }`
+    ),
 
   enrichPrompt: (
     projectId: string,
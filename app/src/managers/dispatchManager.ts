@@ -2,6 +2,7 @@ import { create } from "zustand";
 import { api, isBackendConnected, API_BASE_URL } from "../api/backend";
 import { toast } from "../components/ui/Toast";
 import type {
+  DispatchJobStatus,
   StreamEvent,
   StreamStartResult,
   StreamCompletionStatus,
@@ -41,6 +42,11 @@ let timerInterval: ReturnType<typeof setInterval> | null = null;
 let eventSource: EventSource | null = null;
 let sseJobId: string | null = null; // Tracks job_id received from SSE stream start
 let lastTailLineCount = 0; // Tracks last line count for output tailing during polling
+let lastTailEtag: string | null = null; // ETag of the last tail fetched while polling
+
+// While polling, the cheap tail endpoint is checked every second and the full
+// status only when the tail changes or every STATUS_POLL_INTERVAL polls.
+const STATUS_POLL_INTERVAL = 5;
 
 function clearTimer(): void {
   if (timerInterval) {
@@ -488,12 +494,7 @@ export const useDispatchManager = create<DispatchManagerState>((set, get) => ({
         fallbackPhase: "running",
       });
 
-      // Poll fallback
-      const maxPolls = 45 * 60;
-      let finalStatus = null;
-      for (let i = 0; i < maxPolls; i++) {
-        const status = await api.getDispatchFallbackStatus(start.job_id);
-        finalStatus = status;
+      const finalStatus = await followFallbackStatus(start.job_id, (status) => {
         set({
           fallbackStatusText:
             status.message || `${providerLabel} is processing your task.`,
@@ -502,9 +503,7 @@ export const useDispatchManager = create<DispatchManagerState>((set, get) => ({
         if (status.output_tail) {
           set({ fallbackOutput: status.output_tail });
         }
-        if (status.done) break;
-        await wait(1000);
-      }
+      });
 
       if (!finalStatus || !finalStatus.done || !finalStatus.result) {
         throw new Error(
@@ -816,13 +815,74 @@ function triggerFallback(
   });
 }
 
+/**
+ * Follow a fallback job over its status SSE stream, switching to polling
+ * if the stream drops before the job finishes.
+ */
+async function followFallbackStatus(
+  jobId: string,
+  onStatus: (status: DispatchJobStatus) => void
+): Promise<DispatchJobStatus | null> {
+  const streamed = await new Promise<DispatchJobStatus | null>((resolve) => {
+    const es = new EventSource(
+      `${API_BASE_URL}/api/dispatch/fallback/status/${encodeURIComponent(jobId)}/events`
+    );
+    es.onmessage = (event) => {
+      let status: DispatchJobStatus;
+      try {
+        status = JSON.parse(event.data);
+      } catch (e) {
+        console.error("Failed to parse fallback status event:", e, event.data);
+        return;
+      }
+      onStatus(status);
+      if (status.done) {
+        es.close();
+        resolve(status);
+      }
+    };
+    es.onerror = () => {
+      es.close();
+      resolve(null);
+    };
+  });
+  if (streamed) return streamed;
+
+  const maxPolls = 45 * 60;
+  let finalStatus: DispatchJobStatus | null = null;
+  for (let i = 0; i < maxPolls; i++) {
+    const status = await api.getDispatchFallbackStatus(jobId);
+    finalStatus = status;
+    onStatus(status);
+    if (status.done) break;
+    await wait(1000);
+  }
+  return finalStatus;
+}
+
 async function pollDispatchJob(
   jobId: string
 ): Promise<ReturnType<typeof api.getDispatchStatus>> {
   lastTailLineCount = 0;
+  lastTailEtag = null;
+  // Bridged stream jobs have no tail endpoint; their status carries the tail.
+  const useTailEndpoint = !jobId.startsWith("stream-");
   const maxPolls = 45 * 60;
   for (let i = 0; i < maxPolls; i++) {
     try {
+      if (useTailEndpoint && i % STATUS_POLL_INTERVAL !== 0) {
+        const tail = await api.getDispatchTail(jobId, lastTailEtag);
+        if (tail === null) {
+          // Unchanged since the last poll (304); the job has not finished either.
+          await wait(1000);
+          continue;
+        }
+        lastTailEtag = tail.etag;
+        if (tail.tail) {
+          useDispatchManager.setState({ outputTail: tail.tail });
+        }
+      }
+
       const status = await api.getDispatchStatus(jobId);
       useDispatchManager.setState({
         statusText: status.message || "Claude Code is processing your task.",
@@ -842,13 +902,13 @@ async function pollDispatchJob(
 
       // Tail the output file for live CLI output (replaces useOutputTail hook)
       const currentLogFile = status.log_file ?? useDispatchManager.getState().logFile;
-      if (currentLogFile && status.status === "running") {
+      if (!useTailEndpoint && currentLogFile && status.status === "running") {
         try {
           const sessionId = currentLogFile.split("/").pop()?.replace(".log", "") || currentLogFile;
-          const tailResult = await api.readDispatchOutput(sessionId);
-          if (tailResult.exists && tailResult.lines.length > lastTailLineCount) {
-            const newTail = tailResult.lines.slice(-24).join("\n");
-            lastTailLineCount = tailResult.lines.length;
+          const tailResult = await api.readDispatchOutput(sessionId, { tail: 24 });
+          if (tailResult.exists && tailResult.line_count > lastTailLineCount) {
+            const newTail = tailResult.lines.join("\n");
+            lastTailLineCount = tailResult.line_count;
             useDispatchManager.setState({ outputTail: newTail });
           }
         } catch {
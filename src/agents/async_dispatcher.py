@@ -2,7 +2,7 @@
 
 import asyncio
 import uuid
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -320,6 +320,12 @@ class AsyncDispatchJob:
             event_type, data = event
             yield (event_type, data, self._sequence)
 
+    def add_done_callback(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` once the started job has finished."""
+        if self._task is None:
+            raise RuntimeError("Job not started")
+        self._task.add_done_callback(lambda _task: callback())
+
     def cancel(self) -> bool:
         """Cancel the running job."""
         if self._task is None or self._task.done():
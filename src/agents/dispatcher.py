@@ -61,6 +61,59 @@ class DispatchResult:
     token_limit_reached: bool = False
 
 
+def _claude_command(
+    cli_path: str,
+    model: str | None,
+    system_prompt_file: Path | None = None,
+    agents_json: str | None = None,
+) -> list[str]:
+    """Claude CLI arguments up to, but not including, ``-p``."""
+    command = [cli_path]
+    # acceptEdits permission mode ensures Claude can make file changes without
+    # interactive prompts. Essential for automated dispatch from the sidecar.
+    command.extend(["--permission-mode", "acceptEdits"])
+    if model:
+        command.extend(["--model", model])
+    if system_prompt_file:
+        command.extend(["--append-system-prompt-file", str(system_prompt_file)])
+    if agents_json:
+        command.extend(["--agents", agents_json])
+    return command
+
+
+def _claude_env() -> dict[str, str]:
+    """Environment for the CLI, without ANTHROPIC_API_KEY so OAuth login is used."""
+    env = os.environ.copy()
+    env.pop("ANTHROPIC_API_KEY", None)
+    return env
+
+
+def spawn_claude_cli(
+    working_dir: Path,
+    cli_path: str = "claude",
+    model: str | None = None,
+) -> subprocess.Popen:
+    """Start a Claude CLI in print mode that waits for its prompt on stdin.
+
+    The CLI boots (runtime start-up, config and login loading) while the
+    caller is still busy; pass it to ``dispatch_task(proc=...)`` to send the
+    prompt and collect the result. Each process answers exactly one prompt,
+    so nothing carries over between requests.
+
+    Raises FileNotFoundError if the CLI is not installed.
+    """
+    return subprocess.Popen(
+        [*_claude_command(cli_path, model), "-p"],
+        cwd=working_dir.resolve(),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,  # Line buffered
+        env=_claude_env(),
+    )
+
+
 def dispatch_task(
     prompt: str,
     working_dir: Path,
@@ -70,6 +123,7 @@ def dispatch_task(
     agents_json: str | None = None,
     output_file: Path | None = None,
     model: str | None = None,
+    proc: subprocess.Popen | None = None,
 ) -> DispatchResult:
     """Run Claude CLI directly and return a normalized dispatch result.
 
@@ -80,6 +134,10 @@ def dispatch_task(
         output_file: Optional pre-determined output file path. If provided,
             allows callers to monitor the file during execution. If not
             provided, a new file will be created.
+        proc: Optional CLI already started by spawn_claude_cli(). The prompt
+            is written to its stdin instead of starting a new process, so
+            ``cli_path``, ``model``, ``system_prompt_file`` and
+            ``agents_json`` were fixed when it was spawned.
     """
     project_path = working_dir.resolve()
     project_id = project_id_for_path(project_path)
@@ -91,36 +149,29 @@ def dispatch_task(
     if output_file is None:
         output_file = dispatch_output_dir / f"{session_id}.log"
 
-    command = [cli_path]
-    # acceptEdits permission mode ensures Claude can make file changes without
-    # interactive prompts. Essential for automated dispatch from the sidecar.
-    command.extend(["--permission-mode", "acceptEdits"])
-    if model:
-        command.extend(["--model", model])
-    if system_prompt_file:
-        command.extend(["--append-system-prompt-file", str(system_prompt_file)])
-    if agents_json:
-        command.extend(["--agents", agents_json])
-    command.extend(["-p", prompt])
-
     try:
-        # Use Popen to stream output incrementally to file
-        # CRITICAL: stdin=DEVNULL prevents hanging when Claude CLI tries to read input
-        # in a non-TTY environment (like the sidecar daemon). Without this, any
-        # interactive prompt (permissions, confirmations) blocks indefinitely.
-        # Also unset ANTHROPIC_API_KEY to ensure OAuth login is used instead
-        env = os.environ.copy()
-        env.pop("ANTHROPIC_API_KEY", None)
-        proc = subprocess.Popen(
-            command,
-            cwd=project_path,
-            stdin=subprocess.DEVNULL,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,  # Line buffered
-            env=env,
-        )
+        if proc is None:
+            # CRITICAL: stdin=DEVNULL prevents hanging when Claude CLI tries to read input
+            # in a non-TTY environment (like the sidecar daemon). Without this, any
+            # interactive prompt (permissions, confirmations) blocks indefinitely.
+            proc = subprocess.Popen(
+                [*_claude_command(cli_path, model, system_prompt_file, agents_json), "-p", prompt],
+                cwd=project_path,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,  # Line buffered
+                env=_claude_env(),
+            )
+        else:
+            # Closing stdin after the prompt gives any later read an EOF, the
+            # same as DEVNULL above.
+            try:
+                proc.stdin.write(prompt)
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass  # The CLI already exited; its output says why.
     except FileNotFoundError:
         return DispatchResult(
             success=False,
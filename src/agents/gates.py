@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import json
 import subprocess
+import threading
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -113,6 +114,11 @@ class GateReport:
         return [r for r in self.results if r.status == "fail" and r.hard_stop]
 
 
+# Saving a report rewrites latest.json and read-modify-writes the failure
+# todos and trends, so concurrent run_gate() calls persist one at a time.
+_PERSIST_LOCK = threading.Lock()
+
+
 class QualityGateRunner:
     """Orchestrate command + agent gates for a project."""
 
@@ -492,8 +498,9 @@ class QualityGateRunner:
                 for item in report.results
             ],
         )
-        self.result_store.save_report(stored)
-        self.trend_store.compute(limit=10)
+        with _PERSIST_LOCK:
+            self.result_store.save_report(stored)
+            self.trend_store.compute(limit=10)
 
     def _report_from_store(self, stored: GateRunReport) -> GateReport:
         return GateReport(
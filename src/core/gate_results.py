@@ -4,16 +4,42 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Literal
+from typing import BinaryIO, Literal
 
 from ..utils import parse_iso
 from .runtime import project_runtime_dir
 
 GateOutcome = Literal["pass", "warn", "fail", "skipped", "error"]
 
+# Bytes read per step when reading the history index back from its end
+_HISTORY_READ_CHUNK_BYTES = 16 * 1024
+
+
+def _read_last_lines(handle: BinaryIO, count: int) -> list[bytes]:
+    """Last ``count`` lines of a binary handle, reading back from its end.
+
+    Only as many trailing chunks as hold those lines are read, so the cost
+    does not grow with the length of the file.
+    """
+    if count <= 0:
+        return []
+    position = handle.seek(0, os.SEEK_END)
+    data = b""
+    # count + 1 line breaks guarantee count whole lines after a partial one.
+    while position > 0 and data.count(b"\n") <= count:
+        step = min(_HISTORY_READ_CHUNK_BYTES, position)
+        position -= step
+        handle.seek(position)
+        data = handle.read(step) + data
+    lines = data.splitlines()
+    if position > 0:
+        lines = lines[1:]
+    return lines[-count:]
+
 
 @dataclass
 class GateFinding:
@@ -205,6 +231,9 @@ class GateResultStore:
         self.results_dir = self.project_dir / "gate-results"
         self.results_dir.mkdir(parents=True, exist_ok=True)
         self.latest_file = self.results_dir / "latest.json"
+        # One line of {timestamp, gates: [{name, status}]} per saved report, so
+        # status history can be read without parsing every full report.
+        self.history_index_file = self.results_dir / "history.jsonl"
         self.last_status_file = self.project_dir / "last-gate-status.json"
         self.failure_todos_file = self.project_dir / "gate-failure-todos.json"
 
@@ -214,6 +243,12 @@ class GateResultStore:
         report_path = self.results_dir / f"{timestamp_slug}-{report.run_id}.json"
         report_path.write_text(json.dumps(payload, indent=2))
         self.latest_file.write_text(json.dumps(payload, indent=2))
+        index_entry = {
+            "timestamp": payload["timestamp"],
+            "gates": [{"name": gate.name, "status": gate.status} for gate in report.gates],
+        }
+        with self.history_index_file.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(index_entry) + "\n")
 
         status_payload = {
             "run_id": report.run_id,
@@ -258,6 +293,38 @@ class GateResultStore:
                 continue
         return reports
 
+    def load_status_history(self, limit: int = 50) -> list[dict]:
+        """Timestamp and per-gate statuses of recent runs, newest first.
+
+        Entries look like ``{"timestamp": iso, "gates": [{"name", "status"}]}``.
+        Read from the history index; while the index holds fewer runs than
+        are on disk (reports saved before it existed), full reports are used.
+        """
+        entries: list[dict] = []
+        try:
+            with self.history_index_file.open("rb") as handle:
+                lines = _read_last_lines(handle, limit)
+        except OSError:
+            lines = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+
+        if len(entries) < limit:
+            report_count = sum(1 for path in self.results_dir.glob("*.json") if path.name != "latest.json")
+            if report_count > len(entries):
+                return [
+                    {
+                        "timestamp": report.timestamp.isoformat(),
+                        "gates": [{"name": gate.name, "status": gate.status} for gate in report.gates],
+                    }
+                    for report in self.load_history(limit=limit)
+                ]
+        entries.reverse()
+        return entries
+
     def load_for_session(self, session_id: str) -> GateRunReport | None:
         for report in self.load_history(limit=200):
             if report.session_id == session_id:
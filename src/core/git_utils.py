@@ -1,6 +1,7 @@
 """Git history, branch, and diff operations."""
 
 import subprocess
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -23,6 +24,134 @@ def is_git_repo(path: Path) -> bool:
     return (path / ".git").exists()
 
 
+# Git invocations behind GitUtils.status_bundle(), shared with callers that
+# run git themselves (e.g. on an event loop) and parse with the functions below.
+STATUS_BUNDLE_ARGS = ("status", "--porcelain=v2", "--branch", "--show-stash", "-z")
+UNPUSHED_LOG_ARGS = ("log", "--oneline", "@{u}..", "--format=%H|%s|%ar")
+STASH_LIST_ARGS = ("stash", "list", "--format=%gd|%gs|%ar")
+# `git log -N` options whose lines parse_commit_line() understands
+RECENT_COMMITS_FORMAT_ARGS = ("--format=%H|%s|%ad|%ar|%P", "--date=format:%Y-%m-%d|%H:%M")
+
+
+def parse_status_v2(output: str) -> dict:
+    """Parse ``git status --porcelain=v2 --branch --show-stash -z`` output.
+
+    Returns ``branch``, ``ahead``, ``stash_count`` and the ``staged``,
+    ``modified``, ``untracked`` and ``submodule_issues`` path lists.
+    ``stash_count`` is None without a ``# stash`` header: git before 2.35
+    never prints one, and later versions leave it out when there are no
+    stashes, so only a present header is conclusive.
+    """
+    branch = "unknown"
+    ahead = 0
+    stash_count: int | None = None
+    staged: list[str] = []
+    modified: list[str] = []
+    untracked: list[str] = []
+    submodule_issues: list[str] = []
+
+    records = iter(output.split("\0"))
+    for record in records:
+        kind = record[:1]
+        if kind == "#":
+            if record.startswith("# branch.head "):
+                head = record[len("# branch.head "):]
+                # Match `git rev-parse --abbrev-ref HEAD` for a detached HEAD.
+                branch = "HEAD" if head == "(detached)" else head
+            elif record.startswith("# branch.ab "):
+                ahead = int(record.split()[2].lstrip("+"))
+            elif record.startswith("# stash "):
+                stash_count = int(record[len("# stash "):])
+        elif kind == "?":
+            untracked.append(record[2:])
+        elif kind in ("1", "2"):
+            # "1 XY sub mH mI mW hH hI path"; renames ("2") add a score
+            # field and are followed by a record with the original path.
+            fields = record.split(" ", 8 if kind == "1" else 9)
+            index_status, worktree_status = fields[1][0], fields[1][1]
+            sub, filepath = fields[2], fields[-1]
+            if kind == "2":
+                next(records, None)
+            if sub[0] == "S" and (worktree_status in "MD" or sub[2] == "M" or sub[3] == "U"):
+                submodule_issues.append(filepath)
+                continue
+            if index_status in "MARCD":
+                staged.append(filepath)
+            if worktree_status in "MD":
+                modified.append(filepath)
+        # Unmerged ("u") entries are neither staged nor modified, as in get_status().
+
+    return {
+        "branch": branch,
+        "ahead": ahead,
+        "stash_count": stash_count,
+        "staged": staged,
+        "modified": modified,
+        "untracked": untracked,
+        "submodule_issues": submodule_issues,
+    }
+
+
+def parse_numstat(output: str) -> dict[str, str]:
+    """Map paths to "+added -removed" from ``git diff --numstat`` output."""
+    line_stats: dict[str, str] = {}
+    for line in output.split("\n"):
+        parts = line.split("\t")
+        if len(parts) >= 3:
+            added, removed, fname = parts[0], parts[1], parts[2]
+            if added != "-" and removed != "-":
+                line_stats[fname] = f"+{added} -{removed}"
+    return line_stats
+
+
+def parse_log_records(output: str, keys: tuple[str, ...]) -> list[dict]:
+    """Split ``|``-separated log lines into dicts with the given keys."""
+    records = []
+    for line in output.split("\n"):
+        parts = line.split("|", len(keys) - 1)
+        if len(parts) == len(keys):
+            records.append(dict(zip(keys, parts, strict=True)))
+    return records
+
+
+def parse_commit_line(line: str, branch: str) -> dict | None:
+    """Parse one RECENT_COMMITS_FORMAT_ARGS log line; None if it is malformed."""
+    parts = line.split("|")
+    if len(parts) < 5:
+        return None
+    return {
+        "hash": parts[0],
+        "message": parts[1],
+        "date": parts[2],
+        "time": parts[3],
+        "branch": branch,
+        "is_merge": " " in parts[4],  # Multiple parents = merge commit
+    }
+
+
+def assemble_status_bundle(
+    status: dict,
+    staged_line_stats: dict[str, str],
+    line_stats: dict[str, str],
+    unpushed: list[dict],
+    stashes: list[dict],
+) -> dict:
+    """Combine parse_status_v2() output with the follow-up calls' results."""
+    return {
+        "branch": status["branch"],
+        "staged": [
+            {"path": f, "status": "A", "lines": staged_line_stats.get(f)} for f in status["staged"]
+        ],
+        "modified": [
+            {"path": f, "status": "M", "lines": line_stats.get(f)} for f in status["modified"]
+        ],
+        "untracked": status["untracked"],
+        "submodule_issues": status["submodule_issues"],
+        "unpushed": unpushed,
+        "stashes": stashes,
+    }
+
+
 @dataclass
 class GitCommit:
     """A single git commit."""
@@ -92,6 +221,37 @@ class GitRepo:
         except FileNotFoundError:
             return "", 1
 
+    def _run_git_bounded(self, max_chars: int, *args: str) -> tuple[str, bool]:
+        """Run a git command, reading at most ``max_chars`` of its output.
+
+        Returns (output, truncated). Once the limit is passed git is killed
+        rather than left to write output that would be thrown away.
+        """
+        try:
+            proc = subprocess.Popen(
+                ["git", *args],
+                cwd=self.path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        except FileNotFoundError:
+            return "", False
+        # Same 30s ceiling as _run_git; a blocked read ends when git is killed.
+        timer = threading.Timer(30, proc.kill)
+        timer.start()
+        try:
+            with proc:
+                output = proc.stdout.read(max_chars + 1)
+                truncated = len(output) > max_chars
+                if truncated:
+                    proc.kill()
+        finally:
+            timer.cancel()
+        if truncated:
+            return output[:max_chars], True
+        return output.rstrip("\n"), False
+
     def get_current_branch(self) -> str:
         """Get the current branch name."""
         output, _ = self._run_git("rev-parse", "--abbrev-ref", "HEAD")
@@ -253,6 +413,38 @@ class GitRepo:
             return []
         return [f for f in output.split("\n") if f]
 
+    def get_files_changed_in_commits(self, shas: list[str]) -> dict[str, list[str]]:
+        """get_files_changed_in_commit() for many commits with one git process.
+
+        The full SHAs are fed to ``git diff-tree --stdin``, which answers each
+        with its SHA followed by the changed paths, instead of forking git
+        once per commit. Commits without output (e.g. merges) map to [].
+        """
+        changed: dict[str, list[str]] = {sha: [] for sha in shas}
+        if not shas:
+            return changed
+        try:
+            result = subprocess.run(
+                ["git", "diff-tree", "--stdin", "--name-only", "-r"],
+                cwd=self.path,
+                input="\n".join(shas) + "\n",
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return changed
+        if result.returncode != 0:
+            return changed
+
+        current: list[str] | None = None
+        for line in result.stdout.split("\n"):
+            if line in changed:
+                current = changed[line]
+            elif line and current is not None:
+                current.append(line)
+        return changed
+
     def get_diff_content(self, sha1: str, sha2: str) -> str:
         """Get the full diff content between two commits.
 
@@ -399,68 +591,83 @@ class GitUtils:
             "submodule_issues": status.submodule_issues,
         }
 
+    def status_bundle(self) -> dict:
+        """Branch, file status, unpushed commits and stashes for the status view.
+
+        One ``git status --porcelain=v2 --branch --show-stash`` call supplies
+        the branch, ahead count, stash count and file entries; ``git log``
+        only runs when the branch is ahead, ``git stash list`` unless the
+        header reports no stashes, and each numstat only runs when files are
+        in that state.
+        Falls back to the individual calls if that status form is rejected.
+
+        Returns the get_status_detailed() keys plus ``branch``, ``unpushed``
+        and ``stashes`` (same shapes as unpushed_commits()/list_stashes()).
+        """
+        if not self._repo:
+            return {
+                "branch": "unknown",
+                "staged": [],
+                "modified": [],
+                "untracked": [],
+                "submodule_issues": [],
+                "unpushed": [],
+                "stashes": [],
+            }
+
+        output, code = self._repo._run_git(*STATUS_BUNDLE_ARGS)
+        if code != 0:
+            return {
+                "branch": self.current_branch(),
+                **self.get_status_detailed(),
+                "unpushed": self.unpushed_commits(),
+                "stashes": self.list_stashes(),
+            }
+
+        status = parse_status_v2(output)
+        return assemble_status_bundle(
+            status,
+            staged_line_stats=self._line_stats("--cached") if status["staged"] else {},
+            line_stats=self._line_stats() if status["modified"] else {},
+            unpushed=self.unpushed_commits() if status["ahead"] else [],
+            stashes=self.list_stashes() if status["stash_count"] != 0 else [],
+        )
+
+    def _line_stats(self, *diff_args: str) -> dict[str, str]:
+        """Map paths to "+added -removed" from ``git diff --numstat``."""
+        output, code = self._repo._run_git("diff", *diff_args, "--numstat")
+        if code != 0:
+            return {}
+        return parse_numstat(output)
+
     def unpushed_commits(self) -> list[dict]:
         """Get list of unpushed commits."""
         if not self._repo:
             return []
 
         # Get unpushed commits by comparing with origin
-        output, code = self._repo._run_git(
-            "log", "--oneline", "@{u}..", "--format=%H|%s|%ar"
-        )
+        output, code = self._repo._run_git(*UNPUSHED_LOG_ARGS)
 
-        if code != 0 or not output:
+        if code != 0:
             return []
-
-        commits = []
-        for line in output.split("\n"):
-            if not line:
-                continue
-
-            parts = line.split("|", 2)
-            if len(parts) >= 3:
-                commits.append({
-                    "hash": parts[0],
-                    "message": parts[1],
-                    "time": parts[2],
-                })
-
-        return commits
+        return parse_log_records(output, ("hash", "message", "time"))
 
     def recent_commits(self, limit: int = 10) -> list[dict]:
         """Get recent commits formatted for UI."""
         if not self._repo:
             return []
 
-        output, code = self._repo._run_git(
-            "log", f"-{limit}",
-            "--format=%H|%s|%ad|%ar|%P",
-            "--date=format:%Y-%m-%d|%H:%M"
-        )
+        output, code = self._repo._run_git("log", f"-{limit}", *RECENT_COMMITS_FORMAT_ARGS)
 
         if code != 0 or not output:
             return []
 
-        commits = []
         branch = self.current_branch()
-
+        commits = []
         for line in output.split("\n"):
-            if not line:
-                continue
-
-            parts = line.split("|")
-            if len(parts) >= 5:
-                parents = parts[4] if len(parts) > 4 else ""
-                is_merge = " " in parents  # Multiple parents = merge commit
-
-                commits.append({
-                    "hash": parts[0],
-                    "message": parts[1],
-                    "date": parts[2],
-                    "time": parts[3],
-                    "branch": branch,
-                    "is_merge": is_merge,
-                })
+            commit = parse_commit_line(line, branch)
+            if commit is not None:
+                commits.append(commit)
 
         return commits
 
@@ -530,7 +737,33 @@ class GitUtils:
         # Get diff of unstaged changes (working tree vs index)
         unstaged_diff, _ = self._repo._run_git("diff")
 
-        # Combine both diffs
+        return self._combine_diffs(staged_diff, unstaged_diff)
+
+    def get_diff_bounded(self, max_chars: int) -> tuple[str, bool]:
+        """The first ``max_chars`` characters of get_diff().
+
+        Returns (diff, truncated). Each git diff is only read until the
+        budget is spent, so a huge changeset is never fully produced or held
+        in memory; the unstaged diff is skipped entirely if the staged one
+        already fills the budget.
+        """
+        if not self._repo:
+            return "", False
+
+        staged_diff, truncated = self._repo._run_git_bounded(max_chars, "diff", "--cached")
+        unstaged_diff = ""
+        if not truncated:
+            remaining = max_chars - len(self._combine_diffs(staged_diff, ""))
+            unstaged_diff, truncated = self._repo._run_git_bounded(max(remaining, 0), "diff")
+
+        diff = self._combine_diffs(staged_diff, unstaged_diff)
+        if truncated or len(diff) > max_chars:
+            return diff[:max_chars], True
+        return diff, False
+
+    @staticmethod
+    def _combine_diffs(staged_diff: str, unstaged_diff: str) -> str:
+        """Join staged and unstaged diffs under section headers."""
         combined = []
         if staged_diff and staged_diff.strip():
             combined.append("# Staged changes:\n")
@@ -547,27 +780,11 @@ class GitUtils:
         if not self._repo:
             return []
 
-        output, code = self._repo._run_git(
-            "stash", "list", "--format=%gd|%gs|%ar"
-        )
+        output, code = self._repo._run_git(*STASH_LIST_ARGS)
 
-        if code != 0 or not output:
+        if code != 0:
             return []
-
-        stashes = []
-        for line in output.split("\n"):
-            if not line:
-                continue
-
-            parts = line.split("|", 2)
-            if len(parts) >= 3:
-                stashes.append({
-                    "id": parts[0],
-                    "message": parts[1],
-                    "time": parts[2],
-                })
-
-        return stashes
+        return parse_log_records(output, ("id", "message", "time"))
 
     def get_file_line_changes(self, filepath: str) -> str | None:
         """Get line changes for a specific file (+N -M format)."""
@@ -326,11 +326,9 @@ class TimelineBuilder:
 
         commits_raw = repo.get_commits_since(start)
         commits = [c for c in commits_raw if c.timestamp <= end]
-        infos: list[CommitInfo] = []
-        files_changed = 0
-        for commit in commits:
-            infos.append(CommitInfo(sha=commit.sha, message=commit.message, timestamp=commit.timestamp))
-            files_changed += len(repo.get_files_changed_in_commit(commit.sha))
+        infos = [CommitInfo(sha=c.sha, message=c.message, timestamp=c.timestamp) for c in commits]
+        changed = repo.get_files_changed_in_commits([commit.sha for commit in commits])
+        files_changed = sum(len(files) for files in changed.values())
 
         return infos, files_changed
 
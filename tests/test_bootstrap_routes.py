@@ -0,0 +1,171 @@
+"""Tests for the sidecar bootstrap routes and their SSE progress stream."""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+SIDE_CAR_ROOT = Path(__file__).resolve().parents[1] / "app" / "python-sidecar"
+if str(SIDE_CAR_ROOT) not in sys.path:
+    sys.path.insert(0, str(SIDE_CAR_ROOT))
+
+from sidecar.api.routes import bootstrap as bootstrap_routes  # noqa: E402
+from src.agents import bootstrap_engine  # noqa: E402
+from src.agents.bootstrap_engine import (  # noqa: E402
+    BootstrapResult,
+    BootstrapStepType,
+    StepResult,
+)
+
+
+class _FakeBootstrapEngine:
+    """Mock bootstrap engine that reports progress and returns a canned result."""
+
+    fail_with: str | None = None
+    tick_delay: float = 0.0
+
+    def __init__(self, project_path: Path, progress_callback=None):
+        self.project_path = project_path
+        self.progress_callback = progress_callback
+
+    def bootstrap(self, **_kwargs) -> BootstrapResult:
+        """Emit two progress ticks, then succeed or raise."""
+        self.progress_callback(BootstrapStepType.ANALYZE, 10.0, "Analyzing", 0, 2)
+        time.sleep(self.tick_delay)
+        self.progress_callback(BootstrapStepType.ROADMAP, 60.0, "Roadmap", 1, 2)
+        if self.fail_with:
+            raise RuntimeError(self.fail_with)
+        return BootstrapResult(
+            success=True,
+            artifacts={"roadmap": self.project_path / "ROADMAP.md"},
+            duration_seconds=1.5,
+            steps_completed=2,
+            steps_total=2,
+            step_results=[
+                StepResult(step_type="analyze", name="Analyze", status="success", required=True),
+            ],
+        )
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Test client with the bootstrap router mounted on a fake engine."""
+    monkeypatch.setattr(bootstrap_engine, "BootstrapEngine", _FakeBootstrapEngine)
+    monkeypatch.setattr(_FakeBootstrapEngine, "fail_with", None)
+    monkeypatch.setattr(_FakeBootstrapEngine, "tick_delay", 0.0)
+    app = FastAPI()
+    app.include_router(bootstrap_routes.router, prefix="/api")
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _read_events(client: TestClient, session_id: str) -> list[dict]:
+    """Consume the SSE stream for a session and decode its data frames."""
+    with client.stream("GET", f"/api/bootstrap/stream/{session_id}") as response:
+        body = b"".join(response.iter_bytes()).decode()
+    return [
+        json.loads(frame[len("data: "):])
+        for frame in body.split("\n\n")
+        if frame.startswith("data: ")
+    ]
+
+
+def test_stream_emits_progress_then_serializable_result(client, temp_dir) -> None:
+    """Test that progress frames arrive in order and the final frame carries the result."""
+    session_id = client.post(
+        "/api/bootstrap/start", json={"project_path": str(temp_dir)}
+    ).json()["session_id"]
+
+    events = _read_events(client, session_id)
+
+    assert [event["type"] for event in events] == ["progress", "progress", "complete"]
+    assert events[1]["step"] == "1/2"
+    final = events[-1]
+    assert final["status"] == "completed"
+    assert final["result"]["artifacts"] == {"roadmap": str(temp_dir / "ROADMAP.md")}
+    assert final["result"]["step_results"][0]["name"] == "Analyze"
+
+
+def test_stream_reports_engine_failure(client, temp_dir, monkeypatch) -> None:
+    """Test that an engine exception surfaces as an error frame and failed status."""
+    monkeypatch.setattr(_FakeBootstrapEngine, "fail_with", "boom")
+    session_id = client.post(
+        "/api/bootstrap/start", json={"project_path": str(temp_dir)}
+    ).json()["session_id"]
+
+    events = _read_events(client, session_id)
+
+    assert events[-2] == {"type": "error", "error": "boom"}
+    assert events[-1]["status"] == "failed"
+    assert events[-1]["result"] is None
+    status = client.get(f"/api/bootstrap/status/{session_id}").json()
+    assert status["status"] == "failed"
+    assert status["error"] == "boom"
+
+
+def test_result_matches_stream_payload(client, temp_dir) -> None:
+    """Test that /result returns the same payload as the final stream frame."""
+    session_id = client.post(
+        "/api/bootstrap/start", json={"project_path": str(temp_dir)}
+    ).json()["session_id"]
+    final = _read_events(client, session_id)[-1]
+
+    response = client.get(f"/api/bootstrap/result/{session_id}")
+
+    assert response.status_code == 200
+    assert response.json() == final["result"]
+
+
+def test_idle_stream_sends_keepalive_comments(client, temp_dir, monkeypatch) -> None:
+    """Test that a quiet bootstrap still writes keepalive comments to the stream."""
+    monkeypatch.setattr(bootstrap_routes, "_SSE_KEEPALIVE_SECONDS", 0.01)
+    monkeypatch.setattr(_FakeBootstrapEngine, "tick_delay", 0.2)
+    session_id = client.post(
+        "/api/bootstrap/start", json={"project_path": str(temp_dir)}
+    ).json()["session_id"]
+
+    with client.stream("GET", f"/api/bootstrap/stream/{session_id}") as response:
+        body = b"".join(response.iter_bytes())
+
+    assert b": keepalive\n\n" in body
+    assert body.endswith(b"\n\n")
+
+
+def test_trim_sessions_evicts_expired_and_oldest_finished(monkeypatch) -> None:
+    """Test that finished sessions are evicted by age and by the size cap."""
+    import asyncio
+
+    now = time.monotonic()
+    sessions = {
+        "running": {"finished_at": None, "notify": asyncio.Event()},
+        "expired": {"finished_at": now - 7200, "notify": asyncio.Event()},
+        "older": {"finished_at": now - 20, "notify": asyncio.Event()},
+        "newer": {"finished_at": now - 10, "notify": asyncio.Event()},
+    }
+    monkeypatch.setattr(bootstrap_routes, "_active_sessions", sessions)
+    monkeypatch.setattr(bootstrap_routes, "_MAX_SESSIONS", 3)
+
+    bootstrap_routes._trim_sessions()
+
+    assert set(sessions) == {"running", "newer"}
+
+
+def test_reconnect_after_completion_returns_final_frame(client, temp_dir) -> None:
+    """Test that connecting to a finished session immediately yields the final frame."""
+    session_id = client.post(
+        "/api/bootstrap/start", json={"project_path": str(temp_dir)}
+    ).json()["session_id"]
+    first = _read_events(client, session_id)
+
+    second = _read_events(client, session_id)
+
+    assert second == [first[-1]]
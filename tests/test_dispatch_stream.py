@@ -220,6 +220,29 @@ class TestAsyncDispatchJob:
         result = job.cancel()
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_done_callback_runs_when_job_finishes(self, tmp_path: Path):
+        """Should call done callbacks once the job has finished."""
+        job = AsyncDispatchJob(
+            job_id="test-job-3",
+            prompt="test",
+            working_dir=tmp_path,
+            cli_path="nonexistent-cli",
+        )
+        with pytest.raises(RuntimeError):
+            job.add_done_callback(lambda: None)
+
+        finished = asyncio.Event()
+        with patch(
+            "asyncio.create_subprocess_exec",
+            side_effect=FileNotFoundError("not found"),
+        ):
+            job.start()
+            job.add_done_callback(finished.set)
+            await asyncio.wait_for(finished.wait(), timeout=2)
+
+        assert not job.is_running
+
 
 class TestAsyncDispatchResult:
     """Tests for AsyncDispatchResult dataclass."""
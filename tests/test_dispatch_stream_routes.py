@@ -0,0 +1,229 @@
+"""Tests for the streaming dispatch SSE routes."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+SIDE_CAR_ROOT = Path(__file__).resolve().parents[1] / "app" / "python-sidecar"
+if str(SIDE_CAR_ROOT) not in sys.path:
+    sys.path.insert(0, str(SIDE_CAR_ROOT))
+
+from sidecar.api.routes import dispatch_stream as stream_routes  # noqa: E402
+
+
+def _decode_frame(frame: bytes) -> dict:
+    """Decode one ``data:`` SSE frame."""
+    assert frame.startswith(b"data: ")
+    assert frame.endswith(b"\n\n")
+    return json.loads(frame[len(b"data: "):])
+
+
+def test_format_sse_event_appends_cached_job_suffix() -> None:
+    """Test that frames carry the per-event fields plus the stream's job_id."""
+    suffix = stream_routes._sse_job_suffix("stream-abc")
+
+    event = _decode_frame(stream_routes._format_sse_event("output", 'say "hi" – ok', 3, suffix))
+
+    assert list(event) == ["type", "data", "sequence", "timestamp", "job_id"]
+    assert event["type"] == "output"
+    assert event["data"] == 'say "hi" – ok'
+    assert event["sequence"] == 3
+    assert event["job_id"] == "stream-abc"
+
+
+class _FakeJob:
+    """Job stand-in whose events() replays a script with optional pauses."""
+
+    job_id = "stream-fake"
+
+    def __init__(self, script):
+        self.script = script
+
+    async def events(self):
+        import asyncio
+
+        for sequence, (event_type, data, pause) in enumerate(self.script, start=1):
+            if pause:
+                await asyncio.sleep(pause)
+            yield event_type, data, sequence
+
+
+async def _collect_chunks(job) -> list[bytes]:
+    suffix = stream_routes._sse_job_suffix(job.job_id)
+    return [chunk async for chunk in stream_routes._stream_events(job, suffix)]
+
+
+async def test_stream_events_coalesce_output_bursts() -> None:
+    """Test that a burst of output lines is written as one chunk of whole frames."""
+    script = [("output", f"line {index}", 0) for index in range(50)]
+    script.append(("complete", "success", 0))
+
+    chunks = await _collect_chunks(_FakeJob(script))
+
+    frames = [frame + b"\n\n" for chunk in chunks for frame in chunk.split(b"\n\n") if frame]
+    events = [_decode_frame(frame) for frame in frames]
+    assert [event["data"] for event in events] == [f"line {index}" for index in range(50)] + ["success"]
+    assert len(chunks) < 5
+
+
+async def test_stream_events_flush_after_window_and_on_control_events(monkeypatch) -> None:
+    """Test that a quiet stream flushes after the window and status frames are not held."""
+    monkeypatch.setattr(stream_routes, "_SSE_BATCH_WINDOW_SECONDS", 0.01)
+    script = [
+        ("status", "Launching", 0),
+        ("output", "first", 0),
+        ("output", "second", 0.05),
+        ("complete", "success", 0),
+    ]
+
+    chunks = await _collect_chunks(_FakeJob(script))
+
+    assert [[_decode_frame(f + b"\n\n")["data"] for f in c.split(b"\n\n") if f] for c in chunks] == [
+        ["Launching"],
+        ["first"],
+        ["second", "success"],
+    ]
+
+
+async def test_stream_events_drop_oldest_output_when_client_falls_behind(monkeypatch) -> None:
+    """Test that a full buffer sheds old output frames, keeps control frames and says so."""
+    monkeypatch.setattr(stream_routes, "_SSE_MAX_BUFFERED_FRAMES", 5)
+    script = [("status", "Launching", 0)]
+    script += [("output", f"line {index}", 0) for index in range(20)]
+    script.append(("complete", "success", 0))
+
+    chunks = await _collect_chunks(_FakeJob(script))
+
+    events = [_decode_frame(f + b"\n\n") for c in chunks for f in c.split(b"\n\n") if f]
+    assert [(event["type"], event["data"]) for event in events] == [
+        ("status", "Client fell behind; skipped 17 output line(s)."),
+        ("status", "Launching"),
+        ("output", "line 17"),
+        ("output", "line 18"),
+        ("output", "line 19"),
+        ("complete", "success"),
+    ]
+
+
+class _StartableJob:
+    """AsyncDispatchJob stand-in whose run finishes when ``release`` is set."""
+
+    def __init__(self, job_id, **_kwargs):
+        import asyncio
+
+        self.job_id = job_id
+        self.release = asyncio.Event()
+        self._task = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, output_file=None) -> None:
+        import asyncio
+
+        self._task = asyncio.create_task(self.release.wait())
+
+    def add_done_callback(self, callback) -> None:
+        self._task.add_done_callback(lambda _task: callback())
+
+
+async def test_finished_stream_jobs_expire_from_the_heap(monkeypatch, temp_dir) -> None:
+    """Test that starting needs no lock and finished jobs drop out after their TTL."""
+    import asyncio
+
+    monkeypatch.setattr(stream_routes, "CORE_AVAILABLE", True)
+    monkeypatch.setattr(stream_routes, "AsyncDispatchJob", _StartableJob)
+    monkeypatch.setattr(stream_routes, "get_async_dispatch_output_path", lambda path, job_id: (job_id, None))
+    monkeypatch.setattr(stream_routes, "_stream_jobs", {})
+    monkeypatch.setattr(stream_routes, "_expiry_heap", [])
+    request = stream_routes.StreamStartRequest(prompt="hi", project_id=str(temp_dir))
+
+    started = await asyncio.wait_for(stream_routes.stream_start(request), timeout=2)
+    job = stream_routes._stream_jobs[started.job_id]
+    assert stream_routes._expiry_heap == []
+
+    job.release.set()
+    await job._task
+    await asyncio.sleep(0)
+    assert [job_id for _expires_at, job_id in stream_routes._expiry_heap] == [started.job_id]
+
+    stream_routes._cleanup_old_jobs()
+    assert started.job_id in stream_routes._stream_jobs
+
+    stream_routes._expiry_heap[0] = (0.0, started.job_id)
+    stream_routes._cleanup_old_jobs()
+    assert stream_routes._stream_jobs == {}
+    assert stream_routes._expiry_heap == []
+
+
+async def test_drained_job_reconnect_replays_output_file(monkeypatch, temp_dir) -> None:
+    """Test that a reconnect after the live stream ended replays the output file."""
+    from types import SimpleNamespace
+
+    monkeypatch.setattr(stream_routes, "_drained_jobs", set())
+    monkeypatch.setattr(stream_routes, "_REPLAY_CHUNK_BYTES", 8)
+    output_file = temp_dir / "stream.log"
+    output_file.write_bytes("first line\nsécond\n\nno newline".encode("utf-8"))
+
+    job = _FakeJob([("output", "first line", 0), ("complete", "success", 0)])
+    job.output_file = output_file
+    job.is_running = False
+    job.get_result = lambda: SimpleNamespace(cancelled=False, token_limit_reached=False, success=True)
+
+    await _collect_chunks(job)
+    assert job.job_id in stream_routes._drained_jobs
+
+    suffix = stream_routes._sse_job_suffix(job.job_id)
+    chunks = [chunk async for chunk in stream_routes._replay_output(job, suffix)]
+    events = [_decode_frame(f + b"\n\n") for c in chunks for f in c.split(b"\n\n") if f]
+
+    assert [(e["type"], e["data"]) for e in events] == [
+        ("output", "first line"),
+        ("output", "sécond"),
+        ("output", ""),
+        ("output", "no newline"),
+        ("complete", "success"),
+    ]
+    assert [e["sequence"] for e in events] == [1, 2, 3, 4, 5]
+
+
+async def test_dispatch_status_bridges_stream_jobs(monkeypatch, temp_dir) -> None:
+    """Test that polling a stream job ID reports the stream job's state."""
+    from types import SimpleNamespace
+
+    from fastapi import HTTPException
+
+    from sidecar.api.routes import dispatch as dispatch_routes
+
+    output_file = temp_dir / "stream.log"
+    output_file.write_text("working\nall done\n", encoding="utf-8")
+    job = SimpleNamespace(
+        is_running=False,
+        is_cancelled=False,
+        output_file=output_file,
+        get_result=lambda: SimpleNamespace(
+            success=True,
+            error_message=None,
+            output="working\nall done",
+            token_limit_reached=False,
+        ),
+    )
+    monkeypatch.setattr(stream_routes, "_stream_jobs", {"stream-abc": job})
+
+    status = await dispatch_routes.dispatch_status("stream-abc")
+
+    assert status.status == "succeeded"
+    assert status.done is True
+    assert status.result is not None and status.result.success
+    assert "all done" in status.output_tail
+
+    with pytest.raises(HTTPException) as missing:
+        await dispatch_routes.dispatch_status("stream-missing")
+    assert missing.value.status_code == 404
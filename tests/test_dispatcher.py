@@ -13,6 +13,7 @@ from src.agents.dispatcher import (
     _escape_applescript_text,
     _redact_prompt_preview,
     dispatch_task,
+    spawn_claude_cli,
 )
 
 
@@ -102,3 +103,24 @@ def test_dispatch_task_marks_token_limit_result(monkeypatch, temp_dir) -> None:
     assert result.provider == "claude"
     assert result.output_file is not None
     assert result.output_file.exists()
+
+
+def test_dispatch_task_sends_prompt_to_prestarted_cli(monkeypatch, temp_dir) -> None:
+    project = temp_dir / "project"
+    project.mkdir()
+    fake_cli = temp_dir / "claude"
+    fake_cli.write_text('#!/bin/sh\necho "args: $*"\ncat\n')
+    fake_cli.chmod(0o755)
+
+    monkeypatch.setattr(dispatcher_module, "project_id_for_path", lambda _path: "proj-test")
+    monkeypatch.setattr(dispatcher_module, "project_runtime_dir", lambda _project_id: temp_dir / "runtime")
+
+    proc = spawn_claude_cli(project, cli_path=str(fake_cli), model="claude-haiku-4-5-20251001")
+    result = dispatch_task("Write a commit message\nfor this diff", project, proc=proc)
+
+    assert result.success
+    assert result.output == (
+        "args: --permission-mode acceptEdits --model claude-haiku-4-5-20251001 -p\n"
+        "Write a commit message\nfor this diff"
+    )
+    assert proc.stdin.closed
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import sys
 from pathlib import Path
 
@@ -63,6 +65,27 @@ def test_extract_requested_gate_names_from_prompt() -> None:
     assert parsed == ["lint", "typecheck", "documentation"]
 
 
+def test_extract_requested_gate_names_dedupes_aliases_and_blanks() -> None:
+    """Test that aliases of one gate and empty list entries collapse in first-seen order."""
+    prompt = "Failed gate(s): MyPy, lint, , typecheck, Docs,lint"
+    assert dispatch_routes._extract_requested_gate_names(prompt) == ["typecheck", "lint", "documentation"]
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ("Type-Check", "typecheck"),
+        (" type_check ", "typecheck"),
+        ("MyPy", "typecheck"),
+        ("Docs", "documentation"),
+        ("unit tests", "unittests"),
+    ],
+)
+def test_normalize_gate_name(raw: str, expected: str) -> None:
+    """Test that separators and case are dropped before alias lookup."""
+    assert dispatch_routes._normalize_gate_name(raw) == expected
+
+
 def test_classify_fallback_failure_needs_user_input() -> None:
     """Test detecting when fallback provider needs user confirmation."""
     error = "Please confirm whether you want me to proceed with these edits."
@@ -70,6 +93,13 @@ def test_classify_fallback_failure_needs_user_input() -> None:
     assert code == "needs_user_input"
 
 
+def test_classify_fallback_failure_matches_case_insensitively_in_non_ascii_output() -> None:
+    """Test that phrases are found regardless of case next to non-ASCII text."""
+    output = "Résumé généré ✓\nERROR: Stream Disconnected before completion — réessayez"
+    code = dispatch_routes._classify_fallback_failure("gemini", error=None, output=output)
+    assert code == "network_disconnect"
+
+
 def test_verify_fallback_gates_detects_success_without_fix(monkeypatch, temp_dir) -> None:
     """Test that gate verification detects when gates pass without code changes."""
     monkeypatch.setattr(dispatch_routes, "QualityGateRunner", _FakeGateRunner)
@@ -85,6 +115,31 @@ def test_verify_fallback_gates_detects_success_without_fix(monkeypatch, temp_dir
     assert "documentation=fail" in message
 
 
+def test_verify_fallback_gates_runs_gates_concurrently(monkeypatch, temp_dir) -> None:
+    """Test that target gates run in parallel and keep their order and failure states."""
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class _ConcurrentRunner(_FakeGateRunner):
+        def run_gate(self, gate_name: str, session_id: str | None = None) -> _FakeGateReport:
+            if gate_name == "typecheck":
+                raise RuntimeError("mypy crashed")
+            barrier.wait()  # Only returns once lint and documentation overlap.
+            return super().run_gate(gate_name, session_id=session_id)
+
+    monkeypatch.setattr(dispatch_routes, "QualityGateRunner", _ConcurrentRunner)
+
+    ok, statuses, message = dispatch_routes._verify_fallback_gates(
+        project_path=temp_dir,
+        prompt="Issue: 4 failed gate(s): lint, typecheck, documentation, secrets",
+    )
+
+    assert ok is False
+    assert statuses == {"lint": "pass", "typecheck": "error", "documentation": "fail", "secrets": "missing"}
+    assert message == "Post-run gate verification failed: typecheck=error, documentation=fail, secrets=missing."
+
+
 def test_build_fallback_error_detail_includes_code_and_verification() -> None:
     """Test that error details include both error code and verification results."""
     response = dispatch_routes.DispatchResponse(
@@ -99,3 +154,610 @@ def test_build_fallback_error_detail_includes_code_and_verification() -> None:
     assert "Error code: verification_failed" in detail
     assert "documentation=fail" in detail
     assert "CLI output tail" in detail
+
+
+def test_read_log_file_tail_reads_only_the_end_of_large_logs(temp_dir) -> None:
+    """Test that large logs are tailed correctly and unchanged files hit the cache."""
+    log_file = temp_dir / "dispatch.log"
+    lines = [f'{{"level":"info","message":"step {i}"}}' for i in range(5000)]
+    log_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    assert log_file.stat().st_size > dispatch_routes._LOG_TAIL_READ_BYTES
+
+    tail = dispatch_routes._read_log_file_tail(str(log_file), max_lines=3)
+
+    assert tail == "step 4997\nstep 4998\nstep 4999"
+    cached = dispatch_routes._log_tail_cache[(str(log_file.resolve()), 3, 2400)]
+    assert cached[2] == tail
+
+
+@pytest.mark.parametrize(
+    "line,expected",
+    [
+        ('{"level":"info","message":"Working on task..."}', "Working on task..."),
+        ('{"level":"info","message":"say \\"hi\\""}', 'say "hi"'),
+        ('{"level":"info","message":"caf\\u00e9"}', "café"),
+        ('{"level":"info"}', '{"level":"info"}'),
+        ("plain text", "plain text"),
+    ],
+)
+def test_parse_jsonl_line(line: str, expected: str) -> None:
+    """Test JSONL message extraction on both the fast path and the json fallback."""
+    assert dispatch_routes._parse_jsonl_line(line) == expected
+
+
+def test_evict_finished_jobs_keeps_running_and_newest() -> None:
+    """Test that eviction drops the oldest finished jobs and never running ones."""
+    from collections import OrderedDict
+
+    store = OrderedDict(
+        (job_id, {"done": done})
+        for job_id, done in [("a", True), ("b", False), ("c", True), ("d", True), ("e", False)]
+    )
+    # Completion order differs from creation order: "c" finished before "a".
+    finished = OrderedDict.fromkeys(["c", "a", "d"])
+
+    evicted = dispatch_routes._evict_finished_jobs_locked(store, finished, max_jobs=3)
+
+    assert evicted == [{"done": True}, {"done": True}]
+    assert list(store) == ["b", "d", "e"]
+    assert list(finished) == ["d"]
+
+
+def test_sharded_job_store_returns_copies_and_caps_each_shard() -> None:
+    """Test that the sharded store isolates callers and bounds every shard."""
+    store = dispatch_routes._ShardedJobStore(max_jobs=8, shards=4)
+
+    created = store.add({"job_id": "job-1", "done": False})
+    created["status"] = "mutated"
+    assert store.get("job-1") == {"job_id": "job-1", "done": False}
+    view = store.view("job-1")
+    with pytest.raises(TypeError):
+        view["status"] = "mutated"
+    assert store.update("job-1", done=True)["done"] is True
+    assert view["done"] is True
+    assert store.update("missing", done=True) is None
+
+    for index in range(40):
+        store.add({"job_id": f"job-{index + 2}", "done": True})
+
+    assert len(store.views()) <= 8
+
+
+def _finished_fallback_store() -> dispatch_routes._ShardedJobStore:
+    """A fallback store holding one finished job."""
+    store = dispatch_routes._ShardedJobStore(max_jobs=8)
+    store.add({
+        "job_id": "fb-1",
+        "status": "succeeded",
+        "phase": "complete",
+        "message": "Done",
+        "created_at": "2026-01-01T00:00:00",
+        "started_at": "2026-01-01T00:00:01",
+        "finished_at": "2026-01-01T00:00:02",
+        "done": True,
+        "provider": "codex",
+        "result": dispatch_routes.DispatchResponse(success=True, output="ok", provider="codex").model_dump(),
+        "error_detail": None,
+        "output_tail": "ok",
+        "log_file": None,
+    })
+    return store
+
+
+def _dispatch_client(monkeypatch):
+    """Test client for the dispatch router backed by a finished fallback job."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setattr(dispatch_routes, "_fallback_jobs", _finished_fallback_store())
+    app = FastAPI()
+    app.include_router(dispatch_routes.router, prefix="/api/dispatch")
+    return TestClient(app)
+
+
+def test_fallback_status_serializes_stored_result(monkeypatch) -> None:
+    """Test that the status endpoint returns the stored result without re-validating it."""
+    body = _dispatch_client(monkeypatch).get("/api/dispatch/fallback/status/fb-1").json()
+
+    assert body["done"] is True
+    assert body["result"]["success"] is True
+    assert body["result"]["provider"] == "codex"
+    assert body["result"]["token_limit_reached"] is False
+
+
+def test_get_project_path_uses_cached_registry_index(monkeypatch, tmp_path) -> None:
+    """Test that registry lookups are cached, refreshed on a miss and on file change."""
+    import os
+    from types import SimpleNamespace
+
+    from sidecar.api import project_index, ttl_cache
+
+    config_path = tmp_path / "projects.json"
+    config_path.write_text("{}", encoding="utf-8")
+    projects = [SimpleNamespace(name="alpha", path=tmp_path / "alpha")]
+    loads: list[int] = []
+
+    class _Registry:
+        def __init__(self):
+            self.config_path = config_path
+
+        def load(self):
+            loads.append(1)
+
+        def list_projects(self):
+            return list(projects)
+
+    ttl_cache.invalidate("project_index")
+    monkeypatch.setattr(project_index, "ProjectRegistry", _Registry)
+    monkeypatch.setattr(dispatch_routes, "CORE_AVAILABLE", True)
+
+    assert dispatch_routes._get_project_path("alpha") == tmp_path / "alpha"
+    assert dispatch_routes._get_project_path(str(tmp_path / "alpha")) == tmp_path / "alpha"
+    assert len(loads) == 1
+
+    projects.append(SimpleNamespace(name="beta", path=tmp_path / "beta"))
+    assert dispatch_routes._get_project_path("beta") == tmp_path / "beta"
+    assert len(loads) == 2
+
+    projects.clear()
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert dispatch_routes._get_project_path("alpha") is None
+    ttl_cache.invalidate("project_index")
+
+
+async def test_tail_refresh_loop_caches_live_tails_and_stops_when_idle(monkeypatch, temp_dir) -> None:
+    """Test that the poller stores each running job's tail and exits once jobs finish."""
+    log_file = temp_dir / "running.log"
+    log_file.write_text("first\nsecond\n", encoding="utf-8")
+    dispatch_store = dispatch_routes._ShardedJobStore(max_jobs=64)
+    dispatch_store.add({"job_id": "job-run", "done": False, "log_file": str(log_file)})
+    dispatch_store.add({"job_id": "job-done", "done": True, "log_file": str(log_file)})
+    monkeypatch.setattr(dispatch_routes, "_dispatch_jobs", dispatch_store)
+    monkeypatch.setattr(dispatch_routes, "_fallback_jobs", dispatch_routes._ShardedJobStore(max_jobs=8))
+    monkeypatch.setattr(dispatch_routes, "_TAIL_REFRESH_INTERVAL_SECONDS", 0.01)
+
+    original_refresh = dispatch_routes._refresh_live_tails
+
+    def _finish_after_refresh(running):
+        changed = original_refresh(running)
+        dispatch_store.update("job-run", done=True)
+        return changed
+
+    monkeypatch.setattr(dispatch_routes, "_refresh_live_tails", _finish_after_refresh)
+    waiter = asyncio.Event()
+    monkeypatch.setattr(dispatch_routes, "_status_waiters", {"job-run": {waiter}})
+
+    await dispatch_routes._tail_refresh_loop()
+
+    assert dispatch_store.get("job-run")["live_tail"] == "first\nsecond"
+    assert "live_tail" not in dispatch_store.get("job-done")
+    assert waiter.is_set()
+
+
+def test_fallback_status_events_sends_final_status_and_closes(monkeypatch) -> None:
+    """Test that the status SSE stream matches the polling payload for a finished job."""
+    client = _dispatch_client(monkeypatch)
+
+    with client.stream("GET", "/api/dispatch/fallback/status/fb-1/events") as response:
+        body = b"".join(response.iter_bytes()).decode()
+
+    frames = [frame for frame in body.split("\n\n") if frame]
+    assert len(frames) == 1
+    assert json.loads(frames[0][len("data: "):]) == client.get("/api/dispatch/fallback/status/fb-1").json()
+    assert client.get("/api/dispatch/fallback/status/missing/events").status_code == 404
+
+
+def test_utcnow_iso_matches_datetime_isoformat() -> None:
+    """Test that the timestamp helper parses back to the current UTC time."""
+    from datetime import datetime
+
+    before = datetime.utcnow()
+    parsed = datetime.fromisoformat(dispatch_routes._utcnow_iso())
+
+    assert before <= parsed <= datetime.utcnow()
+
+
+def test_build_status_response_uses_live_tail_while_running() -> None:
+    """Test that running jobs report the poller's tail and a provider message."""
+    job = {
+        "job_id": "fb-2",
+        "status": "running",
+        "phase": "running",
+        "message": "Codex is processing your task...",
+        "created_at": "2026-01-01T00:00:00",
+        "started_at": "2026-01-01T00:00:01",
+        "done": False,
+        "provider": "codex",
+        "result": None,
+        "output_tail": None,
+        "live_tail": "step 1",
+        "log_file": "/tmp/fb-2.log",
+    }
+
+    fallback = dispatch_routes._build_status_response(job, dispatch_routes._fallback_running_message)
+    plain = dispatch_routes._build_status_response(job)
+
+    assert fallback.output_tail == plain.output_tail == "step 1"
+    assert fallback.message == "Codex is running..."
+    assert plain.message == "Codex is processing your task..."
+    assert fallback.result is None
+
+
+def test_incremental_tail_only_processes_appended_output(temp_dir) -> None:
+    """Test that the incremental tail follows appends, partial lines, and truncation."""
+    log_file = temp_dir / "live.log"
+    log_file.write_text('{"level":"info","message":"one"}\n\x1b[32mtwo', encoding="utf-8")
+    tracker = dispatch_routes._IncrementalTail(log_file, max_lines=2)
+
+    assert tracker.refresh() == "one\ntwo"
+    with log_file.open("a", encoding="utf-8") as handle:
+        handle.write(" done\nthree\n")
+    assert tracker.refresh() == "two done\nthree"
+    assert tracker.offset == log_file.stat().st_size
+
+    log_file.write_text("fresh\n", encoding="utf-8")
+    assert tracker.refresh() == "fresh"
+
+
+def test_fallback_status_tail_revalidates_with_etag(monkeypatch) -> None:
+    """Test that the tail endpoint returns plain text and 304 for an unchanged tail."""
+    client = _dispatch_client(monkeypatch)
+
+    first = client.get("/api/dispatch/fallback/status/fb-1/tail")
+    again = client.get(
+        "/api/dispatch/fallback/status/fb-1/tail",
+        headers={"If-None-Match": first.headers["etag"]},
+    )
+
+    assert first.status_code == 200
+    assert first.text == "ok"
+    assert first.headers["content-type"].startswith("text/plain")
+    assert again.status_code == 304
+    assert again.content == b""
+
+
+def test_read_output_lines_windows_and_counts(temp_dir) -> None:
+    """Test that since_line/tail select a window while line_count stays the total."""
+    log_file = temp_dir / "output.log"
+    log_file.write_text("".join(f"line {i}\n" for i in range(10)), encoding="utf-8")
+
+    assert dispatch_routes._read_output_lines(log_file) == ([f"line {i}" for i in range(10)], 10)
+    assert dispatch_routes._read_output_lines(log_file, tail=2) == (["line 8", "line 9"], 10)
+    assert dispatch_routes._read_output_lines(log_file, since_line=7) == (["line 7", "line 8", "line 9"], 10)
+    assert dispatch_routes._read_output_lines(temp_dir / "missing.log") is None
+
+
+def test_read_tail_drops_partial_first_line(temp_dir) -> None:
+    """Test that a bounded tail read starts at a line boundary."""
+    log_file = temp_dir / "summary.log"
+    log_file.write_text("first line\nsecond\nthird\n", encoding="utf-8")
+
+    assert dispatch_routes._read_tail(log_file, max_bytes=10) == "third\n"
+    assert dispatch_routes._read_tail(log_file) == "first line\nsecond\nthird\n"
+    assert dispatch_routes._read_tail(temp_dir / "missing.log") is None
+
+
+def test_job_store_indexes_log_files_by_session_id() -> None:
+    """Test that log-file lookups follow updates and eviction."""
+    store = dispatch_routes._ShardedJobStore(max_jobs=1, shards=1)
+    store.add({"job_id": "job-a", "done": False, "log_file": "/tmp/out/dispatch-a.log"})
+
+    assert store.find_log_file("dispatch-a") == "/tmp/out/dispatch-a.log"
+
+    store.update("job-a", done=True, log_file="/tmp/out/dispatch-a2.log")
+    assert store.find_log_file("dispatch-a") is None
+    assert store.find_log_file("dispatch-a2") == "/tmp/out/dispatch-a2.log"
+
+    store.add({"job_id": "job-b", "done": False, "log_file": "/tmp/out/dispatch-b.log"})
+    assert store.get("job-a") is None
+    assert store.find_log_file("dispatch-a2") is None
+    assert store.find_log_file("dispatch-b") == "/tmp/out/dispatch-b.log"
+
+
+def test_read_task_prompt_context_rereads_changed_files(temp_dir) -> None:
+    """Test that context excerpts are truncated, cached, and refreshed on change."""
+    import os
+
+    claude_md = temp_dir / "CLAUDE.md"
+    claude_md.write_text("a" * 3500, encoding="utf-8")
+
+    first, roadmap = dispatch_routes._read_task_prompt_context(temp_dir)
+    assert first == "a" * 3000 + "..."
+    assert roadmap == ""
+
+    claude_md.write_text("short", encoding="utf-8")
+    stat = claude_md.stat()
+    os.utime(claude_md, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert dispatch_routes._read_task_prompt_context(temp_dir)[0] == "short"
+
+
+def test_usage_stores_are_shared_per_project() -> None:
+    """Test that usage and cost stores are built once per project runtime id."""
+    dispatch_routes._usage_store.cache_clear()
+    dispatch_routes._cost_tracker.cache_clear()
+
+    assert dispatch_routes._usage_store("proj-a") is dispatch_routes._usage_store("proj-a")
+    assert dispatch_routes._usage_store("proj-a") is not dispatch_routes._usage_store("proj-b")
+    assert dispatch_routes._cost_tracker("proj-a") is dispatch_routes._cost_tracker("proj-a")
+
+
+def test_usage_and_log_writes_run_on_writer_thread(monkeypatch, temp_dir) -> None:
+    """Test that queued usage/log writes run off the caller and drain on flush."""
+    import threading
+
+    written: list[tuple[str, str]] = []
+    monkeypatch.setattr(
+        dispatch_routes,
+        "_write_dispatch_event",
+        lambda result, prompt, project_path: written.append(
+            ("log", threading.current_thread().name)
+        ),
+    )
+    monkeypatch.setattr(
+        dispatch_routes,
+        "_write_usage_event",
+        lambda *args: written.append(("usage", threading.current_thread().name)),
+    )
+
+    dispatch_routes._log_dispatch_event(object(), "prompt", temp_dir)
+    dispatch_routes._record_usage_event(temp_dir, "prompt", "claude", "out", "s1", "dispatch")
+    dispatch_routes._flush_persist_queue()
+
+    assert written == [("log", "dispatch-persist"), ("usage", "dispatch-persist")]
+
+
+def test_tail_text_reads_window_and_widens_past_blank_lines() -> None:
+    """Test that _tail_text keeps the last lines of large or blank-padded output."""
+    big = "\n".join(f"line {index}" for index in range(100_000))
+    assert dispatch_routes._tail_text(big, max_lines=3, max_chars=100) == (
+        "line 99997\nline 99998\nline 99999"
+    )
+
+    padded = "first\n" + "\x1b[0m   \n" * 5_000 + "last\n"
+    assert dispatch_routes._tail_text(padded, max_lines=5, max_chars=50) == "first\nlast"
+
+
+def test_read_summary_output_uses_first_existing_candidate(monkeypatch, temp_dir) -> None:
+    """Test that summary log lookup skips missing candidates without building later ones."""
+    constructed = temp_dir / "constructed.log"
+    constructed.write_text("from constructed\n")
+    built: list[str] = []
+
+    def fake_output_path(project_path, session_id):
+        built.append(session_id)
+        return session_id, constructed
+
+    monkeypatch.setattr(dispatch_routes, "get_dispatch_output_path", fake_output_path)
+    direct = temp_dir / "direct.log"
+    direct.write_text("from direct\n")
+
+    assert dispatch_routes._read_summary_output(temp_dir, "sess-1", str(direct)) == "from direct\n"
+    assert built == []
+    assert dispatch_routes._read_summary_output(
+        temp_dir, "sess-1", str(temp_dir / "missing.log")
+    ) == "from constructed\n"
+    assert built == ["sess-1"]
+
+
+def test_collect_file_changes_parses_line_stats() -> None:
+    """Test that "+N -M" line stats are parsed and totalled per changed file."""
+
+    class _FakeGit:
+        def uncommitted_files_with_lines(self):
+            return [
+                {"path": "a.py", "status": "M", "lines": "+12 -3"},
+                {"path": "b.py", "status": "A", "lines": "+5 -0"},
+                {"path": "new.txt", "status": "?", "lines": None},
+            ]
+
+    files, added, removed = dispatch_routes._collect_file_changes(_FakeGit())
+
+    assert [(f.file, f.lines_added, f.lines_removed, f.status) for f in files] == [
+        ("a.py", 12, 3, "M"),
+        ("b.py", 5, 0, "A"),
+        ("new.txt", 0, 0, "?"),
+    ]
+    assert (added, removed) == (17, 3)
+
+
+def test_summary_scans_only_last_lines_for_errors(monkeypatch, temp_dir) -> None:
+    """Test that the summary reports the final line and only flags recent errors."""
+    client = _dispatch_client(monkeypatch)
+    log_file = temp_dir / "dispatch-x.log"
+    log_file.write_text("error: early\n" + "ok\n\n" * 5 + "  All done.  \n", encoding="utf-8")
+
+    response = client.post("/api/dispatch/summary", json={
+        "session_id": "dispatch-x",
+        "project_path": str(temp_dir),
+        "log_file": str(log_file),
+    })
+
+    body = response.json()
+    assert body["summary_message"] == "All done."
+    assert body["has_errors"] is False
+
+    log_file.write_text("ok\nfatal: broke\nAll done.\n", encoding="utf-8")
+    body = client.post("/api/dispatch/summary", json={
+        "session_id": "dispatch-x",
+        "project_path": str(temp_dir),
+        "log_file": str(log_file),
+    }).json()
+    assert body["has_errors"] is True
+
+
+def test_generate_task_prompt_strips_code_fences(monkeypatch, temp_dir) -> None:
+    """Test that a fenced meta-prompt response comes back without fence lines."""
+    from types import SimpleNamespace
+
+    monkeypatch.setattr(dispatch_routes, "CORE_AVAILABLE", True)
+    monkeypatch.setattr(
+        dispatch_routes,
+        "dispatch_claude_task",
+        lambda **_kwargs: SimpleNamespace(
+            success=True,
+            output="```markdown\nAdd the widget.\n\n```python\nx = 1\n```\n",
+            error_message=None,
+        ),
+    )
+    client = _dispatch_client(monkeypatch)
+
+    response = client.post("/api/dispatch/generate-task-prompt", json={
+        "task_text": "**1.2** Add widget",
+        "project_path": str(temp_dir),
+    })
+
+    assert response.json()["prompt"] == "Add the widget.\n\nx = 1"
+    assert response.json()["ai_generated"] is True
+
+
+def test_job_result_payload_bounds_output_backed_by_log_file(monkeypatch, temp_dir) -> None:
+    """Test that stored job results keep only an output tail when a log file exists."""
+    monkeypatch.setattr(dispatch_routes, "_STORED_OUTPUT_CHARS", 20)
+    output = "\n".join(f"line {index}" for index in range(10))
+    response = dispatch_routes.DispatchResponse(success=True, output=output)
+
+    stored = dispatch_routes._job_result_payload(response, temp_dir / "out.log")
+    assert stored["output"] == "line 8\nline 9"
+    assert dispatch_routes._job_result_payload(response, None)["output"] == output
+
+
+def test_project_id_and_output_dir_are_memoized(monkeypatch, temp_dir) -> None:
+    """Test that project IDs and output dirs are computed once per project path."""
+    calls: list[Path] = []
+
+    def fake_project_id(path: Path) -> str:
+        calls.append(path)
+        return "proj-memo"
+
+    monkeypatch.setattr(dispatch_routes, "project_id_for_path", fake_project_id)
+    monkeypatch.setattr(dispatch_routes, "project_runtime_dir", lambda _pid: temp_dir / "runtime")
+    dispatch_routes._project_id.cache_clear()
+    dispatch_routes._dispatch_output_dir.cache_clear()
+    try:
+        project = temp_dir / "project"
+        assert dispatch_routes._project_id(project) == "proj-memo"
+        output_dir = dispatch_routes._dispatch_output_dir(project)
+        assert dispatch_routes._dispatch_output_dir(project) is output_dir
+        assert output_dir == temp_dir / "runtime" / "dispatch-output"
+        assert output_dir.is_dir()
+        assert calls == [project]
+    finally:
+        dispatch_routes._project_id.cache_clear()
+        dispatch_routes._dispatch_output_dir.cache_clear()
+
+
+def test_fallback_running_message_waits_on_silent_cli() -> None:
+    """Test that a fallback with no output for over 30s says it is still waiting."""
+    from datetime import datetime, timedelta
+
+    job = {"log_file": "/tmp/fb.log", "provider": "codex", "message": "Fallback started."}
+    job["started_at"] = (datetime.utcnow() - timedelta(seconds=45)).isoformat()
+    assert dispatch_routes._fallback_running_message(job, None) == "Running... waiting for CLI output."
+
+    job["started_at"] = dispatch_routes._utcnow_iso()
+    assert dispatch_routes._fallback_running_message(job, None) == "Fallback started."
+
+
+def _async_dispatch_store(monkeypatch, temp_dir) -> dispatch_routes._ShardedJobStore:
+    """A dispatch store holding one queued job, with persistence stubbed out."""
+    store = dispatch_routes._ShardedJobStore(max_jobs=8)
+    store.add({
+        "job_id": "disp-async",
+        "status": "queued",
+        "phase": "queued",
+        "message": "Queued",
+        "done": False,
+        "log_file": str(temp_dir / "dispatch-async.log"),
+    })
+    monkeypatch.setattr(dispatch_routes, "_dispatch_jobs", store)
+    monkeypatch.setattr(dispatch_routes, "_log_dispatch_event", lambda *args: None)
+    monkeypatch.setattr(dispatch_routes, "_record_usage_event", lambda **kwargs: None)
+    return store
+
+
+async def test_run_dispatch_job_collects_async_stream(monkeypatch, temp_dir) -> None:
+    """Test that the async Claude job turns stream events into a finished job."""
+    store = _async_dispatch_store(monkeypatch, temp_dir)
+
+    async def fake_stream(prompt, working_dir, output_file=None):
+        yield ("status", "Launching Claude Code CLI...")
+        yield ("output", "working")
+        yield ("output", "done")
+        yield ("complete", "success")
+
+    monkeypatch.setattr(dispatch_routes, "async_dispatch_stream", fake_stream)
+
+    await dispatch_routes._run_dispatch_job("disp-async", "prompt", temp_dir)
+
+    job = store.get("disp-async")
+    assert job["status"] == "succeeded"
+    assert job["done"] is True
+    assert job["result"]["output"] == "working\ndone"
+    assert job["result"]["sessionId"] == "dispatch-async"
+    assert job["output_tail"] == "working\ndone"
+
+
+async def test_cancel_stops_running_dispatch_task(monkeypatch, temp_dir) -> None:
+    """Test that cancelling a dispatch cancels its task and keeps the cancelled status."""
+    import asyncio
+
+    store = _async_dispatch_store(monkeypatch, temp_dir)
+    started = asyncio.Event()
+    closed = asyncio.Event()
+
+    async def hanging_stream(prompt, working_dir, output_file=None):
+        try:
+            started.set()
+            yield ("status", "Claude Code is processing your task...")
+            await asyncio.sleep(60)
+        finally:
+            closed.set()
+
+    monkeypatch.setattr(dispatch_routes, "async_dispatch_stream", hanging_stream)
+    monkeypatch.setattr(dispatch_routes, "_ensure_tail_refresher", lambda: None)
+
+    dispatch_routes._start_background_job(
+        dispatch_routes._run_dispatch_job, job_id="disp-async", prompt="p", project_path=temp_dir
+    )
+    task = dispatch_routes._background_tasks["disp-async"]
+    await started.wait()
+
+    response = await dispatch_routes.dispatch_cancel("disp-async")
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert response.success is True
+    assert closed.is_set()
+    assert store.get("disp-async")["phase"] == "cancelled"
+    assert "disp-async" not in dispatch_routes._background_tasks
+
+
+def test_read_output_lines_tail_matches_text_mode_across_chunks(monkeypatch, temp_dir) -> None:
+    """Test that byte-level tail reads count CR/CRLF lines like text mode."""
+    monkeypatch.setattr(dispatch_routes, "_OUTPUT_READ_CHUNK_BYTES", 3)
+    log_file = temp_dir / "crlf.log"
+    log_file.write_bytes("one\r\ntwo\rcafé\r\n\r\nlast".encode("utf-8"))
+
+    with log_file.open(encoding="utf-8") as handle:
+        text_lines = [line.rstrip("\n") for line in handle]
+
+    assert dispatch_routes._read_output_lines(log_file, tail=3) == (text_lines[-3:], len(text_lines))
+    assert dispatch_routes._read_output_lines(log_file, tail=3) == (["café", "", "last"], 5)
+
+
+@pytest.mark.parametrize(
+    "error,output,expected",
+    [
+        ("Codex CLI not found at 'codex'.", None, "cli_not_found"),
+        ("Cancelled by user", "timed out after 30s", "cancelled"),
+        (None, "Error: Unauthorized", "auth_required"),
+        (None, "Invalid API key provided", "auth_required"),
+        ("Stream disconnected before completion", None, "network_disconnect"),
+        ("Verification failed: lint", None, "verification_failed"),
+        ("exit 1", "something else", "gemini_execution_failed"),
+    ],
+)
+def test_classify_fallback_failure_priorities(error, output, expected) -> None:
+    """Test that the first matching rule in priority order wins."""
+    assert dispatch_routes._classify_fallback_failure("gemini", error=error, output=output) == expected
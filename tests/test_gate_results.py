@@ -1,7 +1,11 @@
 """Tests for gate result storage and failure todo lifecycle."""
 
+import io
+import json
+import os
 from datetime import datetime
 
+from src.core import gate_results
 from src.core.gate_results import (
     GateFinding,
     GateResultStore,
@@ -63,3 +67,72 @@ def test_gate_result_store_persists_and_resolves_failure_todos(temp_dir):
     store.save_report(pass_report)
 
     assert store.open_failure_todos() == []
+
+
+def _status_report(run_id: str, hour: int, status: str) -> GateRunReport:
+    return GateRunReport(
+        run_id=run_id,
+        timestamp=datetime(2026, 2, 12, hour, 0, 0),
+        gates=[StoredGateResult(name="lint", status=status, summary=status)],
+    )
+
+
+def test_status_history_reads_index_newest_first(temp_dir):
+    store = GateResultStore("proj123", base_dir=temp_dir)
+    for hour, status in ((10, "fail"), (11, "warn"), (12, "pass")):
+        store.save_report(_status_report(f"run-{hour}", hour, status))
+
+    # Full reports are not needed once every run is in the index.
+    for path in store.results_dir.glob("2026-*.json"):
+        path.write_text("not json")
+
+    history = store.load_status_history(limit=2)
+    assert history == [
+        {"timestamp": "2026-02-12T12:00:00", "gates": [{"name": "lint", "status": "pass"}]},
+        {"timestamp": "2026-02-12T11:00:00", "gates": [{"name": "lint", "status": "warn"}]},
+    ]
+    assert [run["timestamp"][11:13] for run in store.load_status_history(limit=5)] == ["12", "11", "10"]
+
+
+def test_status_history_falls_back_to_reports_saved_before_the_index(temp_dir):
+    store = GateResultStore("proj123", base_dir=temp_dir)
+    old_path = store.save_report(_status_report("run-10", 10, "fail"))
+    os.utime(old_path, (1_000_000, 1_000_000))
+    store.history_index_file.unlink()
+    store.save_report(_status_report("run-11", 11, "pass"))
+
+    history = store.load_status_history(limit=5)
+    assert [run["gates"][0]["status"] for run in history] == ["pass", "fail"]
+
+
+class _CountingBytesIO(io.BytesIO):
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def test_status_history_reads_only_the_end_of_a_long_index(temp_dir, monkeypatch):
+    monkeypatch.setattr(gate_results, "_HISTORY_READ_CHUNK_BYTES", 256)
+    store = GateResultStore("proj123", base_dir=temp_dir)
+    store.save_report(_status_report("run-10", 10, "fail"))
+    entries = [
+        {"timestamp": f"2026-03-01T00:00:{index % 60:02d}.{index:06d}", "gates": [{"name": "lint", "status": "pass"}]}
+        for index in range(5000)
+    ]
+    with store.history_index_file.open("a", encoding="utf-8") as handle:
+        handle.writelines(json.dumps(entry) + "\n" for entry in entries)
+
+    history = store.load_status_history(limit=20)
+    assert history == entries[::-1][:20]
+
+    data = store.history_index_file.read_bytes()
+    handle = _CountingBytesIO(data)
+    lines = gate_results._read_last_lines(handle, 20)
+    assert [json.loads(line) for line in lines] == entries[-20:]
+    assert handle.bytes_read < 21 * len(lines[0]) + 2 * 256
+    assert len(data) > 100 * handle.bytes_read
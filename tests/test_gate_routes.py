@@ -0,0 +1,173 @@
+"""Tests for the quality gate API routes."""
+
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+SIDE_CAR_ROOT = Path(__file__).resolve().parents[1] / "app" / "python-sidecar"
+if str(SIDE_CAR_ROOT) not in sys.path:
+    sys.path.insert(0, str(SIDE_CAR_ROOT))
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from sidecar.api import ttl_cache  # noqa: E402
+from sidecar.api.routes import gates as gates_routes  # noqa: E402
+from src.agents.gates import GateConfig, GateReport, GateResult  # noqa: E402
+from src.core.gate_results import GateFinding  # noqa: E402
+
+
+def _report() -> GateReport:
+    return GateReport(
+        results=[
+            GateResult(
+                name="lint",
+                status="warn",
+                message="2 issues",
+                details="ruff output",
+                duration_seconds=1.5,
+                findings=[
+                    GateFinding(source_gate="lint", severity="medium", description="unused import", file="a.py", line=3),
+                    GateFinding(source_gate="lint", severity="low", description="long line"),
+                ],
+            ),
+        ],
+        timestamp=datetime(2026, 1, 2, 3, 4, 5),
+        run_id="run-1",
+        trigger="api",
+        changed_files=["a.py"],
+    )
+
+
+class _Runner:
+    def __init__(self, project_path):
+        self.gates = {
+            "lint": GateConfig(name="lint", gate_type="command"),
+            "tests": GateConfig(name="tests", gate_type="command", hard_stop=True),
+        }
+
+    def load_config(self):
+        return self.gates
+
+    def latest_report(self):
+        return _report()
+
+    def run_all_gates(self, **kwargs):
+        return _report()
+
+
+def _gates_client(monkeypatch, temp_dir) -> TestClient:
+    monkeypatch.setattr(gates_routes, "CORE_AVAILABLE", True)
+    monkeypatch.setattr(gates_routes, "QualityGateRunner", _Runner)
+    ttl_cache.invalidate(f"gates:results:{temp_dir}")
+    app = FastAPI()
+    app.include_router(gates_routes.router, prefix="/api/gates")
+    return TestClient(app)
+
+
+def test_get_gate_results_serializes_report_and_pending_gates(monkeypatch, temp_dir) -> None:
+    """Test that reported gates, findings and unreported config gates are all returned."""
+    body = _gates_client(monkeypatch, temp_dir).get(f"/api/gates/{temp_dir}").json()
+    ttl_cache.invalidate(f"gates:results:{temp_dir}")
+
+    assert body["runId"] == "run-1"
+    assert body["timestamp"] == "2026-01-02T03:04:05"
+    assert body["overallStatus"] == "warn"
+    assert body["changedFiles"] == ["a.py"]
+    lint, tests = body["gates"]
+    assert lint["detail"] == "ruff output"
+    assert lint["durationSeconds"] == 1.5
+    assert lint["findings"] == [
+        {"severity": "medium", "description": "unused import", "file": "a.py", "line": 3},
+        {"severity": "low", "description": "long line", "file": None, "line": None},
+    ]
+    assert tests["status"] == "pending"
+    assert tests["message"] == "Not yet run"
+    assert tests["hardStop"] is True
+
+
+def test_run_gates_returns_fresh_report(monkeypatch, temp_dir) -> None:
+    """Test that a gate run is serialized with the same shape as stored results."""
+    body = _gates_client(monkeypatch, temp_dir).post(f"/api/gates/{temp_dir}/run").json()
+
+    assert [gate["name"] for gate in body["gates"]] == ["lint"]
+    assert body["gates"][0]["findings"][0]["description"] == "unused import"
+    assert body["trigger"] == "api"
+
+
+def test_get_gate_results_reuses_payload_until_report_changes(monkeypatch, temp_dir) -> None:
+    """Test that the encoded payload is served until the latest report file changes."""
+    runtime_dir = temp_dir / "runtime"
+    (runtime_dir / "gate-results").mkdir(parents=True)
+    latest = runtime_dir / "gate-results" / "latest.json"
+    latest.write_text("{}", encoding="utf-8")
+    monkeypatch.setattr(gates_routes, "project_runtime_dir_for_path", lambda path: runtime_dir)
+    builds: list[int] = []
+
+    class _CountingRunner(_Runner):
+        def latest_report(self):
+            builds.append(1)
+            return _report()
+
+    client = _gates_client(monkeypatch, temp_dir)
+    monkeypatch.setattr(gates_routes, "QualityGateRunner", _CountingRunner)
+
+    first = client.get(f"/api/gates/{temp_dir}")
+    second = client.get(f"/api/gates/{temp_dir}")
+    assert first.content == second.content
+    assert len(builds) == 1
+
+    latest.write_text('{"run_id": "run-2"}', encoding="utf-8")
+    client.get(f"/api/gates/{temp_dir}")
+    assert len(builds) == 2
+    ttl_cache.invalidate(f"gates:results:{temp_dir}")
+
+
+def test_run_gates_runs_gates_off_the_event_loop(monkeypatch, temp_dir) -> None:
+    """Test that the gate run executes on a worker thread, not the loop thread."""
+    import threading
+
+    threads: list[threading.Thread] = []
+
+    class _ThreadRecordingRunner(_Runner):
+        def run_all_gates(self, **kwargs):
+            threads.append(threading.current_thread())
+            return _report()
+
+    client = _gates_client(monkeypatch, temp_dir)
+    monkeypatch.setattr(gates_routes, "QualityGateRunner", _ThreadRecordingRunner)
+    loop_threads: list[threading.Thread] = []
+
+    @client.app.get("/loop-thread")
+    async def _loop_thread() -> dict:
+        loop_threads.append(threading.current_thread())
+        return {}
+
+    with client:
+        client.get("/loop-thread")
+        assert client.post(f"/api/gates/{temp_dir}/run").status_code == 200
+    assert threads and threads[0] is not loop_threads[0]
+
+
+@pytest.mark.parametrize(
+    "statuses,expected",
+    [
+        (["pass", "skipped"], "pass"),
+        (["pass", "warn"], "warn"),
+        (["pass", "error"], "warn"),
+        (["warn", "fail", "pass"], "fail"),
+        ([], "pass"),
+    ],
+)
+def test_compute_overall_status_matches_report_properties(statuses, expected) -> None:
+    """Test that the one-pass overall status agrees with GateReport's properties."""
+    report = GateReport(results=[GateResult(name=f"g{i}", status=s, message="") for i, s in enumerate(statuses)])
+
+    assert gates_routes._compute_overall_status(report.results) == expected
+    assert expected == ("fail" if report.has_failures else ("pass" if report.all_passed else "warn"))
@@ -0,0 +1,462 @@
+"""Tests for the git API routes."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+SIDE_CAR_ROOT = Path(__file__).resolve().parents[1] / "app" / "python-sidecar"
+if str(SIDE_CAR_ROOT) not in sys.path:
+    sys.path.insert(0, str(SIDE_CAR_ROOT))
+
+from fastapi import HTTPException  # noqa: E402
+
+from sidecar.api.routes import git as git_routes  # noqa: E402
+
+
+@pytest.fixture
+def git_repo(temp_dir):
+    """Create a git repository with one commit."""
+    for args in (
+        ["init"],
+        ["config", "user.email", "test@test.com"],
+        ["config", "user.name", "Test User"],
+    ):
+        subprocess.run(["git", *args], cwd=temp_dir, capture_output=True)
+    (temp_dir / "README.md").write_text("# Test\n")
+    subprocess.run(["git", "add", "README.md"], cwd=temp_dir, capture_output=True)
+    subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=temp_dir, capture_output=True)
+    return temp_dir
+
+
+@pytest.fixture(autouse=True)
+def _empty_git_cache(monkeypatch):
+    from sidecar.api import ttl_cache
+
+    monkeypatch.setattr(git_routes, "_git_cache", git_routes.OrderedDict())
+    monkeypatch.setattr(git_routes, "_status_cache", {})
+    monkeypatch.setattr(git_routes, "_commits_cache", {})
+    ttl_cache.invalidate("git:")
+    yield
+    ttl_cache.invalidate("git:")
+
+
+def test_get_git_reuses_instance_per_repository(git_repo, temp_dir) -> None:
+    """Test that repositories share one GitUtils while plain directories are not cached."""
+    git = git_routes._get_git(git_repo)
+    assert git_routes._get_git(git_repo) is git
+
+    plain = temp_dir / "plain"
+    plain.mkdir()
+    assert git_routes._get_git(plain) is not git_routes._get_git(plain)
+    assert list(git_routes._git_cache) == [git_repo]
+
+
+def test_get_git_evicts_least_recently_used(monkeypatch, temp_dir) -> None:
+    """Test that the cache keeps at most _GIT_CACHE_MAX repositories."""
+    monkeypatch.setattr(git_routes, "_GIT_CACHE_MAX", 2)
+    repos = []
+    for name in ("a", "b", "c"):
+        repo = temp_dir / name
+        (repo / ".git").mkdir(parents=True)
+        repos.append(repo)
+
+    git_routes._get_git(repos[0])
+    git_routes._get_git(repos[1])
+    git_routes._get_git(repos[0])
+    git_routes._get_git(repos[2])
+
+    assert list(git_routes._git_cache) == [repos[0], repos[2]]
+
+
+def test_open_repo_raises_404_for_unknown_project(monkeypatch) -> None:
+    """Test that unknown projects are rejected before touching git."""
+    monkeypatch.setattr(git_routes, "_get_project_path", lambda project_id: None)
+
+    with pytest.raises(HTTPException) as excinfo:
+        git_routes._open_repo("missing")
+
+    assert excinfo.value.status_code == 404
+
+
+def _git_client():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    app = FastAPI()
+    app.include_router(git_routes.router, prefix="/api/git")
+    return TestClient(app)
+
+
+def test_status_and_commits_endpoints_read_repository(git_repo) -> None:
+    """Test that the async status and commits endpoints report the repository state."""
+    from sidecar.api import ttl_cache
+
+    ttl_cache.invalidate("git:")
+    (git_repo / "README.md").write_text("# Changed\n")
+    (git_repo / "new.txt").write_text("new\n")
+    client = _git_client()
+
+    status = client.get(f"/api/git/{git_repo}/status").json()
+    commits = client.get(f"/api/git/{git_repo}/commits", params={"limit": 5}).json()
+    ttl_cache.invalidate("git:")
+
+    assert status["branch"] not in ("", "unknown")
+    assert [entry["file"] for entry in status["uncommitted"]] == ["README.md"]
+    assert [entry["file"] for entry in status["untracked"]] == ["new.txt"]
+    assert [commit["msg"] for commit in commits] == ["Initial commit"]
+
+
+async def test_async_status_bundle_matches_git_utils(git_repo) -> None:
+    """Test that the event-loop status bundle agrees with GitUtils.status_bundle()."""
+    (git_repo / "README.md").write_text("# Changed\nmore\n")
+    (git_repo / "staged.txt").write_text("staged\n")
+    subprocess.run(["git", "add", "staged.txt"], cwd=git_repo, capture_output=True)
+    (git_repo / "new.txt").write_text("new\n")
+    subprocess.run(["git", "stash", "--keep-index"], cwd=git_repo, capture_output=True)
+    (git_repo / "README.md").write_text("# Changed again\n")
+    git = git_routes._get_git(git_repo)
+
+    bundle = await git_routes._status_bundle(git_repo, git)
+    expected = git.status_bundle()
+
+    # Relative stash times ("1 second ago") can tick between the two calls.
+    for result in (bundle, expected):
+        result["stashes"] = [{**stash, "time": ""} for stash in result["stashes"]]
+    assert bundle == expected
+    assert [f["path"] for f in bundle["staged"]] == ["staged.txt"]
+    assert bundle["modified"][0]["lines"] == "+1 -1"
+    assert len(bundle["stashes"]) == 1
+
+
+@pytest.fixture
+def nested_project(git_repo):
+    """A directory without its own .git inside a repository with changes."""
+    project = git_repo / "sub"
+    project.mkdir()
+    (project / "inner.txt").write_text("inner\n")
+    (git_repo / "top.txt").write_text("top\n")
+    return project
+
+
+async def test_async_status_bundle_ignores_an_enclosing_repository(nested_project) -> None:
+    """Test that a project without .git reports no status from its parent repo."""
+    git = git_routes._get_git(nested_project)
+
+    bundle = await git_routes._status_bundle(nested_project, git)
+
+    assert bundle == git.status_bundle()
+    assert bundle["branch"] == "unknown"
+    assert bundle["untracked"] == []
+
+
+def test_commits_ignore_an_enclosing_repository(nested_project) -> None:
+    """Test that a project without .git lists no commits from its parent repo."""
+    with _git_client() as client:
+        assert client.get(f"/api/git/{nested_project}/commits").json() == []
+
+    assert git_routes._commits_cache == {}
+
+
+async def test_run_git_reports_failures_without_raising(temp_dir) -> None:
+    """Test that git errors come back as a non-zero return code."""
+    output, code = await git_routes._run_git(("rev-parse", "HEAD"), temp_dir)
+
+    assert code != 0
+    assert output == ""
+
+
+def test_extract_commit_message_finds_subject_and_body() -> None:
+    """Test that the subject is unquoted and the body stops at a fence."""
+    raw = (
+        "Here is the message:\n\n```\n"
+        '"feat(api): add status bundle"\n\n'
+        "  Moves the status calls into one helper.  \n\n"
+        "```\nLet me know if you want changes."
+    )
+
+    assert git_routes._extract_commit_message(raw) == (
+        "feat(api): add status bundle\n\nMoves the status calls into one helper."
+    )
+    assert git_routes._extract_commit_message("perf!: cache lookups\r\n") == "perf!: cache lookups"
+    assert git_routes._extract_commit_message("No conventional subject: here") is None
+    assert git_routes._extract_commit_message('"fix: unbalanced quote') is None
+
+
+def test_generate_commit_message_scope_and_description() -> None:
+    """Test that the heuristic message picks a scope and summarizes the change kinds."""
+    files = [
+        {"path": "src/api/routes.py", "status": "M"},
+        {"path": "src/api/models.py", "status": "M"},
+        {"path": "src/ui/view.py", "status": "A"},
+        {"path": "setup.py", "status": "D"},
+    ]
+
+    assert git_routes._generate_commit_message(files) == (
+        "chore(api): update 4 .py files",
+        "1 added, 2 modified, 1 deleted",
+    )
+    assert git_routes._generate_commit_message(
+        [{"file": "lib/a.py", "status": "?"}, {"file": "lib/b.py", "status": "?"}]
+    ) == ("feat(lib): add a.py, b.py", "2 added")
+    assert git_routes._generate_commit_message([]) == ("chore: empty commit", "No files changed")
+
+
+def test_routes_resolve_projects_through_the_registry_index(monkeypatch, git_repo) -> None:
+    """Test that the repo dependency looks names up in the cached project index."""
+    from sidecar.api import ttl_cache
+
+    lookups = []
+    monkeypatch.setattr(
+        git_routes,
+        "find_project_path",
+        lambda project_id: lookups.append(project_id) or (git_repo if project_id == "demo" else None),
+    )
+    ttl_cache.invalidate("git:")
+    client = _git_client()
+
+    assert client.get("/api/git/demo/stashes").json() == []
+    assert client.get("/api/git/unknown/stashes").status_code == 404
+    assert lookups == ["demo", "unknown"]
+
+
+def test_model_display_name_labels_and_fallback() -> None:
+    """Test that known models use their label and others are title-cased once."""
+    git_routes._model_display_name.cache_clear()
+
+    assert git_routes._model_display_name("claude-haiku-4-5-20251001") == "Claude Haiku 4.5"
+    assert git_routes._model_display_name("custom-model") == "Custom Model"
+    assert git_routes._model_display_name("custom-model") == "Custom Model"
+    assert git_routes._model_display_name.cache_info().hits == 1
+
+
+class _IdleCli:
+    """Popen stand-in for a spare CLI waiting on stdin."""
+
+    def __init__(self):
+        self.returncode = None
+
+    def poll(self):
+        return self.returncode
+
+    def kill(self):
+        self.returncode = -9
+
+    def wait(self):
+        return self.returncode
+
+
+def test_cli_prewarm_hands_out_matching_spare_once(monkeypatch, temp_dir) -> None:
+    """Test that a spare CLI serves one request for its project and model only."""
+    from sidecar.api import cli_prewarm
+
+    started = []
+    monkeypatch.setattr(
+        cli_prewarm, "spawn_claude_cli", lambda working_dir, model=None: started.append(_IdleCli()) or started[-1]
+    )
+    monkeypatch.setattr(cli_prewarm, "_spare", None)
+    monkeypatch.setattr(cli_prewarm, "_MAX_IDLE_SECONDS", 60)
+
+    cli_prewarm.prewarm(temp_dir, "haiku")
+    assert cli_prewarm.take(temp_dir, "sonnet") is None
+    assert cli_prewarm.take(temp_dir, "haiku") is started[0]
+    assert cli_prewarm.take(temp_dir, "haiku") is None
+
+    cli_prewarm.prewarm(temp_dir, "haiku")
+    cli_prewarm.prewarm(temp_dir, "sonnet")
+    assert started[1].returncode == -9
+    assert cli_prewarm.start_or_take(temp_dir, "haiku") is started[3]
+
+    cli_prewarm.discard()
+    assert started[2].returncode == -9
+
+
+def test_ai_message_starts_and_reaps_clis_off_the_event_loop(monkeypatch, git_repo) -> None:
+    """Test that CLI start-up runs in a worker thread and a failed run's CLI is reaped."""
+    import threading
+
+    from sidecar.api import cli_prewarm
+
+    loop_threads = []
+    spawn_threads = []
+    reaped = []
+    cli = _IdleCli()
+    cli.wait = lambda: reaped.append(cli.returncode)
+
+    def start_or_take(working_dir, model):
+        spawn_threads.append(threading.get_ident())
+        return cli
+
+    def failing_dispatch(**kwargs):
+        raise RuntimeError("boom")
+
+    async def status_bundle(project_path, git):
+        loop_threads.append(threading.get_ident())
+        return {key: [] for key in ("unpushed", "staged", "modified", "untracked", "stashes", "submodule_issues")} | {
+            "branch": "main"
+        }
+
+    monkeypatch.setattr(cli_prewarm, "start_or_take", start_or_take)
+    monkeypatch.setattr(git_routes, "dispatch_task", failing_dispatch)
+    monkeypatch.setattr(git_routes, "_status_bundle", status_bundle)
+    (git_repo / "README.md").write_text("# Changed\n")
+
+    with _git_client() as client:
+        client.get(f"/api/git/{git_repo}/status")
+        body = client.get(f"/api/git/{git_repo}/generate-message-ai").json()
+
+    assert body["ai_generated"] is False
+    assert body["error"] == "boom"
+    assert spawn_threads[0] != loop_threads[0]
+    assert reaped == [-9]
+
+
+def test_get_project_path_caches_hits_and_misses(monkeypatch, git_repo) -> None:
+    """Test that repeated lookups, including unknown IDs, skip the registry."""
+    lookups = []
+    monkeypatch.setattr(git_routes, "CORE_AVAILABLE", True)
+    monkeypatch.setattr(git_routes, "find_project_path", lambda project_id: lookups.append(project_id))
+
+    for _ in range(3):
+        assert git_routes._get_project_path("missing") is None
+        assert git_routes._get_project_path(str(git_repo)) == git_repo
+
+    assert lookups == ["missing"]
+
+
+def test_status_poll_reuses_encoded_payload(git_repo) -> None:
+    """Test that the status route caches encoded JSON bytes and serves them as-is."""
+    client = _git_client()
+    first = client.get(f"/api/git/{git_repo}/status")
+    _expires_at, cached = git_routes._status_cache[git_repo]
+    second = client.get(f"/api/git/{git_repo}/status")
+
+    assert first.headers["content-type"] == "application/json"
+    assert isinstance(cached, bytes)
+    assert first.content == second.content == cached
+    assert first.json()["uncommitted"] == []
+
+
+def test_infer_commit_type_keeps_keyword_priority() -> None:
+    """Test that path keywords pick test over docs over fix regardless of order."""
+    infer = git_routes._infer_commit_type
+
+    assert infer(["README.md", "src/Spec/x.py"], [], ["README.md", "src/Spec/x.py"], []) == "test"
+    assert infer(["bugfix.py", "Docs/intro.txt"], [], ["bugfix.py", "Docs/intro.txt"], []) == "docs"
+    assert infer(["src/BugTracker.py"], [], ["src/BugTracker.py"], []) == "fix"
+    assert infer(["src/app.py"], ["src/app.py"], [], []) == "feat"
+
+
+def test_response_cache_expires_and_prunes(monkeypatch) -> None:
+    """Test that cached bodies expire and stale entries are dropped as the cache grows."""
+    clock = [100.0]
+    monkeypatch.setattr(git_routes.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(git_routes, "_RESPONSE_CACHE_PRUNE_SIZE", 2)
+    cache: dict = {}
+
+    git_routes._store_body(cache, "a", b"1", ttl=3)
+    git_routes._store_body(cache, "b", b"2", ttl=10)
+    assert git_routes._cached_body(cache, "a") == b"1"
+
+    clock[0] = 104.0
+    assert git_routes._cached_body(cache, "a") is None
+    git_routes._store_body(cache, "c", b"3", ttl=3)
+    assert sorted(cache) == ["b", "c"]
+
+
+def test_repo_lookup_and_git_actions_run_off_the_event_loop(monkeypatch, git_repo) -> None:
+    """Test that project resolution and blocking git actions use worker threads."""
+    import threading
+
+    threads = {}
+    resolve = git_routes._get_project_path
+    stage_all = git_routes.GitUtils.stage_all
+
+    async def status_bundle(project_path, git):
+        threads["loop"] = threading.get_ident()
+        return {key: [] for key in ("unpushed", "staged", "modified", "untracked", "stashes", "submodule_issues")} | {
+            "branch": "main"
+        }
+
+    def record(name, func):
+        def wrapper(*args, **kwargs):
+            threads.setdefault(name, threading.get_ident())
+            return func(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(git_routes, "_status_bundle", status_bundle)
+    monkeypatch.setattr(git_routes, "_get_project_path", record("resolve", resolve))
+    monkeypatch.setattr(git_routes.GitUtils, "stage_all", record("stage_all", stage_all))
+
+    with _git_client() as client:
+        assert client.get(f"/api/git/{git_repo}/status").json()["branch"] == "main"
+        assert client.post(f"/api/git/{git_repo}/stage-all").json()["success"]
+
+    assert threads["resolve"] != threads["loop"]
+    assert threads["stage_all"] != threads["loop"]
+
+
+def test_commits_stream_in_batches_as_one_json_array(monkeypatch, git_repo, temp_dir) -> None:
+    """Test that /commits streams a JSON array matching recent_commits() and caches it."""
+    monkeypatch.setattr(git_routes, "_COMMITS_STREAM_BATCH", 2)
+    for index in range(4):
+        (git_repo / f"f{index}.txt").write_text(f"{index}\n")
+        subprocess.run(["git", "add", "."], cwd=git_repo, capture_output=True)
+        subprocess.run(["git", "commit", "-m", f"Change {index}"], cwd=git_repo, capture_output=True)
+    empty = temp_dir / "empty"
+    empty.mkdir()
+    subprocess.run(["git", "init"], cwd=empty, capture_output=True)
+    client = _git_client()
+
+    response = client.get(f"/api/git/{git_repo}/commits", params={"limit": 4})
+
+    expected = git_routes._get_git(git_repo).recent_commits(limit=4)
+    assert response.headers["content-type"] == "application/json"
+    assert [(c["hash"], c["msg"], c["branch"]) for c in response.json()] == [
+        (c["hash"][:7], c["message"], c["branch"]) for c in expected
+    ]
+    assert git_routes._commits_cache[(git_repo, 4)][1] == response.content
+    assert client.get(f"/api/git/{git_repo}/commits", params={"limit": 4}).content == response.content
+    assert client.get(f"/api/git/{empty}/commits").json() == []
+
+
+def test_build_commit_prompt_lists_first_files_and_fences_diff() -> None:
+    """Test that the prompt keeps the rules, caps the file list and fences the diff."""
+    files = [f"src/f{index}.py" for index in range(25)]
+
+    prompt = git_routes._build_commit_prompt(files, "+added line")
+
+    assert prompt.startswith("Look at the git diff below and write ONE conventional commit message.\n\nRules:\n")
+    assert "Changed files:\n- src/f0.py\n" in prompt
+    assert "- src/f19.py\n\nGit diff:\n```\n+added line\n```" in prompt
+    assert prompt.endswith("```")
+    assert "src/f20.py" not in prompt
+
+
+async def test_large_status_output_is_parsed_off_the_loop(monkeypatch, git_repo) -> None:
+    """Test that only status output past the size threshold is parsed in a worker thread."""
+    import threading
+
+    parsed_on = []
+    parse = git_routes.parse_status_v2
+
+    def record(output):
+        parsed_on.append(threading.get_ident())
+        return parse(output)
+
+    monkeypatch.setattr(git_routes, "parse_status_v2", record)
+    git = git_routes._get_git(git_repo)
+    (git_repo / "new.txt").write_text("new\n")
+
+    small = await git_routes._status_bundle(git_repo, git)
+    monkeypatch.setattr(git_routes, "_STATUS_PARSE_OFFLOAD_CHARS", 1)
+    large = await git_routes._status_bundle(git_repo, git)
+
+    assert small == large
+    assert parsed_on[0] == threading.get_ident()
+    assert parsed_on[1] != threading.get_ident()
@@ -4,7 +4,7 @@ import pytest
 from pathlib import Path
 import subprocess
 
-from src.core.git_utils import GitRepo, GitCommit, GitStatus
+from src.core.git_utils import GitRepo, GitCommit, GitStatus, GitUtils
 
 
 class TestGitRepo:
@@ -97,6 +97,30 @@ class TestGitRepo:
         assert commits[0].message == "Initial commit"
         assert commits[0].author == "Test User"
 
+    def test_get_files_changed_in_commits_matches_per_commit(self, git_repo):
+        """Test that the batched lookup agrees with one diff-tree per commit."""
+        cwd = git_repo.path
+        (cwd / "a.txt").write_text("a\n")
+        (cwd / "b.txt").write_text("b\n")
+        _git(cwd, "add", ".")
+        _git(cwd, "commit", "-m", "Add a and b")
+        _git(cwd, "checkout", "-b", "side")
+        (cwd / "side.txt").write_text("side\n")
+        _git(cwd, "add", ".")
+        _git(cwd, "commit", "-m", "Side change")
+        _git(cwd, "checkout", "-")
+        (cwd / "a.txt").write_text("a2\n")
+        _git(cwd, "commit", "-am", "Change a")
+        _git(cwd, "merge", "--no-ff", "-m", "Merge side", "side")
+        shas = [c.sha for c in git_repo.get_recent_commits(10)]
+
+        changed = git_repo.get_files_changed_in_commits(shas)
+
+        assert len(shas) == 5
+        assert changed == {sha: git_repo.get_files_changed_in_commit(sha) for sha in shas}
+        assert sorted(changed[shas[-2]]) == ["a.txt", "b.txt"]
+        assert git_repo.get_files_changed_in_commits([]) == {}
+
     def test_has_gitignore(self, git_repo):
         """Test gitignore detection."""
         assert git_repo.has_gitignore() is False
@@ -181,3 +205,103 @@ class TestGitStatus:
         )
 
         assert status.total_changed_files == 3
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=cwd, capture_output=True, check=True)
+
+
+def _without_time(entries: list[dict]) -> list[dict]:
+    return [{k: v for k, v in entry.items() if k != "time"} for entry in entries]
+
+
+class TestGitUtilsStatusBundle:
+    """Tests for the single-call status bundle."""
+
+    @pytest.fixture
+    def busy_repo(self, temp_dir):
+        """A clone with an unpushed commit, a stash and files in every state."""
+        origin = temp_dir / "origin.git"
+        work = temp_dir / "work"
+        _git(temp_dir, "init", "--bare", str(origin))
+        _git(temp_dir, "clone", str(origin), str(work))
+        _git(work, "config", "user.email", "test@test.com")
+        _git(work, "config", "user.name", "Test User")
+        for name in ("a.txt", "b.txt", "c.txt", "old.txt"):
+            (work / name).write_text(f"{name}\n")
+        _git(work, "add", ".")
+        _git(work, "commit", "-m", "Initial commit")
+        _git(work, "push", "-u", "origin", "HEAD")
+
+        (work / "a.txt").write_text("stashed\n")
+        _git(work, "stash")
+        (work / "d.txt").write_text("d\n")
+        _git(work, "add", "d.txt")
+        _git(work, "commit", "-m", "Local only")
+
+        (work / "a.txt").write_text("a\nstaged\n")
+        _git(work, "add", "a.txt")
+        (work / "b.txt").write_text("b\nmodified\nagain\n")
+        (work / "c.txt").write_text("c\nstaged\n")
+        _git(work, "add", "c.txt")
+        (work / "c.txt").write_text("c\nstaged\nand modified\n")
+        _git(work, "mv", "old.txt", "new.txt")
+        (work / "untracked.txt").write_text("new\n")
+        return GitUtils(work)
+
+    def test_status_bundle_matches_individual_calls(self, busy_repo):
+        """Test that the bundle reports what the separate status calls do."""
+        bundle = busy_repo.status_bundle()
+        detailed = busy_repo.get_status_detailed()
+
+        assert bundle["branch"] == busy_repo.current_branch()
+        assert [c["message"] for c in bundle["unpushed"]] == ["Local only"]
+        # Relative times ("1 second ago") can tick between calls.
+        assert _without_time(bundle["unpushed"]) == _without_time(busy_repo.unpushed_commits())
+        assert _without_time(bundle["stashes"]) == _without_time(busy_repo.list_stashes())
+        assert len(bundle["stashes"]) == 1
+        assert bundle["modified"] == detailed["modified"]
+        assert bundle["untracked"] == detailed["untracked"] == ["untracked.txt"]
+        assert bundle["submodule_issues"] == []
+        # Renames report the new path instead of "old -> new".
+        assert [f["path"] for f in bundle["staged"]] == ["a.txt", "c.txt", "new.txt"]
+        assert {f["path"]: f["lines"] for f in bundle["staged"]}["a.txt"] == "+2 -1"
+
+    def test_get_diff_bounded_is_a_prefix_of_get_diff(self, busy_repo):
+        """Test that the bounded diff matches get_diff() cut at the limit."""
+        full = busy_repo.get_diff()
+        staged_len = len(busy_repo._repo._run_git("diff", "--cached")[0])
+
+        assert busy_repo.get_diff_bounded(len(full)) == (full, False)
+        assert busy_repo.get_diff_bounded(len(full) + 100) == (full, False)
+        for limit in (0, 10, staged_len, staged_len + 25, len(full) - 1):
+            assert busy_repo.get_diff_bounded(limit) == (full[:limit], True)
+
+    def test_status_bundle_skips_log_and_numstat_calls_when_clean(self, busy_repo, monkeypatch):
+        """Test that only status and the stash listing run for a repo with nothing to list."""
+        _git(busy_repo.path, "add", "-A")
+        _git(busy_repo.path, "commit", "-m", "Everything")
+        _git(busy_repo.path, "push", "origin", "HEAD")
+        _git(busy_repo.path, "stash", "drop")
+        calls = []
+        run_git = busy_repo._repo._run_git
+        monkeypatch.setattr(busy_repo._repo, "_run_git", lambda *args: calls.append(args[0]) or run_git(*args))
+
+        bundle = busy_repo.status_bundle()
+
+        assert calls == ["status", "stash"]
+        assert bundle["unpushed"] == bundle["stashes"] == bundle["staged"] == []
+
+    def test_status_bundle_lists_stashes_without_stash_header(self, busy_repo, monkeypatch):
+        """Test that stashes are still listed when git prints no ``# stash`` header."""
+        run_git = busy_repo._repo._run_git
+
+        def run_git_without_stash_header(*args):
+            output, code = run_git(*args)
+            if args[0] == "status":
+                output = "\0".join(r for r in output.split("\0") if not r.startswith("# stash "))
+            return output, code
+
+        monkeypatch.setattr(busy_repo._repo, "_run_git", run_git_without_stash_header)
+
+        assert len(busy_repo.status_bundle()["stashes"]) == 1